@@ -0,0 +1,167 @@
+import collections
+import collections.abc
+import itertools
+import random
+import src.atm
+import time
+
+
+FLAGS = ('right_pin', 'enough_cash', 'above_daily_limit', 'card_expired')
+RULES = (
+    ('CARD_EXPIRED', lambda flags: flags['card_expired']),
+    ('ABOVE_DAILY_LIMIT', lambda flags: flags['above_daily_limit']),
+    ('WRONG_PIN', lambda flags: not flags['right_pin']),
+    ('NOT_ENOUGH_CASH', lambda flags: not flags['enough_cash']),
+)
+CASH = 'CASH'
+DENIED = 'DENIED'
+
+
+def decide(flags, rules):
+    for reason, rule in rules:
+        if rule(flags):
+            return reason
+    return CASH
+
+
+def compile_policy(flags=FLAGS, rules=RULES):
+    return tuple(
+        decide(
+            {
+                name: bool(mask >> index & 1)
+                for index, name in enumerate(flags)
+            },
+            rules,
+        )
+        for mask in range(1 << len(flags))
+    )
+
+
+REASONS = compile_policy()
+OUTCOMES = tuple(
+    CASH if reason == CASH else DENIED for reason in REASONS
+)
+
+
+def pack(
+        right_pin, enough_cash,
+        above_daily_limit=False, card_expired=False,
+    ):
+    return (
+        bool(right_pin)
+      | bool(enough_cash) << 1
+      | bool(above_daily_limit) << 2
+      | bool(card_expired) << 3
+    )
+
+
+def reason(
+        right_pin, enough_cash,
+        above_daily_limit=False, card_expired=False,
+    ):
+    return REASONS[
+        pack(right_pin, enough_cash, above_daily_limit, card_expired)
+    ]
+
+
+def withdraw(
+        right_pin, enough_cash,
+        above_daily_limit=False, card_expired=False,
+    ):
+    return OUTCOMES[
+        pack(right_pin, enough_cash, above_daily_limit, card_expired)
+    ]
+
+
+class Index(dict):
+
+    def __missing__(self, values):
+        flags = tuple(map(bool, values))
+        if flags == values:
+            raise KeyError(values)
+        return self[flags]
+
+
+def index(table):
+    size = (len(table)-1).bit_length()
+    return Index({
+        values: table[
+            sum(value << position for position, value in enumerate(values))
+        ]
+        for values in itertools.product((False, True), repeat=size)
+    })
+
+
+def decide_many(table, *columns):
+    size = (len(table)-1).bit_length()
+    if len(columns) > size:
+        raise ValueError(f'expected at most {size} columns')
+    if len({
+        len(column) for column in columns
+        if isinstance(column, collections.abc.Sized)
+    }) > 1:
+        raise ValueError('every column needs one value per transaction')
+    columns = columns + (itertools.repeat(False),) * (size-len(columns))
+    return map(index(table).__getitem__, zip(*columns))
+
+
+def withdraw_many(
+        right_pin, enough_cash,
+        above_daily_limit=None, card_expired=None,
+    ):
+    return list(
+        decide_many(
+            OUTCOMES,
+            right_pin,
+            enough_cash,
+            (
+                itertools.repeat(False) if above_daily_limit is None
+                else above_daily_limit
+            ),
+            (
+                itertools.repeat(False) if card_expired is None
+                else card_expired
+            ),
+        )
+    )
+
+
+def denials(table, *columns):
+    counts = collections.Counter(decide_many(table, *columns))
+    del counts[CASH]
+    return counts
+
+
+def benchmark(transactions=1_000_000, seed=0):
+    generator = random.Random(seed)
+    columns = [
+        [generator.random() < 0.9 for _ in range(transactions)]
+        for _ in FLAGS[:2]
+    ] + [
+        [generator.random() < 0.05 for _ in range(transactions)]
+        for _ in FLAGS[2:]
+    ]
+
+    start = time.perf_counter()
+    branches = list(map(src.atm.withdraw, *columns))
+    branches_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = withdraw_many(*columns)
+    table_duration = time.perf_counter() - start
+
+    if branches != table:
+        raise RuntimeError('decision table does not match src.atm.withdraw')
+    return (
+        transactions, branches_duration, table_duration,
+        denials(REASONS, *columns),
+    )
+
+
+if __name__ == '__main__':
+    transactions, branches, table, counts = benchmark()
+    print(f'{transactions:,} transactions')
+    print(f'branches: {transactions/branches:,.0f}/s')
+    print(f'table:    {transactions/table:,.0f}/s')
+    for reason, count in counts.most_common():
+        print(f'{reason}: {count:,}')
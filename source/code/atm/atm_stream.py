@@ -0,0 +1,107 @@
+import collections
+import math
+import random
+import src.atm
+import time
+
+
+DAY = 24 * 60 * 60
+
+
+class TransactionStream:
+
+    def __init__(
+            self, cash, daily_limit,
+            window=DAY, policy=src.atm.withdraw,
+        ):
+        self.cash = cash
+        self.daily_limit = daily_limit
+        self.window = window
+        self.policy = policy
+        self.spent = {}
+        self.withdrawals = {}
+        self.sweep_at = -math.inf
+
+    def expire_card(self, card, cutoff):
+        withdrawals = self.withdrawals[card]
+        spent = self.spent[card]
+        while withdrawals and withdrawals[0][0] <= cutoff:
+            spent -= withdrawals.popleft()[1]
+        if withdrawals:
+            self.spent[card] = spent
+            return withdrawals
+        del self.withdrawals[card]
+        del self.spent[card]
+
+    def expire(self, now):
+        if now < self.sweep_at:
+            return
+        cutoff = now - self.window
+        for card, withdrawals in list(self.withdrawals.items()):
+            if withdrawals[0][0] <= cutoff:
+                self.expire_card(card, cutoff)
+        self.sweep_at = now + self.window
+
+    def process(
+            self, timestamp, card, amount,
+            right_pin=True, card_expired=False,
+        ):
+        self.expire(timestamp)
+        withdrawals = self.withdrawals.get(card)
+        if withdrawals and withdrawals[0][0] <= timestamp - self.window:
+            withdrawals = self.expire_card(card, timestamp - self.window)
+        spent = self.spent.get(card, 0)
+        decision = self.policy(
+            right_pin=right_pin,
+            enough_cash=amount <= self.cash,
+            above_daily_limit=spent + amount > self.daily_limit,
+            card_expired=card_expired,
+        )
+        if decision == 'CASH':
+            self.cash -= amount
+            self.spent[card] = spent + amount
+            if withdrawals is None:
+                withdrawals = self.withdrawals[card] = collections.deque()
+            withdrawals.append((timestamp, amount))
+        return decision
+
+    def run(self, events):
+        for event in events:
+            yield event[1], event[2], self.process(*event)
+
+
+def events(number, cards=10_000, seed=0):
+    generator = random.Random(seed)
+    timestamp = 0
+    for _ in range(number):
+        timestamp += generator.randrange(2)
+        yield (
+            timestamp,
+            generator.randrange(cards),
+            generator.choice((20, 40, 60, 100, 200)),
+            generator.random() < 0.95,
+            generator.random() < 0.01,
+        )
+
+
+def benchmark(number=1_000_000, cards=10_000):
+    stream = TransactionStream(cash=10**12, daily_limit=500)
+    transactions = list(events(number, cards))
+    start = time.perf_counter()
+    decisions = collections.Counter(
+        decision for _, _, decision in stream.run(transactions)
+    )
+    duration = time.perf_counter() - start
+    return (
+        number, duration,
+        len(stream.spent), sum(map(len, stream.withdrawals.values())),
+        decisions,
+    )
+
+
+if __name__ == '__main__':
+    number, duration, active, window, decisions = benchmark()
+    print(f'{number:,} events in {duration:.2f}s ({number/duration:,.0f}/s)')
+    print(f'{active:,} active cards, {window:,} withdrawals in the window')
+    for decision, count in decisions.most_common():
+        print(f'{decision}: {count:,}')
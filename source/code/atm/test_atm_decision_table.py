@@ -0,0 +1,164 @@
+import array
+import collections
+import itertools
+import src.atm
+import src.atm_decision_table
+import unittest
+
+
+class TestATMDecisionTable(unittest.TestCase):
+
+    def test_withdraw_matches_atm(self):
+        for values in itertools.product((True, False), repeat=4):
+            with self.subTest(values=values):
+                self.assertEqual(
+                    src.atm_decision_table.withdraw(*values),
+                    src.atm.withdraw(*values)
+                )
+
+    def test_withdraw_w_truthy_values(self):
+        for values in (
+            (2, True),
+            (None, True),
+            (1, 'yes'),
+            (1, 1, 0, []),
+            ('', 1),
+            (1, 1, 'no'),
+        ):
+            with self.subTest(values=values):
+                self.assertEqual(
+                    src.atm_decision_table.withdraw(*values),
+                    src.atm.withdraw(*values)
+                )
+
+    def test_reason(self):
+        for values, my_expectation in (
+            ((True, True, False, False), 'CASH'),
+            ((True, True, True, True), 'CARD_EXPIRED'),
+            ((False, False, True, False), 'ABOVE_DAILY_LIMIT'),
+            ((False, False, False, False), 'WRONG_PIN'),
+            ((True, False), 'NOT_ENOUGH_CASH'),
+        ):
+            with self.subTest(values=values):
+                self.assertEqual(
+                    src.atm_decision_table.reason(*values),
+                    my_expectation
+                )
+
+    def test_withdraw_many(self):
+        columns = list(zip(*itertools.product((True, False), repeat=4)))
+        self.assertEqual(
+            src.atm_decision_table.withdraw_many(*columns),
+            list(itertools.starmap(src.atm.withdraw, zip(*columns)))
+        )
+        self.assertEqual(
+            src.atm_decision_table.withdraw_many(
+                [True, True, False], [True, False, True]
+            ),
+            ['CASH', 'DENIED', 'DENIED']
+        )
+        self.assertEqual(
+            src.atm_decision_table.withdraw_many(
+                [True, True], [True, True], card_expired=[False, True]
+            ),
+            ['CASH', 'DENIED']
+        )
+
+    def test_withdraw_many_w_truthy_values(self):
+        self.assertEqual(
+            src.atm_decision_table.withdraw_many(
+                array.array('b', [2, 0, 1, 1]), ['yes', 1, '', 1],
+                above_daily_limit=array.array('b', [0, 0, 0, 5]),
+            ),
+            ['CASH', 'DENIED', 'DENIED', 'DENIED']
+        )
+        self.assertEqual(
+            list(
+                src.atm_decision_table.decide_many(
+                    src.atm_decision_table.REASONS,
+                    (2, 1, 1), ('yes', None, 1), (0, 0, 'limit'),
+                )
+            ),
+            ['CASH', 'NOT_ENOUGH_CASH', 'ABOVE_DAILY_LIMIT']
+        )
+
+    def test_withdraw_many_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            src.atm_decision_table.withdraw_many(
+                [True, True, True], [True]
+            )
+        with self.assertRaises(ValueError):
+            src.atm_decision_table.withdraw_many(
+                [True], [True], card_expired=[False, False]
+            )
+        with self.assertRaises(ValueError):
+            src.atm_decision_table.decide_many(
+                src.atm_decision_table.OUTCOMES,
+                [True], [True], [False], [False], [False],
+            )
+
+    def test_index_raises_key_error_for_wrong_width(self):
+        table = src.atm_decision_table.index(
+            src.atm_decision_table.OUTCOMES
+        )
+        with self.assertRaises(KeyError):
+            table[(1, 1, 0, 0, 0)]
+        with self.assertRaises(KeyError):
+            table[(1, 1)]
+
+    def test_denials(self):
+        self.assertEqual(
+            src.atm_decision_table.denials(
+                src.atm_decision_table.REASONS,
+                [True, False, True, True, True],
+                [True, True, False, True, False],
+                [False, False, False, True, False],
+                [False, False, False, False, True],
+            ),
+            collections.Counter(
+                WRONG_PIN=1,
+                NOT_ENOUGH_CASH=1,
+                ABOVE_DAILY_LIMIT=1,
+                CARD_EXPIRED=1,
+            )
+        )
+
+    def test_compile_policy_w_new_rule(self):
+        flags = src.atm_decision_table.FLAGS + ('card_blocked',)
+        rules = (
+            ('CARD_BLOCKED', lambda flags: flags['card_blocked']),
+        ) + src.atm_decision_table.RULES
+        table = src.atm_decision_table.compile_policy(flags, rules)
+        self.assertEqual(len(table), 32)
+        self.assertEqual(table[0b00011], 'CASH')
+        self.assertEqual(table[0b11011], 'CARD_BLOCKED')
+        self.assertEqual(table[0b01011], 'CARD_EXPIRED')
+        self.assertEqual(
+            list(
+                src.atm_decision_table.decide_many(
+                    table,
+                    [True, True, True],
+                    [True, True, True],
+                    [False, False, False],
+                    [False, True, False],
+                    [False, False, True],
+                )
+            ),
+            ['CASH', 'CARD_EXPIRED', 'CARD_BLOCKED']
+        )
+
+    def test_benchmark(self):
+        transactions, _, _, counts = src.atm_decision_table.benchmark(1000)
+        self.assertEqual(transactions, 1000)
+        self.assertNotIn('CASH', counts)
+        self.assertLess(sum(counts.values()), transactions)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# NameError
+# TypeError
+# ValueError
+# KeyError
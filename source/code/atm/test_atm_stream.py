@@ -0,0 +1,127 @@
+import collections
+import src.atm_decision_table
+import src.atm_stream
+import unittest
+
+
+class TestATMStream(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = src.atm_stream.TransactionStream(
+            cash=1000, daily_limit=300
+        )
+
+    def test_process(self):
+        self.assertEqual(self.stream.process(0, 'card', 100), 'CASH')
+        self.assertEqual(self.stream.cash, 900)
+        self.assertEqual(self.stream.spent, {'card': 100})
+        self.assertEqual(
+            self.stream.process(1, 'card', 100, right_pin=False),
+            'DENIED'
+        )
+        self.assertEqual(
+            self.stream.process(2, 'card', 100, card_expired=True),
+            'DENIED'
+        )
+        self.assertEqual(self.stream.spent, {'card': 100})
+
+    def test_process_above_daily_limit(self):
+        self.assertEqual(self.stream.process(0, 'card', 200), 'CASH')
+        self.assertEqual(self.stream.process(1, 'card', 200), 'DENIED')
+        self.assertEqual(self.stream.process(2, 'other', 200), 'CASH')
+        self.assertEqual(self.stream.process(3, 'card', 100), 'CASH')
+
+    def test_process_not_enough_cash(self):
+        stream = src.atm_stream.TransactionStream(cash=100, daily_limit=300)
+        self.assertEqual(stream.process(0, 'card', 200), 'DENIED')
+        self.assertEqual(stream.process(0, 'card', 100), 'CASH')
+        self.assertEqual(stream.process(0, 'other', 20), 'DENIED')
+
+    def test_rolling_window(self):
+        day = src.atm_stream.DAY
+        self.stream.process(0, 'card', 300)
+        self.assertEqual(self.stream.process(day-1, 'card', 20), 'DENIED')
+        self.assertEqual(self.stream.process(day, 'card', 300), 'CASH')
+        self.assertEqual(self.stream.spent, {'card': 300})
+        self.assertEqual(
+            self.stream.withdrawals,
+            {'card': collections.deque([(day, 300)])}
+        )
+
+    def test_rolling_window_w_float_amounts(self):
+        day = src.atm_stream.DAY
+        for timestamp, amount in enumerate((0.1, 0.2, 0.3)):
+            self.stream.process(timestamp, 'card', amount)
+        self.stream.process(day+1, 'card', 20, right_pin=False)
+        self.assertAlmostEqual(self.stream.spent['card'], 0.3)
+        self.stream.process(day+2, 'card', 20, right_pin=False)
+        self.assertEqual(self.stream.spent, {})
+        self.assertEqual(self.stream.withdrawals, {})
+
+    def test_memory_is_bounded_by_active_cards(self):
+        for card in range(100):
+            self.stream.process(card, card, 1)
+        self.assertEqual(len(self.stream.spent), 100)
+        self.stream.process(src.atm_stream.DAY + 50, 'card', 1)
+        self.assertEqual(len(self.stream.spent), 50)
+        self.assertEqual(len(self.stream.withdrawals), 50)
+        self.stream.process(src.atm_stream.DAY * 3, 'card', 1)
+        self.assertEqual(self.stream.spent, {'card': 1})
+        self.assertEqual(len(self.stream.withdrawals), 1)
+
+    def test_run(self):
+        self.assertEqual(
+            list(
+                self.stream.run([
+                    (0, 'card', 200, True, False),
+                    (1, 'card', 200, True, False),
+                    (2, 'other', 20, False, False),
+                ])
+            ),
+            [
+                ('card', 200, 'CASH'),
+                ('card', 200, 'DENIED'),
+                ('other', 20, 'DENIED'),
+            ]
+        )
+
+    def test_run_w_policy(self):
+        stream = src.atm_stream.TransactionStream(
+            cash=1000, daily_limit=300,
+            policy=src.atm_decision_table.reason,
+        )
+        self.assertEqual(
+            [
+                decision for _, _, decision in stream.run([
+                    (0, 'card', 200, True, False),
+                    (1, 'card', 200, True, False),
+                    (2, 'card', 20, False, False),
+                    (3, 'card', 20, True, True),
+                    (4, 'card', 2000, True, False),
+                ])
+            ],
+            [
+                'CASH',
+                'ABOVE_DAILY_LIMIT',
+                'WRONG_PIN',
+                'CARD_EXPIRED',
+                'ABOVE_DAILY_LIMIT',
+            ]
+        )
+
+    def test_benchmark(self):
+        number, _, active, window, decisions = src.atm_stream.benchmark(
+            number=1000, cards=10
+        )
+        self.assertEqual(number, 1000)
+        self.assertLessEqual(active, 10)
+        self.assertEqual(window, decisions['CASH'])
+        self.assertEqual(sum(decisions.values()), 1000)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# KeyError
@@ -0,0 +1,146 @@
+import argparse
+import importlib.util
+import json
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+
+
+HERE = pathlib.Path(__file__).resolve().parent
+REVISIONS = (
+    'calculator_1',
+    'calculator_3',
+    'calculator_4',
+    'calculator_5',
+    'calculator_6',
+    'calculator_8',
+    'calculator_9',
+    'calculator_validation',
+)
+OPERATIONS = ('add', 'subtract', 'multiply', 'divide')
+
+
+def import_revision(name, directory=HERE):
+    specification = importlib.util.spec_from_file_location(
+        name, directory / f'{name}.py'
+    )
+    module = importlib.util.module_from_spec(specification)
+    specification.loader.exec_module(module)
+    return module
+
+
+def make_workload(size=1000, seed=0):
+    generator = random.Random(seed)
+    return [
+        (
+            generator.triangular(-1000.0, 1000.0),
+            generator.triangular(-1000.0, 1000.0),
+        )
+        for _ in range(size)
+    ]
+
+
+def time_workload(functions, workload, loops):
+    start = time.perf_counter()
+    for _ in range(loops):
+        for function in functions:
+            for first_input, second_input in workload:
+                function(first_input, second_input)
+    duration = time.perf_counter() - start
+    return duration / (loops * len(functions) * len(workload))
+
+
+def measure(functions, workload, runs=10, warmups=1, loops=10):
+    for _ in range(warmups):
+        time_workload(functions, workload, loops)
+    values = [
+        time_workload(functions, workload, loops)
+        for _ in range(runs)
+    ]
+    return {
+        'values': values,
+        'mean': statistics.mean(values),
+        'stdev': statistics.stdev(values) if runs > 1 else 0.0,
+    }
+
+
+def run(
+        revisions=REVISIONS, directory=HERE,
+        runs=10, warmups=1, loops=10, workload=None,
+    ):
+    workload = workload or make_workload()
+    benchmarks = {}
+    for name in revisions:
+        module = import_revision(name, directory)
+        benchmarks[name] = measure(
+            [module.__getattribute__(operation) for operation in OPERATIONS],
+            workload, runs, warmups, loops,
+        )
+    return {
+        'python': platform.python_version(),
+        'benchmarks': benchmarks,
+    }
+
+
+def is_significant(baseline, current):
+    standard_error = (
+        baseline['stdev'] ** 2 / len(baseline['values'])
+      + current['stdev'] ** 2 / len(current['values'])
+    ) ** 0.5
+    return abs(current['mean'] - baseline['mean']) > 2 * standard_error
+
+
+def compare(baseline, current, threshold=0.1):
+    regressions = {}
+    for name, result in current['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            continue
+        before = baseline['benchmarks'][name]
+        change = result['mean'] / before['mean'] - 1
+        if change > threshold and is_significant(before, result):
+            regressions[name] = change
+    return regressions
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--revisions', nargs='+', default=REVISIONS)
+    parser.add_argument('--directory', type=pathlib.Path, default=HERE)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--output', type=pathlib.Path)
+    parser.add_argument('--baseline', type=pathlib.Path)
+    parser.add_argument('--threshold', type=float, default=0.1)
+    arguments = parser.parse_args(arguments)
+
+    results = run(
+        arguments.revisions, arguments.directory, arguments.runs
+    )
+    fastest = min(
+        result['mean'] for result in results['benchmarks'].values()
+    )
+    for name, result in results['benchmarks'].items():
+        print(
+            f'{name:>22}: {result["mean"]*1e9:7.1f}ns'
+            f' +- {result["stdev"]*1e9:5.1f}ns per call'
+            f' ({result["mean"]/fastest:.2f}x)'
+        )
+
+    if arguments.output:
+        arguments.output.write_text(json.dumps(results, indent=2))
+
+    if arguments.baseline:
+        regressions = compare(
+            json.loads(arguments.baseline.read_text()),
+            results, arguments.threshold,
+        )
+        for name, change in regressions.items():
+            print(f'REGRESSION {name}: {change:+.1%}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
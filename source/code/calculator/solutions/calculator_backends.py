@@ -0,0 +1,134 @@
+import decimal
+import fractions
+import operator
+import time
+import types
+
+
+NUMBERS_ONLY = 'brmph?! Numbers only. Try again...'
+DIVIDE_BY_ZERO = 'brmph?! I cannot divide by 0. Try again...'
+CANNOT_CALCULATE = 'brmph?! I cannot calculate that. Try again...'
+
+
+def make_calculator(convert, accepted_types, add, subtract, multiply, divide):
+    def check_input(function):
+        def wrapper(first_input, second_input):
+            if not (
+                type(first_input) in accepted_types
+                and
+                type(second_input) in accepted_types
+            ):
+                return NUMBERS_ONLY
+            try:
+                first_input = convert(first_input)
+                second_input = convert(second_input)
+            except (ValueError, OverflowError, decimal.DecimalException):
+                return CANNOT_CALCULATE
+            try:
+                return function(first_input, second_input)
+            except ZeroDivisionError:
+                return DIVIDE_BY_ZERO
+            except (OverflowError, decimal.DecimalException):
+                return CANNOT_CALCULATE
+        return wrapper
+
+    return types.SimpleNamespace(
+        add=check_input(add),
+        subtract=check_input(subtract),
+        multiply=check_input(multiply),
+        divide=check_input(divide),
+    )
+
+
+def float_calculator():
+    return make_calculator(
+        float, {int, float},
+        operator.add, operator.sub, operator.mul, operator.truediv,
+    )
+
+
+def decimal_calculator(context=None):
+    if context is None:
+        context = decimal.Context()
+
+    def convert(value):
+        if type(value) is float:
+            value = repr(value)
+        return context.create_decimal(value)
+
+    def divide(first_input, second_input):
+        if not second_input:
+            return DIVIDE_BY_ZERO
+        return context.divide(first_input, second_input)
+
+    return make_calculator(
+        convert, {int, float, decimal.Decimal},
+        context.add, context.subtract, context.multiply, divide,
+    )
+
+
+def fraction_calculator():
+    def convert(value):
+        if type(value) is float:
+            value = repr(value)
+        return fractions.Fraction(value)
+
+    return make_calculator(
+        convert, {int, float, decimal.Decimal, fractions.Fraction},
+        operator.add, operator.sub, operator.mul, operator.truediv,
+    )
+
+
+def integer_calculator():
+    def divide(first_input, second_input):
+        quotient, remainder = divmod(first_input, second_input)
+        if remainder:
+            return fractions.Fraction(first_input, second_input)
+        return quotient
+
+    def convert(value):
+        return value
+
+    return make_calculator(
+        convert, {int, fractions.Fraction},
+        operator.add, operator.sub, operator.mul, divide,
+    )
+
+
+BACKENDS = {
+    'float': float_calculator,
+    'decimal': decimal_calculator,
+    'fraction': fraction_calculator,
+    'integer': integer_calculator,
+}
+
+
+def get_calculator(backend='float', **options):
+    return BACKENDS[backend](**options)
+
+
+def run_chain(calculator, numbers):
+    result = 0
+    for number in numbers:
+        result = calculator.add(result, number)
+        result = calculator.multiply(result, number)
+        result = calculator.subtract(result, number)
+        result = calculator.divide(result, number)
+    return result
+
+
+def benchmark(length=10_000):
+    numbers = [number % 9 + 1 for number in range(length)]
+    results = {}
+    for backend in BACKENDS:
+        calculator = get_calculator(backend)
+        start = time.perf_counter()
+        run_chain(calculator, numbers)
+        duration = time.perf_counter() - start
+        results[backend] = 4 * length / duration
+    return results
+
+
+if __name__ == '__main__':
+    for backend, operations_per_second in benchmark().items():
+        print(f'{backend:>8}: {operations_per_second:,.0f} operations/s')
@@ -0,0 +1,84 @@
+import array
+import operator
+
+
+NUMBERS_ONLY = 'brmph?! Numbers only. Try again...'
+DIVIDE_BY_ZERO = 'brmph?! I cannot divide by 0. Try again...'
+BAD_DATA_TYPES = (dict, set, list, tuple, str, bool)
+BUFFERS = (array.array, memoryview)
+
+
+def is_number(value):
+    return not (
+        value is None
+        or
+        isinstance(value, BAD_DATA_TYPES)
+    )
+
+
+def get_mask(first_inputs, second_inputs):
+    if (
+        isinstance(first_inputs, BUFFERS)
+        and
+        isinstance(second_inputs, BUFFERS)
+    ):
+        return None
+    return list(
+        map(
+            operator.and_,
+            map(is_number, first_inputs),
+            map(is_number, second_inputs),
+        )
+    )
+
+
+def check_input(function):
+    def wrapper(first_inputs, second_inputs):
+        if len(first_inputs) != len(second_inputs):
+            raise ValueError(
+                'brmph?! Inputs must be the same length'
+            )
+
+        mask = get_mask(first_inputs, second_inputs)
+        if mask is None or all(mask):
+            return function(first_inputs, second_inputs)
+
+        results = iter(
+            function(
+                [x for x, ok in zip(first_inputs, mask) if ok],
+                [y for y, ok in zip(second_inputs, mask) if ok],
+            )
+        )
+        return [
+            next(results) if ok else NUMBERS_ONLY
+            for ok in mask
+        ]
+    return wrapper
+
+
+def safe_divide(first_input, second_input):
+    if second_input == 0:
+        return DIVIDE_BY_ZERO
+    return first_input / second_input
+
+
+@check_input
+def add(first_inputs, second_inputs):
+    return list(map(operator.add, first_inputs, second_inputs))
+
+
+@check_input
+def divide(first_inputs, second_inputs):
+    if 0 in second_inputs:
+        return list(map(safe_divide, first_inputs, second_inputs))
+    return list(map(operator.truediv, first_inputs, second_inputs))
+
+
+@check_input
+def multiply(first_inputs, second_inputs):
+    return list(map(operator.mul, first_inputs, second_inputs))
+
+
+@check_input
+def subtract(first_inputs, second_inputs):
+    return list(map(operator.sub, first_inputs, second_inputs))
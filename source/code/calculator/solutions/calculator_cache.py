@@ -0,0 +1,144 @@
+import cmath
+import collections
+import decimal
+import fractions
+import functools
+import math
+import random
+import src.calculator
+import time
+
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', 'hits misses max_size current_size'
+)
+
+
+def is_nan(value):
+    if isinstance(value, float):
+        return math.isnan(value)
+    if isinstance(value, complex):
+        return cmath.isnan(value)
+    if isinstance(value, decimal.Decimal):
+        return value.is_nan()
+    return False
+
+
+def sign(value):
+    if isinstance(value, float):
+        return math.copysign(1, value)
+    if isinstance(value, complex):
+        return math.copysign(1, value.real), math.copysign(1, value.imag)
+    if isinstance(value, decimal.Decimal):
+        return value.is_signed()
+    return None
+
+
+def cache(max_size=128, ttl=None, cache_nan=False, timer=time.monotonic):
+    def decorator(function):
+        results = collections.OrderedDict()
+        counters = {'hits': 0, 'misses': 0}
+
+        @functools.wraps(function)
+        def wrapper(first_input, second_input):
+            if not cache_nan and (
+                is_nan(first_input) or is_nan(second_input)
+            ):
+                return function(first_input, second_input)
+
+            key = (
+                type(first_input), first_input, sign(first_input),
+                type(second_input), second_input, sign(second_input),
+            )
+            try:
+                result, expires = results[key]
+            except KeyError:
+                pass
+            except TypeError:
+                return function(first_input, second_input)
+            else:
+                if expires is None or timer() < expires:
+                    results.move_to_end(key)
+                    counters['hits'] += 1
+                    return result
+                del results[key]
+
+            counters['misses'] += 1
+            result = function(first_input, second_input)
+            results[key] = (
+                result, None if ttl is None else timer() + ttl
+            )
+            if max_size is not None and len(results) > max_size:
+                results.popitem(last=False)
+            return result
+
+        def cache_info():
+            return CacheInfo(
+                counters['hits'], counters['misses'],
+                max_size, len(results),
+            )
+
+        def cache_clear():
+            results.clear()
+            counters['hits'] = counters['misses'] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+add = cache()(src.calculator.add)
+divide = cache()(src.calculator.divide)
+multiply = cache()(src.calculator.multiply)
+subtract = cache()(src.calculator.subtract)
+
+
+def benchmark(
+        calls=100_000, distinct_pairs=(10, 1_000, 100_000),
+        make_number=float,
+    ):
+    results = {}
+    for operation in ('add', 'subtract', 'multiply', 'divide'):
+        function = src.calculator.__getattribute__(operation)
+        results[operation] = {}
+        for distinct in distinct_pairs:
+            pairs = [
+                (
+                    make_number(random.randint(1, 1000)),
+                    make_number(random.randint(1, 1000)),
+                )
+                for _ in range(distinct)
+            ]
+            workload = random.choices(pairs, k=calls)
+            timings = []
+            for a_function in (
+                function, cache(max_size=distinct)(function)
+            ):
+                start = time.perf_counter()
+                for first_input, second_input in workload:
+                    a_function(first_input, second_input)
+                timings.append(time.perf_counter() - start)
+            results[operation][distinct] = dict(
+                zip(('computed', 'cached'), timings)
+            )
+    return results
+
+
+if __name__ == '__main__':
+    for make_number in (float, fractions.Fraction):
+        print(make_number.__name__)
+        for operation, timings in benchmark(
+            make_number=make_number
+        ).items():
+            for distinct, result in timings.items():
+                winner = (
+                    'cached' if result['cached'] < result['computed']
+                    else 'computed'
+                )
+                print(
+                    f'{operation:>10} {distinct:>7} pairs:'
+                    f' computed {result["computed"]:.3f}s'
+                    f' cached {result["cached"]:.3f}s'
+                    f' -> {winner}'
+                )
@@ -0,0 +1,84 @@
+import ast
+import functools
+import src.calculator
+
+
+PUSH, LOAD, CALL = 'PUSH', 'LOAD', 'CALL'
+OPERATIONS = {
+    ast.Add: src.calculator.add,
+    ast.Sub: src.calculator.subtract,
+    ast.Mult: src.calculator.multiply,
+    ast.Div: src.calculator.divide,
+}
+
+
+def is_a_number(node):
+    return (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, (int, float))
+        and not isinstance(node.value, bool)
+    )
+
+
+def compile_node(node, instructions):
+    if is_a_number(node):
+        instructions.append((PUSH, node.value))
+    elif isinstance(node, ast.Name):
+        instructions.append((LOAD, node.id))
+    elif isinstance(node, ast.UnaryOp) and isinstance(
+        node.op, ast.UAdd
+    ):
+        compile_node(node.operand, instructions)
+    elif isinstance(node, ast.UnaryOp) and isinstance(
+        node.op, ast.USub
+    ):
+        if is_a_number(node.operand):
+            instructions.append((PUSH, -node.operand.value))
+        else:
+            instructions.append((PUSH, 0))
+            compile_node(node.operand, instructions)
+            instructions.append((CALL, src.calculator.subtract))
+    elif isinstance(node, ast.BinOp) and type(node.op) in OPERATIONS:
+        compile_node(node.left, instructions)
+        compile_node(node.right, instructions)
+        instructions.append((CALL, OPERATIONS[type(node.op)]))
+    else:
+        raise SyntaxError(
+            f'brmph?! I cannot calculate {ast.unparse(node)}'
+        )
+    return instructions
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_expression(expression):
+    return tuple(
+        compile_node(
+            ast.parse(expression, mode='eval').body, []
+        )
+    )
+
+
+def run(instructions, variables):
+    stack = []
+    for operation, argument in instructions:
+        if operation is PUSH:
+            stack.append(argument)
+        elif operation is LOAD:
+            stack.append(variables[argument])
+        else:
+            second_input = stack.pop()
+            first_input = stack.pop()
+            result = argument(first_input, second_input)
+            if isinstance(result, str):
+                return result
+            stack.append(result)
+    return stack.pop()
+
+
+def evaluate(expression, **variables):
+    return run(compile_expression(expression), variables)
+
+
+def evaluate_many(expression, bindings):
+    instructions = compile_expression(expression)
+    return [run(instructions, variables) for variables in bindings]
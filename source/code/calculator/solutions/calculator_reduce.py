@@ -0,0 +1,136 @@
+import collections.abc
+import concurrent.futures
+import itertools
+import src.calculator
+import src.calculator_validation
+
+
+NUMBERS_ONLY = 'brmph?! Numbers only. Try again...'
+IDENTITY = {'add': 0, 'multiply': 1}
+
+
+def is_number(value):
+    return (
+        type(value) in src.calculator_validation.NUMBER_TYPES
+        or src.calculator_validation.is_number_type(type(value))
+    )
+
+
+def pairwise(function, numbers, start, stop):
+    if stop - start <= 8:
+        result = numbers[start]
+        for index in range(start+1, stop):
+            result = function(result, numbers[index])
+        return result
+
+    middle = (start + stop) // 2
+    return function(
+        pairwise(function, numbers, start, middle),
+        pairwise(function, numbers, middle, stop),
+    )
+
+
+def reduce_chunk(operation, chunk):
+    if not all(map(is_number, chunk)):
+        return NUMBERS_ONLY
+    if not chunk:
+        return IDENTITY[operation]
+    return pairwise(
+        src.calculator.__getattribute__(operation),
+        chunk, 0, len(chunk),
+    )
+
+
+def combine(operation, partials):
+    for partial in partials:
+        if isinstance(partial, str):
+            return partial
+    return reduce_chunk(operation, partials)
+
+
+def reduce_in_parallel(operation, numbers, chunk_size, processes):
+    chunks = (
+        numbers[index:index+chunk_size]
+        for index in range(0, len(numbers), chunk_size)
+    )
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        partials = list(
+            executor.map(
+                reduce_chunk, itertools.repeat(operation), chunks
+            )
+        )
+    return combine(operation, partials)
+
+
+def reduce_stream(operation, numbers, chunk_size):
+    function = src.calculator.__getattribute__(operation)
+    levels = []
+    numbers = iter(numbers)
+
+    while chunk := list(itertools.islice(numbers, chunk_size)):
+        result = reduce_chunk(operation, chunk)
+        if isinstance(result, str):
+            return result
+
+        for level, partial in enumerate(levels):
+            if partial is None:
+                levels[level] = result
+                break
+            result = function(partial, result)
+            levels[level] = None
+        else:
+            levels.append(result)
+
+    return combine(
+        operation,
+        [partial for partial in reversed(levels) if partial is not None],
+    )
+
+
+def reduce(operation, numbers, chunk_size=10_000, processes=None):
+    try:
+        if (
+            processes != 1
+            and isinstance(numbers, collections.abc.Sequence)
+            and len(numbers) > chunk_size
+        ):
+            return reduce_in_parallel(
+                operation, numbers, chunk_size, processes
+            )
+        return reduce_stream(operation, numbers, chunk_size)
+    except TypeError:
+        return NUMBERS_ONLY
+
+
+def add_all(numbers, chunk_size=10_000, processes=None):
+    return reduce('add', numbers, chunk_size, processes)
+
+
+def multiply_all(numbers, chunk_size=10_000, processes=None):
+    return reduce('multiply', numbers, chunk_size, processes)
+
+
+def divide_chunk(result, chunk):
+    for number in chunk:
+        result = src.calculator.divide(result, number)
+        if isinstance(result, str):
+            break
+    return result
+
+
+def divide_all(numbers, chunk_size=10_000, processes=None):
+    numbers = iter(numbers)
+    result = next(numbers, None)
+    if not is_number(result):
+        return NUMBERS_ONLY
+
+    while chunk := list(itertools.islice(numbers, chunk_size)):
+        if not all(map(is_number, chunk)):
+            return NUMBERS_ONLY
+        try:
+            result = divide_chunk(result, chunk)
+        except TypeError:
+            return NUMBERS_ONLY
+        if isinstance(result, str):
+            return result
+    return result
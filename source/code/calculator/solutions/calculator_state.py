@@ -0,0 +1,160 @@
+import pathlib
+import random
+import sys
+import time
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent)
+)
+
+import calculator
+
+
+OPERATIONS = {
+    '+': calculator.add,
+    '-': calculator.subtract,
+    'X': calculator.multiply,
+    '/': calculator.divide,
+}
+PLAIN = set('0123456789.')
+
+
+class CalculatorState:
+
+    def __init__(self):
+        self.all_clear()
+        self.keys = {
+            '<-': self.backspace,
+            '+/-': self.plus_minus,
+            '.': self.add_decimal,
+            'C': self.clear_entry,
+            'AC': self.all_clear,
+            '=': self.equals,
+        }
+
+    def all_clear(self):
+        self.clear()
+        self.stack = []
+        self.pending = None
+        self.error = None
+
+    def clear(self):
+        self.digits = ['0']
+        self.has_decimal = False
+        self.is_negative = False
+        self.new_entry = False
+
+    def clear_entry(self):
+        if self.error is not None:
+            return self.all_clear()
+        self.clear()
+
+    def show(self, value):
+        text = str(value)
+        self.clear()
+        self.is_negative = text.startswith('-')
+        self.digits = list(text.lstrip('-'))
+        self.has_decimal = isinstance(value, float)
+        self.new_entry = True
+
+    @property
+    def number(self):
+        if self.error is not None:
+            return self.error
+        sign = '-' if self.is_negative else ''
+        return sign + ''.join(self.digits)
+
+    @property
+    def value(self):
+        if self.has_decimal:
+            return float(self.number)
+        return int(self.number)
+
+    def start_entry(self):
+        if self.error is not None:
+            self.all_clear()
+        if self.new_entry:
+            self.clear()
+
+    def add_number(self, number):
+        self.start_entry()
+        if len(self.digits) == 1 and self.digits[0] == '0':
+            self.digits[0] = number
+        else:
+            self.digits.append(number)
+
+    def add_decimal(self):
+        self.start_entry()
+        if not self.has_decimal:
+            self.digits.append('.')
+            self.has_decimal = True
+
+    def edit_entry(self):
+        if self.error is not None:
+            self.all_clear()
+        self.new_entry = False
+
+    def backspace(self):
+        self.edit_entry()
+        if not PLAIN.issuperset(self.digits):
+            return self.clear()
+        if self.digits.pop() == '.':
+            self.has_decimal = False
+        if not self.digits:
+            self.digits.append('0')
+
+    def plus_minus(self):
+        self.edit_entry()
+        self.is_negative = not self.is_negative
+
+    def calculate(self):
+        if self.pending is None:
+            return self.value
+        result = OPERATIONS[self.pending](self.stack.pop(), self.value)
+        self.pending = None
+        if isinstance(result, str):
+            self.error = result
+        return result
+
+    def press_operation(self, operation):
+        if self.error is not None:
+            return
+        if self.pending is not None and self.new_entry:
+            self.pending = operation
+            return
+        result = self.calculate()
+        if self.error is None:
+            self.stack.append(result)
+            self.pending = operation
+            self.show(result)
+
+    def equals(self):
+        if self.error is None:
+            result = self.calculate()
+            if self.error is None:
+                self.show(result)
+
+    def press(self, key):
+        if key in OPERATIONS:
+            return self.press_operation(key)
+        if key in self.keys:
+            return self.keys[key]()
+        return self.add_number(key)
+
+
+def benchmark(keypresses=100_000, seed=0):
+    keys = random.Random(seed).choices(
+        [
+            '0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
+            '.', '<-', '+/-', '+', '-', 'X', '/', '=', 'C', 'AC',
+        ],
+        k=keypresses,
+    )
+    state = CalculatorState()
+    start = time.perf_counter()
+    for key in keys:
+        state.press(key)
+    return keypresses / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    print(f'{benchmark():,.0f} keypresses/s')
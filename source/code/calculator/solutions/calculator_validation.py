@@ -0,0 +1,102 @@
+import decimal
+import fractions
+import functools
+import numbers
+import src.calculator_1
+import timeit
+
+
+NUMBERS_ONLY = 'brmph?! Numbers only. Try again...'
+NUMBER_TYPES = frozenset({
+    int, float, complex, decimal.Decimal, fractions.Fraction,
+})
+
+
+@functools.cache
+def is_number_type(a_type):
+    return (
+        issubclass(a_type, numbers.Number)
+        and not issubclass(a_type, bool)
+    )
+
+
+def numbers_only(function):
+    @functools.wraps(function)
+    def wrapper(first_input, second_input):
+        if not (
+            type(first_input) in NUMBER_TYPES
+            and
+            type(second_input) in NUMBER_TYPES
+        ) and not (
+            is_number_type(type(first_input))
+            and
+            is_number_type(type(second_input))
+        ):
+            return NUMBERS_ONLY
+        try:
+            return function(first_input, second_input)
+        except TypeError:
+            return NUMBERS_ONLY
+    return wrapper
+
+
+@numbers_only
+def add(first_input, second_input):
+    return first_input + second_input
+
+
+@numbers_only
+def divide(first_input, second_input):
+    try:
+        return first_input / second_input
+    except ZeroDivisionError:
+        return 'brmph?! I cannot divide by 0. Try again...'
+
+
+@numbers_only
+def multiply(first_input, second_input):
+    return first_input * second_input
+
+
+@numbers_only
+def subtract(first_input, second_input):
+    return first_input - second_input
+
+
+def benchmark(number=1_000_000, first_input=1.5, second_input=2.5):
+    results = {}
+    for function in (add, subtract, multiply, divide):
+        timings = []
+        for a_function in (
+            src.calculator_1.__getattribute__(function.__name__),
+            function,
+        ):
+            timings.append(
+                timeit.timeit(
+                    'function(first_input, second_input)',
+                    globals={
+                        'function': a_function,
+                        'first_input': first_input,
+                        'second_input': second_input,
+                    },
+                    number=number,
+                )
+            )
+        raw, wrapped = timings
+        results[function.__name__] = {
+            'raw': raw,
+            'wrapped': wrapped,
+            'overhead_per_call': (wrapped-raw) / number,
+            'ratio': wrapped / raw,
+        }
+    return results
+
+
+if __name__ == '__main__':
+    for name, result in benchmark().items():
+        print(
+            f'{name:>8}: raw {result["raw"]:.3f}s'
+            f' wrapped {result["wrapped"]:.3f}s'
+            f' overhead {result["overhead_per_call"]*1e9:.0f}ns/call'
+            f' ratio {result["ratio"]:.1f}x'
+        )
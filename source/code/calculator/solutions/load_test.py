@@ -0,0 +1,113 @@
+import collections
+import concurrent.futures
+import json
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+
+def form_data(first_input, second_input, operation):
+    return urllib.parse.urlencode({
+        'first_input': first_input,
+        'second_input': second_input,
+        'operation': operation,
+    }).encode()
+
+
+def batch_data(calculations):
+    return json.dumps([
+        {
+            'first_input': first_input,
+            'second_input': second_input,
+            'operation': operation,
+        }
+        for first_input, second_input, operation in calculations
+    ]).encode()
+
+
+def post(url, data, content_type):
+    request = urllib.request.Request(
+        url, data=data, headers={'Content-Type': content_type},
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+    except urllib.error.HTTPError as error:
+        return time.perf_counter() - start, error.code
+    except OSError as error:
+        return time.perf_counter() - start, type(error).__name__
+    return time.perf_counter() - start, None
+
+
+def summarize(latencies, duration, errors=None):
+    errors = collections.Counter(errors)
+    requests = len(latencies) + errors.total()
+    if not latencies:
+        p50 = p99 = 0
+    elif len(latencies) > 1:
+        p50 = statistics.median(latencies)
+        p99 = statistics.quantiles(latencies, n=100)[-1]
+    else:
+        p50 = p99 = latencies[0]
+    return {
+        'requests': requests,
+        'requests_per_second': requests / duration if duration else 0,
+        'errors': errors.total(),
+        'errors_by_kind': dict(errors),
+        'p50': p50,
+        'p99': p99,
+    }
+
+
+def run(
+        url, data,
+        content_type='application/x-www-form-urlencoded',
+        requests=1000, clients=50,
+    ):
+    with concurrent.futures.ThreadPoolExecutor(clients) as executor:
+        start = time.perf_counter()
+        results = list(
+            executor.map(
+                lambda _: post(url, data, content_type),
+                range(requests),
+            )
+        )
+        duration = time.perf_counter() - start
+    return summarize(
+        [latency for latency, error in results if error is None],
+        duration,
+        [error for _, error in results if error is not None],
+    )
+
+
+def main(base_url='http://127.0.0.1:5000'):
+    calculations = [(1.5, 2.5, 'add'), (3.0, 0.0, 'divide')] * 50
+    for name, url, data, content_type in (
+        (
+            'calculate',
+            f'{base_url}/calculate',
+            form_data(*calculations[0]),
+            'application/x-www-form-urlencoded',
+        ),
+        (
+            'calculate/batch',
+            f'{base_url}/calculate/batch',
+            batch_data(calculations),
+            'application/json',
+        ),
+    ):
+        result = run(url, data, content_type)
+        print(
+            f'{name:>16}: {result["requests_per_second"]:.0f} requests/s'
+            f' p50 {result["p50"]*1000:.2f}ms'
+            f' p99 {result["p99"]*1000:.2f}ms'
+            f' errors {result["errors"]}'
+        )
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
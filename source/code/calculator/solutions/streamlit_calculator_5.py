@@ -0,0 +1,65 @@
+import pathlib
+import sys
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent)
+)
+
+import calculator_state
+import streamlit
+
+
+BUTTONS = (
+    (
+        ('<-', '<-', 'secondary'),
+        ('7', '7', 'secondary'),
+        ('4', '4', 'secondary'),
+        ('1', '1', 'secondary'),
+        ('+/-', '+/-', 'secondary'),
+    ),
+    (
+        ('C', 'C', 'primary'),
+        ('8', '8', 'secondary'),
+        ('5', '5', 'secondary'),
+        ('2', '2', 'secondary'),
+        ('0', '0', 'secondary'),
+    ),
+    (
+        ('AC', 'AC', 'primary'),
+        ('9', '9', 'secondary'),
+        ('6', '6', 'secondary'),
+        ('3', '3', 'secondary'),
+        ('.', '.', 'secondary'),
+    ),
+    (
+        ('/', '/', 'primary'),
+        ('X', 'X', 'primary'),
+        (r'\-', '-', 'primary'),
+        (r'\+', '+', 'primary'),
+        ('=', '=', 'primary'),
+    ),
+)
+
+
+@streamlit.fragment
+def keypad(state):
+    display = streamlit.container(border=True)
+    display.write(state.number)
+
+    for column, buttons in zip(streamlit.columns(4), BUTTONS):
+        for label, key, button_type in buttons:
+            column.button(
+                label=label, key=label, width='stretch',
+                type=button_type, on_click=state.press, args=[key],
+            )
+
+
+def main():
+    streamlit.title('Calculator')
+    state = streamlit.session_state.setdefault(
+        'calculator', calculator_state.CalculatorState()
+    )
+    keypad(state)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import json
+import pathlib
+import sys
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent)
+)
+
+import website_batch
+
+
+async def read_body(receive):
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    return body
+
+
+async def respond(send, status, body):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json')],
+    })
+    await send({
+        'type': 'http.response.body',
+        'body': body,
+    })
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        if message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] == 'websocket':
+        await receive()
+        return await send({'type': 'websocket.close'})
+    if scope['type'] != 'http':
+        return
+
+    if (
+        scope['method'] != 'POST'
+        or scope['path'] != '/calculate/batch'
+    ):
+        return await respond(send, 404, b'{"error": "not found"}')
+
+    try:
+        body = website_batch.to_json(
+            website_batch.calculate_many(
+                json.loads(await read_body(receive))
+            )
+        )
+    except (KeyError, TypeError, ValueError):
+        return await respond(send, 400, b'{"error": "bad request"}')
+    return await respond(send, 200, body.encode())
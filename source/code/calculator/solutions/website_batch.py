@@ -0,0 +1,64 @@
+import json
+import pathlib
+import sys
+sys.path.insert(
+    0, str(pathlib.Path(__file__).resolve().parent)
+)
+
+import calculator
+import flask
+
+
+OPERATIONS = {
+    'add': '+',
+    'subtract': '-',
+    'divide': '/',
+    'multiply': '*',
+}
+FUNCTIONS = {
+    operation: calculator.__getattribute__(operation)
+    for operation in OPERATIONS
+}
+
+app = flask.Flask(__name__)
+
+
+def calculate_many(calculations):
+    return [
+        FUNCTIONS[calculation['operation']](
+            float(calculation['first_input']),
+            float(calculation['second_input']),
+        )
+        for calculation in calculations
+    ]
+
+
+def to_json(results):
+    return json.dumps(results, allow_nan=False)
+
+
+@app.route('/')
+def home():
+    return flask.render_template('index.html')
+
+
+@app.route('/calculate', methods=['POST'])
+def calculate():
+    first_input = float(flask.request.form.get('first_input'))
+    second_input = float(flask.request.form.get('second_input'))
+    operation = flask.request.form.get('operation')
+
+    result = FUNCTIONS[operation](first_input, second_input)
+    return (
+        f'<h2>{first_input} {OPERATIONS[operation]} {second_input} '
+        f'= {result}</h2>'
+    )
+
+
+@app.route('/calculate/batch', methods=['POST'])
+def calculate_batch():
+    try:
+        body = to_json(calculate_many(flask.request.get_json()))
+    except (KeyError, TypeError, ValueError):
+        flask.abort(400)
+    return flask.Response(body, mimetype='application/json')
@@ -0,0 +1,98 @@
+import contextlib
+import io
+import json
+import pathlib
+import src.benchmark_calculators
+import tempfile
+import unittest
+
+
+def a_result(mean, stdev=0.0, runs=10):
+    return {
+        'values': [mean] * runs,
+        'mean': mean,
+        'stdev': stdev,
+    }
+
+
+class TestBenchmarkCalculators(unittest.TestCase):
+
+    def test_run(self):
+        reality = src.benchmark_calculators.run(
+            revisions=('calculator',),
+            directory=pathlib.Path('src'),
+            runs=3, loops=1,
+            workload=src.benchmark_calculators.make_workload(10),
+        )
+        self.assertEqual(list(reality['benchmarks']), ['calculator'])
+        result = reality['benchmarks']['calculator']
+        self.assertEqual(len(result['values']), 3)
+        self.assertGreater(result['mean'], 0)
+        json.dumps(reality)
+
+    def test_make_workload_is_reproducible(self):
+        self.assertEqual(
+            src.benchmark_calculators.make_workload(5, seed=1),
+            src.benchmark_calculators.make_workload(5, seed=1),
+        )
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            'benchmarks': {
+                'calculator_1': a_result(100e-9, 1e-9),
+                'calculator_9': a_result(200e-9, 1e-9),
+                'calculator_6': a_result(300e-9, 200e-9),
+            },
+        }
+        current = {
+            'benchmarks': {
+                'calculator_1': a_result(105e-9, 1e-9),
+                'calculator_9': a_result(300e-9, 1e-9),
+                'calculator_6': a_result(400e-9, 200e-9),
+                'calculator_new': a_result(900e-9, 1e-9),
+            },
+        }
+        self.assertEqual(
+            src.benchmark_calculators.compare(baseline, current),
+            {'calculator_9': 0.5}
+        )
+
+    def test_main_w_baseline(self):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            contextlib.redirect_stdout(io.StringIO()),
+        ):
+            baseline = pathlib.Path(directory) / 'baseline.json'
+            output = pathlib.Path(directory) / 'results.json'
+            arguments = [
+                '--revisions', 'calculator',
+                '--directory', 'src',
+                '--runs', '2',
+                '--output', str(output),
+                '--baseline', str(baseline),
+            ]
+
+            baseline.write_text(json.dumps({
+                'benchmarks': {'calculator': a_result(1.0)},
+            }))
+            self.assertEqual(
+                src.benchmark_calculators.main(arguments), 0
+            )
+            self.assertEqual(
+                list(json.loads(output.read_text())['benchmarks']),
+                ['calculator']
+            )
+
+            baseline.write_text(json.dumps({
+                'benchmarks': {'calculator': a_result(1e-12)},
+            }))
+            self.assertEqual(
+                src.benchmark_calculators.main(arguments), 1
+            )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# FileNotFoundError
+# KeyError
@@ -0,0 +1,210 @@
+import decimal
+import fractions
+import random
+import src.calculator_backends
+import unittest
+
+
+def a_random_number():
+    return random.triangular(-1000.0, 1000.0)
+
+
+class TestCalculatorBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.operations = ('add', 'subtract', 'multiply', 'divide')
+
+    def test_float_backend(self):
+        calculator = src.calculator_backends.get_calculator('float')
+        x, y = a_random_number(), a_random_number()
+        self.assertEqual(calculator.add(x, y), x+y)
+        self.assertEqual(calculator.subtract(x, y), x-y)
+        self.assertEqual(calculator.multiply(x, y), x*y)
+        self.assertEqual(calculator.divide(x, y), x/y)
+        self.assertEqual(calculator.divide(1, 2), 0.5)
+
+    def test_decimal_backend(self):
+        calculator = src.calculator_backends.get_calculator('decimal')
+        self.assertEqual(
+            calculator.add(0.1, 0.2), decimal.Decimal('0.3')
+        )
+        self.assertEqual(
+            calculator.subtract(decimal.Decimal('1.10'), 1),
+            decimal.Decimal('0.10')
+        )
+        self.assertEqual(
+            calculator.multiply(decimal.Decimal('1.5'), 3),
+            decimal.Decimal('4.5')
+        )
+        self.assertEqual(
+            calculator.divide(1, 8), decimal.Decimal('0.125')
+        )
+
+    def test_decimal_backend_w_context(self):
+        calculator = src.calculator_backends.get_calculator(
+            'decimal', context=decimal.Context(prec=5)
+        )
+        self.assertEqual(
+            calculator.divide(1, 3), decimal.Decimal('0.33333')
+        )
+
+    def test_fraction_backend(self):
+        calculator = src.calculator_backends.get_calculator('fraction')
+        self.assertEqual(
+            calculator.add(0.1, 0.2), fractions.Fraction(3, 10)
+        )
+        self.assertEqual(
+            calculator.subtract(fractions.Fraction(1, 3), 1),
+            fractions.Fraction(-2, 3)
+        )
+        self.assertEqual(
+            calculator.multiply(decimal.Decimal('0.5'), 3),
+            fractions.Fraction(3, 2)
+        )
+        self.assertEqual(
+            calculator.divide(1, 3), fractions.Fraction(1, 3)
+        )
+
+    def test_integer_backend(self):
+        calculator = src.calculator_backends.get_calculator('integer')
+        self.assertEqual(calculator.add(7, 3), 10)
+        self.assertEqual(calculator.subtract(7, 3), 4)
+        self.assertEqual(calculator.multiply(7, 3), 21)
+        self.assertEqual(calculator.divide(9, 3), 3)
+        self.assertIsInstance(calculator.divide(9, 3), int)
+        self.assertEqual(
+            calculator.divide(7, 3), fractions.Fraction(7, 3)
+        )
+        self.assertEqual(
+            calculator.add(1.5, 2), 'brmph?! Numbers only. Try again...'
+        )
+
+    def test_integer_backend_chains_inexact_division(self):
+        calculator = src.calculator_backends.get_calculator('integer')
+        half = calculator.divide(1, 2)
+        self.assertEqual(calculator.add(half, 1), fractions.Fraction(3, 2))
+        self.assertEqual(calculator.multiply(half, 4), 2)
+        self.assertEqual(calculator.subtract(1, half), half)
+        self.assertEqual(calculator.divide(half, 3), fractions.Fraction(1, 6))
+
+    def test_every_backend_chains_inexact_division(self):
+        for backend in src.calculator_backends.BACKENDS:
+            with self.subTest(backend=backend):
+                result = src.calculator_backends.run_chain(
+                    src.calculator_backends.get_calculator(backend),
+                    [3, 7, 2, 9],
+                )
+                self.assertNotIsInstance(result, str)
+                self.assertAlmostEqual(
+                    float(result),
+                    float(
+                        src.calculator_backends.run_chain(
+                            src.calculator_backends.get_calculator(
+                                'fraction'
+                            ),
+                            [3, 7, 2, 9],
+                        )
+                    )
+                )
+
+    def test_every_backend_handles_zero_division(self):
+        for backend in src.calculator_backends.BACKENDS:
+            with self.subTest(backend=backend):
+                calculator = src.calculator_backends.get_calculator(
+                    backend
+                )
+                self.assertEqual(
+                    calculator.divide(1, 0),
+                    'brmph?! I cannot divide by 0. Try again...'
+                )
+                self.assertEqual(
+                    calculator.divide(0, 0),
+                    'brmph?! I cannot divide by 0. Try again...'
+                )
+
+    def test_backends_send_message_when_they_cannot_calculate(self):
+        for backend, operation, first_input, second_input in (
+            ('float', 'add', 10**400, 1),
+            ('float', 'divide', 1, 10**400),
+            ('fraction', 'add', float('nan'), 1),
+            ('fraction', 'multiply', 1, float('inf')),
+            ('fraction', 'subtract', decimal.Decimal('NaN'), 1),
+            ('fraction', 'divide', decimal.Decimal('-Infinity'), 1),
+            ('decimal', 'add', decimal.Decimal('sNaN'), 1),
+            ('decimal', 'subtract', float('inf'), float('inf')),
+            ('decimal', 'multiply', decimal.Decimal('1e999999'), 10),
+        ):
+            with self.subTest(
+                backend=backend,
+                first_input=first_input,
+                second_input=second_input,
+            ):
+                calculator = src.calculator_backends.get_calculator(
+                    backend
+                )
+                self.assertEqual(
+                    calculator.__getattribute__(operation)(
+                        first_input, second_input
+                    ),
+                    'brmph?! I cannot calculate that. Try again...'
+                )
+
+    def test_decimal_backend_keeps_infinity(self):
+        calculator = src.calculator_backends.get_calculator('decimal')
+        self.assertEqual(
+            calculator.add(float('inf'), 1), decimal.Decimal('Infinity')
+        )
+
+    def test_every_backend_sends_message_when_inputs_are_not_numbers(self):
+        for backend in src.calculator_backends.BACKENDS:
+            calculator = src.calculator_backends.get_calculator(backend)
+            for bad_input in (
+                None,
+                True, False,
+                str(), 'text',
+                tuple(), list(), set(), dict(),
+            ):
+                for operation in self.operations:
+                    with self.subTest(
+                        backend=backend,
+                        operation=operation,
+                        bad_input=bad_input,
+                    ):
+                        function = calculator.__getattribute__(operation)
+                        self.assertEqual(
+                            function(bad_input, 1),
+                            'brmph?! Numbers only. Try again...'
+                        )
+                        self.assertEqual(
+                            function(1, bad_input),
+                            'brmph?! Numbers only. Try again...'
+                        )
+
+    def test_get_calculator_raises_key_error_w_unknown_backend(self):
+        with self.assertRaises(KeyError):
+            src.calculator_backends.get_calculator('roman')
+
+    def test_every_backend_agrees_on_operation_chains(self):
+        numbers = [number % 9 + 1 for number in range(100)]
+        for backend in src.calculator_backends.BACKENDS:
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    src.calculator_backends.run_chain(
+                        src.calculator_backends.get_calculator(backend),
+                        numbers,
+                    ),
+                    sum(numbers) - len(numbers)
+                )
+
+    def test_benchmark(self):
+        self.assertEqual(
+            list(src.calculator_backends.benchmark(length=10)),
+            ['float', 'decimal', 'fraction', 'integer']
+        )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# KeyError
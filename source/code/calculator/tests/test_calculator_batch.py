@@ -0,0 +1,121 @@
+import array
+import random
+import src.calculator_batch
+import unittest
+
+
+def a_random_number():
+    return random.triangular(-1000.0, 1000.0)
+
+
+def a_list_of_random_numbers(size=100):
+    return [a_random_number() for _ in range(size)]
+
+
+class TestCalculatorBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.first_numbers = a_list_of_random_numbers()
+        self.second_numbers = a_list_of_random_numbers()
+
+        x = self.first_numbers
+        y = self.second_numbers
+
+        self.calculator_tests = {
+            'add': [a+b for a, b in zip(x, y)],
+            'subtract': [a-b for a, b in zip(x, y)],
+            'multiply': [a*b for a, b in zip(x, y)],
+            'divide': [a/b for a, b in zip(x, y)],
+        }
+
+    def test_calculator_batch_functions(self):
+        for operation in self.calculator_tests:
+            with self.subTest(operation=operation):
+                self.assertEqual(
+                    src.calculator_batch.__getattribute__(operation)(
+                        self.first_numbers,
+                        self.second_numbers,
+                    ),
+                    self.calculator_tests[operation]
+                )
+
+    def test_calculator_batch_w_arrays(self):
+        first_numbers = array.array('d', self.first_numbers)
+        second_numbers = array.array('d', self.second_numbers)
+
+        for operation in self.calculator_tests:
+            with self.subTest(operation=operation):
+                self.assertEqual(
+                    src.calculator_batch.__getattribute__(operation)(
+                        first_numbers,
+                        memoryview(second_numbers),
+                    ),
+                    self.calculator_tests[operation]
+                )
+
+    def test_calculator_batch_sends_message_for_each_bad_input(self):
+        for bad_input in (
+            None,
+            True, False,
+            str(), 'text',
+            tuple(), (0, 1, 2, 'n'),
+            list(), [0, 1, 2, 'n'],
+            set(), {0, 1, 2, 'n'},
+            dict(), {'key': 'value'},
+        ):
+            first_numbers = self.first_numbers.copy()
+            first_numbers[1] = bad_input
+            second_numbers = self.second_numbers.copy()
+            second_numbers[-1] = bad_input
+
+            for operation in self.calculator_tests:
+                with self.subTest(
+                    operation=operation,
+                    bad_input=bad_input,
+                ):
+                    reality = src.calculator_batch.__getattribute__(
+                        operation
+                    )(first_numbers, second_numbers)
+                    my_expectation = self.calculator_tests[operation]
+
+                    self.assertEqual(
+                        reality[1],
+                        'brmph?! Numbers only. Try again...'
+                    )
+                    self.assertEqual(
+                        reality[-1],
+                        'brmph?! Numbers only. Try again...'
+                    )
+                    self.assertEqual(
+                        reality[2:-1], my_expectation[2:-1]
+                    )
+                    self.assertEqual(reality[0], my_expectation[0])
+
+    def test_calculator_batch_handles_zero_division(self):
+        self.second_numbers[0] = 0
+        self.assertEqual(
+            src.calculator_batch.divide(
+                self.first_numbers, self.second_numbers
+            ),
+            [
+                'brmph?! I cannot divide by 0. Try again...',
+                *self.calculator_tests['divide'][1:]
+            ]
+        )
+
+    def test_calculator_batch_raises_value_error_w_different_lengths(self):
+        for operation in self.calculator_tests:
+            with (
+                self.subTest(operation=operation),
+                self.assertRaises(ValueError),
+            ):
+                src.calculator_batch.__getattribute__(operation)(
+                    self.first_numbers, self.second_numbers[1:]
+                )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# ValueError
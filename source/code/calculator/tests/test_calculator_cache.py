@@ -0,0 +1,143 @@
+import decimal
+import random
+import src.calculator
+import src.calculator_cache
+import unittest
+
+
+def a_random_number():
+    return random.triangular(-1000.0, 1000.0)
+
+
+class Timer:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCalculatorCache(unittest.TestCase):
+
+    def setUp(self):
+        self.x = a_random_number()
+        self.y = a_random_number()
+        self.operations = ('add', 'subtract', 'multiply', 'divide')
+        for operation in self.operations:
+            src.calculator_cache.__getattribute__(operation).cache_clear()
+
+    def test_cached_calculator_functions(self):
+        for operation in self.operations:
+            with self.subTest(operation=operation):
+                function = src.calculator_cache.__getattribute__(
+                    operation
+                )
+                for _ in range(3):
+                    self.assertEqual(
+                        function(self.x, self.y),
+                        src.calculator.__getattribute__(operation)(
+                            self.x, self.y
+                        )
+                    )
+                self.assertEqual(
+                    function.cache_info(),
+                    (2, 1, 128, 1)
+                )
+
+    def test_cache_keeps_number_types_apart(self):
+        self.assertEqual(src.calculator_cache.add(1, 2), 3)
+        self.assertIsInstance(src.calculator_cache.add(1.0, 2.0), float)
+        self.assertEqual(src.calculator_cache.add.cache_info().misses, 2)
+
+    def test_cache_keeps_signed_zeros_apart(self):
+        for positive, negative in (
+            (0.0, -0.0),
+            (complex(0.0, 0.0), complex(0.0, -0.0)),
+            (decimal.Decimal('0'), decimal.Decimal('-0')),
+        ):
+            with self.subTest(positive=positive, negative=negative):
+                divide = src.calculator_cache.cache()(
+                    src.calculator.divide
+                )
+                self.assertEqual(divide(1, positive), divide(1, positive))
+                self.assertEqual(divide.cache_info().misses, 1)
+                divide(1, negative)
+                self.assertEqual(divide.cache_info().misses, 2)
+        multiply = src.calculator_cache.cache()(src.calculator.multiply)
+        self.assertEqual(str(multiply(0.0, 1.0)), '0.0')
+        self.assertEqual(str(multiply(-0.0, 1.0)), '-0.0')
+
+    def test_cache_stacks_w_check_input(self):
+        for bad_input in (None, 'text', [0, 1], {'key': 'value'}):
+            with self.subTest(bad_input=bad_input):
+                self.assertEqual(
+                    src.calculator_cache.multiply(bad_input, self.y),
+                    'brmph?! Numbers only. Try again...'
+                )
+        self.assertEqual(
+            src.calculator_cache.divide(self.x, 0),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+
+    def test_least_recently_used_eviction(self):
+        add = src.calculator_cache.cache(max_size=2)(
+            src.calculator.add
+        )
+        add(1, 1)
+        add(2, 2)
+        add(1, 1)
+        add(3, 3)
+        self.assertEqual(add.cache_info(), (1, 3, 2, 2))
+        add(1, 1)
+        self.assertEqual(add.cache_info(), (2, 3, 2, 2))
+        add(2, 2)
+        self.assertEqual(add.cache_info(), (2, 4, 2, 2))
+
+    def test_time_to_live_eviction(self):
+        timer = Timer()
+        add = src.calculator_cache.cache(ttl=10, timer=timer)(
+            src.calculator.add
+        )
+        add(1, 1)
+        timer.now = 9
+        add(1, 1)
+        self.assertEqual(add.cache_info(), (1, 1, 128, 1))
+        timer.now = 10
+        add(1, 1)
+        self.assertEqual(add.cache_info(), (1, 2, 128, 1))
+
+    def test_nan_is_not_cached(self):
+        nan = float('nan')
+        add = src.calculator_cache.cache()(src.calculator.add)
+        add(nan, 1.0)
+        add(nan, 1.0)
+        self.assertEqual(add.cache_info(), (0, 0, 128, 0))
+        for value in (complex(nan, 0), decimal.Decimal('NaN')):
+            with self.subTest(value=value):
+                add(value, value)
+                add(value, value)
+                self.assertEqual(add.cache_info(), (0, 0, 128, 0))
+
+        add = src.calculator_cache.cache(cache_nan=True)(
+            src.calculator.add
+        )
+        add(nan, 1.0)
+        add(nan, 1.0)
+        self.assertEqual(add.cache_info(), (1, 1, 128, 1))
+
+    def test_benchmark(self):
+        reality = src.calculator_cache.benchmark(
+            calls=10, distinct_pairs=(1, 5)
+        )
+        self.assertEqual(list(reality), list(self.operations))
+        for operation in self.operations:
+            with self.subTest(operation=operation):
+                self.assertEqual(list(reality[operation]), [1, 5])
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
@@ -0,0 +1,111 @@
+import random
+import src.calculator
+import src.calculator_expression
+import unittest
+
+
+def a_random_number():
+    return random.triangular(-1000.0, 1000.0)
+
+
+class TestCalculatorExpression(unittest.TestCase):
+
+    def setUp(self):
+        self.x = a_random_number()
+        self.y = a_random_number()
+
+    def test_evaluate_numbers(self):
+        for expression, my_expectation in (
+            ('3 * (4 + 2) / 7', 3 * (4 + 2) / 7),
+            ('1 + 2 * 3 - 4', 1 + 2 * 3 - 4),
+            ('-3 - -2', -3 - -2),
+            ('+5 * -(2 + 1)', +5 * -(2 + 1)),
+            ('2.5 / 0.5', 2.5 / 0.5),
+        ):
+            with self.subTest(expression=expression):
+                self.assertEqual(
+                    src.calculator_expression.evaluate(expression),
+                    my_expectation
+                )
+
+    def test_evaluate_variables(self):
+        self.assertEqual(
+            src.calculator_expression.evaluate(
+                'x * (y + 2) - x / 4', x=self.x, y=self.y
+            ),
+            src.calculator.subtract(
+                src.calculator.multiply(
+                    self.x, src.calculator.add(self.y, 2)
+                ),
+                src.calculator.divide(self.x, 4)
+            )
+        )
+
+    def test_evaluate_many(self):
+        bindings = [
+            {'x': a_random_number(), 'y': a_random_number()}
+            for _ in range(10)
+        ]
+        self.assertEqual(
+            src.calculator_expression.evaluate_many(
+                '(x - y) * x', bindings
+            ),
+            [
+                (variables['x']-variables['y']) * variables['x']
+                for variables in bindings
+            ]
+        )
+
+    def test_compiled_expressions_are_cached(self):
+        compile_expression = (
+            src.calculator_expression.compile_expression
+        )
+        compile_expression.cache_clear()
+
+        for _ in range(10):
+            src.calculator_expression.evaluate(
+                'x + y', x=self.x, y=self.y
+            )
+
+        self.assertEqual(compile_expression.cache_info().misses, 1)
+        self.assertEqual(compile_expression.cache_info().hits, 9)
+        self.assertEqual(
+            compile_expression('x + y'),
+            (
+                ('LOAD', 'x'),
+                ('LOAD', 'y'),
+                ('CALL', src.calculator.add),
+            )
+        )
+
+    def test_evaluate_handling_zero_division_error(self):
+        self.assertEqual(
+            src.calculator_expression.evaluate('1 + x / 0', x=self.x),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+
+    def test_evaluate_raises_key_error_w_missing_variables(self):
+        with self.assertRaises(KeyError):
+            src.calculator_expression.evaluate('x + y', x=self.x)
+
+    def test_evaluate_raises_syntax_error(self):
+        for expression in (
+            '1 +',
+            '2 ** 3',
+            'x(1)',
+            '"text"',
+            'True + 1',
+        ):
+            with (
+                self.subTest(expression=expression),
+                self.assertRaises(SyntaxError),
+            ):
+                src.calculator_expression.evaluate(expression)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# KeyError
+# SyntaxError
@@ -0,0 +1,158 @@
+import decimal
+import fractions
+import math
+import random
+import src.calculator_reduce
+import unittest
+
+
+def a_random_number():
+    return random.triangular(-1000.0, 1000.0)
+
+
+class TestCalculatorReduce(unittest.TestCase):
+
+    def setUp(self):
+        self.numbers = [a_random_number() for _ in range(10_000)]
+
+    def test_add_all(self):
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                self.assertAlmostEqual(
+                    src.calculator_reduce.add_all(
+                        self.numbers,
+                        chunk_size=1000,
+                        processes=processes,
+                    ),
+                    math.fsum(self.numbers),
+                    delta=1e-9,
+                )
+
+    def test_add_all_w_generators(self):
+        self.assertAlmostEqual(
+            src.calculator_reduce.add_all(
+                (number for number in self.numbers),
+                chunk_size=7,
+            ),
+            math.fsum(self.numbers),
+            delta=1e-9,
+        )
+
+    def test_multiply_all(self):
+        numbers = [
+            fractions.Fraction(random.randint(1, 9), random.randint(1, 9))
+            for _ in range(1000)
+        ]
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                self.assertEqual(
+                    src.calculator_reduce.multiply_all(
+                        numbers, chunk_size=100, processes=processes,
+                    ),
+                    math.prod(numbers)
+                )
+        self.assertEqual(
+            src.calculator_reduce.multiply_all(
+                iter(numbers), chunk_size=3
+            ),
+            math.prod(numbers)
+        )
+
+    def test_divide_all(self):
+        numbers = [fractions.Fraction(1024), 2, 4, 8]
+        self.assertEqual(
+            src.calculator_reduce.divide_all(numbers), 16
+        )
+        self.assertEqual(
+            src.calculator_reduce.divide_all(iter(numbers)), 16
+        )
+        self.assertEqual(
+            src.calculator_reduce.divide_all([5]), 5
+        )
+
+    def test_divide_all_divides_left_to_right(self):
+        for numbers in (
+            [1e-100, 1e-200, 1e-200, 1e300],
+            iter([1e-100, 1e-200, 1e-200, 1e300]),
+        ):
+            with self.subTest(numbers=numbers):
+                self.assertEqual(
+                    src.calculator_reduce.divide_all(
+                        numbers, chunk_size=2
+                    ),
+                    1.0
+                )
+
+    def test_divide_all_handling_zero_division(self):
+        self.assertEqual(
+            src.calculator_reduce.divide_all([1, 2, 0, 4]),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+
+    def test_empty_inputs(self):
+        self.assertEqual(src.calculator_reduce.add_all([]), 0)
+        self.assertEqual(src.calculator_reduce.multiply_all(iter([])), 1)
+        self.assertEqual(
+            src.calculator_reduce.divide_all([]),
+            'brmph?! Numbers only. Try again...'
+        )
+
+    def test_reduce_sends_message_when_inputs_are_not_numbers(self):
+        for bad_input in (
+            None,
+            True, False,
+            str(), 'text',
+            tuple(), list(), set(), dict(),
+        ):
+            numbers = self.numbers.copy()
+            numbers[-1] = bad_input
+            for function in (
+                src.calculator_reduce.add_all,
+                src.calculator_reduce.multiply_all,
+                src.calculator_reduce.divide_all,
+            ):
+                with self.subTest(
+                    function=function.__name__,
+                    bad_input=bad_input,
+                ):
+                    self.assertEqual(
+                        function(numbers, chunk_size=1000, processes=1),
+                        'brmph?! Numbers only. Try again...'
+                    )
+                    self.assertEqual(
+                        function(iter(numbers), chunk_size=1000),
+                        'brmph?! Numbers only. Try again...'
+                    )
+
+        self.assertEqual(
+            src.calculator_reduce.add_all(
+                self.numbers + ['text'], chunk_size=1000, processes=2,
+            ),
+            'brmph?! Numbers only. Try again...'
+        )
+
+    def test_reduce_sends_message_when_types_cannot_mix(self):
+        for function in (
+            src.calculator_reduce.add_all,
+            src.calculator_reduce.multiply_all,
+            src.calculator_reduce.divide_all,
+        ):
+            with self.subTest(function=function.__name__):
+                self.assertEqual(
+                    function([decimal.Decimal(1), 1.5]),
+                    'brmph?! Numbers only. Try again...'
+                )
+                self.assertEqual(
+                    function(
+                        [decimal.Decimal(1)] * 10 + [1.5],
+                        chunk_size=2, processes=2,
+                    ),
+                    'brmph?! Numbers only. Try again...'
+                )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
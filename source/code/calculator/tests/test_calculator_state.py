@@ -0,0 +1,120 @@
+import src.calculator_state
+import unittest
+
+
+class TestCalculatorState(unittest.TestCase):
+
+    def setUp(self):
+        self.state = src.calculator_state.CalculatorState()
+
+    def press(self, *keys):
+        for key in keys:
+            self.state.press(key)
+        return self.state.number
+
+    def test_starting_number(self):
+        self.assertEqual(self.state.number, '0')
+
+    def test_numbers(self):
+        self.assertEqual(self.press('0', '1', '2', '3'), '123')
+        self.assertEqual(self.press('.', '4', '.', '5'), '123.45')
+
+    def test_backspace(self):
+        self.assertEqual(self.press('1', '.', '2', '<-'), '1.')
+        self.assertEqual(self.press('<-', '.', '3'), '1.3')
+        self.assertEqual(self.press('<-', '<-', '<-', '<-'), '0')
+
+    def test_plus_minus(self):
+        self.assertEqual(self.press('7', '+/-'), '-7')
+        self.assertEqual(self.press('+/-'), '7')
+
+    def test_plus_minus_after_equals(self):
+        self.assertEqual(self.press('2', '+', '3', '=', '+/-'), '-5')
+        self.assertEqual(self.press('X', '2', '='), '-10')
+
+    def test_backspace_after_equals(self):
+        self.assertEqual(self.press('1', '2', '+', '3', '=', '<-'), '1')
+        self.assertEqual(self.press('2'), '12')
+        self.assertEqual(self.press('+', '1', '='), '13')
+
+    def test_backspace_after_result_w_exponent(self):
+        self.assertEqual(
+            self.press(
+                '9', '9', '9', '9', '9', '9', '9', '9', '.', '5', 'X',
+                '9', '9', '9', '9', '9', '9', '9', '9', '9', '=',
+            ),
+            str(99999999.5 * 999999999)
+        )
+        self.assertEqual(self.press('<-', '<-', '+'), '0')
+        self.assertEqual(self.press('2', '='), '2')
+
+    def test_backspace_after_infinite_result(self):
+        self.state.show(float('inf'))
+        self.assertEqual(self.press('<-'), '0')
+        self.assertEqual(self.press('+', '1', '='), '1')
+
+    def test_plus_minus_after_operation(self):
+        self.assertEqual(self.press('6', '+', '+/-'), '-6')
+        self.assertEqual(self.press('='), '0')
+
+    def test_operations(self):
+        for keys, my_expectation in (
+            (('7', '+', '8', '='), '15'),
+            (('7', '-', '8', '='), '-1'),
+            (('7', 'X', '8', '='), '56'),
+            (('7', '/', '8', '='), '0.875'),
+            (('1', '.', '5', '+', '2', '='), '3.5'),
+            (('7', '+/-', 'X', '2', '='), '-14'),
+        ):
+            with self.subTest(keys=keys):
+                self.state.press('AC')
+                self.assertEqual(self.press(*keys), my_expectation)
+
+    def test_operation_chains(self):
+        self.assertEqual(self.press('2', '+', '3', 'X'), '5')
+        self.assertEqual(self.press('4', '-'), '20')
+        self.assertEqual(self.press('1', '='), '19')
+        self.assertEqual(self.press('/', '2', '='), '9.5')
+
+    def test_changing_pending_operation(self):
+        self.assertEqual(self.press('6', '+', '-', 'X', '2', '='), '12')
+
+    def test_new_number_after_equals(self):
+        self.assertEqual(self.press('2', '+', '3', '=', '4'), '4')
+        self.assertEqual(self.press('X', '2', '='), '8')
+
+    def test_clear(self):
+        self.assertEqual(self.press('9', '+', '9', '9', 'C'), '0')
+        self.assertEqual(self.press('1', '='), '10')
+
+    def test_all_clear(self):
+        self.assertEqual(self.press('9', '+', '9', '9', 'AC'), '0')
+        self.assertEqual(self.press('1', '='), '1')
+        self.assertEqual(self.state.stack, [])
+        self.assertIsNone(self.state.pending)
+
+    def test_division_by_zero(self):
+        self.assertEqual(
+            self.press('9', '/', '0', '='),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+        self.assertEqual(
+            self.press('+'),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+        self.assertEqual(self.press('3'), '3')
+        self.assertEqual(self.press('/', '0', '=', 'C'), '0')
+        self.assertEqual(self.press('1', '='), '1')
+
+    def test_benchmark(self):
+        self.assertGreater(
+            src.calculator_state.benchmark(keypresses=1000), 0
+        )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# KeyError
+# ValueError
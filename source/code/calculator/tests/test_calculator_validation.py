@@ -0,0 +1,119 @@
+import decimal
+import fractions
+import random
+import src.calculator_validation
+import unittest
+
+
+def a_random_number():
+    return random.triangular(-1000.0, 1000.0)
+
+
+class TestCalculatorValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.operations = ('add', 'subtract', 'multiply', 'divide')
+
+    def test_calculator_w_every_number_type(self):
+        for x, y in (
+            (a_random_number(), a_random_number()),
+            (7, 3),
+            (complex(1, 2), complex(3, 4)),
+            (decimal.Decimal('1.1'), decimal.Decimal('2.2')),
+            (fractions.Fraction(1, 3), fractions.Fraction(2, 3)),
+        ):
+            calculator_tests = {
+                'add': x+y,
+                'subtract': x-y,
+                'multiply': x*y,
+                'divide': x/y,
+            }
+            for operation in self.operations:
+                with self.subTest(operation=operation, x=x, y=y):
+                    self.assertEqual(
+                        src.calculator_validation.__getattribute__(
+                            operation
+                        )(x, y),
+                        calculator_tests[operation]
+                    )
+
+    def test_calculator_sends_message_when_inputs_are_not_numbers(self):
+        for bad_input in (
+            None,
+            True, False,
+            str(), 'text',
+            tuple(), (0, 1, 2, 'n'),
+            list(), [0, 1, 2, 'n'],
+            set(), {0, 1, 2, 'n'},
+            dict(), {'key': 'value'},
+            object(),
+        ):
+            for operation in self.operations:
+                with self.subTest(
+                    operation=operation,
+                    bad_input=bad_input,
+                ):
+                    function = src.calculator_validation.__getattribute__(
+                        operation
+                    )
+                    self.assertEqual(
+                        function(bad_input, a_random_number()),
+                        'brmph?! Numbers only. Try again...'
+                    )
+                    self.assertEqual(
+                        function(a_random_number(), bad_input),
+                        'brmph?! Numbers only. Try again...'
+                    )
+
+    def test_calculator_sends_message_when_number_types_do_not_mix(self):
+        self.assertEqual(
+            src.calculator_validation.add(
+                decimal.Decimal('1.1'), 2.2
+            ),
+            'brmph?! Numbers only. Try again...'
+        )
+
+    def test_calculator_handling_zero_division_error(self):
+        self.assertEqual(
+            src.calculator_validation.divide(a_random_number(), 0),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+
+    def test_number_types_are_decided_once(self):
+        class Integer(int):
+            pass
+
+        is_number_type = src.calculator_validation.is_number_type
+        is_number_type.cache_clear()
+        self.addCleanup(is_number_type.cache_clear)
+
+        for _ in range(10):
+            src.calculator_validation.add(
+                a_random_number(), a_random_number()
+            )
+            src.calculator_validation.add(Integer(1), 2)
+            src.calculator_validation.add('text', 2)
+
+        self.assertEqual(is_number_type.cache_info().misses, 3)
+        self.assertEqual(is_number_type.cache_info().hits, 27)
+        self.assertNotIn(
+            Integer, src.calculator_validation.NUMBER_TYPES
+        )
+
+    def test_benchmark(self):
+        reality = src.calculator_validation.benchmark(number=10)
+        self.assertEqual(list(reality), list(self.operations))
+        for operation in self.operations:
+            with self.subTest(operation=operation):
+                self.assertEqual(
+                    sorted(reality[operation]),
+                    ['overhead_per_call', 'ratio', 'raw', 'wrapped']
+                )
+                self.assertGreater(reality[operation]['ratio'], 0)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
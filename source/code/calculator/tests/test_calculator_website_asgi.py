@@ -0,0 +1,139 @@
+import asyncio
+import json
+import src.calculator
+import src.website_asgi
+import tests.test_calculator
+import unittest
+
+
+def request(method, path, body=b''):
+    messages = []
+
+    async def receive():
+        return {
+            'type': 'http.request',
+            'body': body,
+            'more_body': False,
+        }
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(
+        src.website_asgi.app(
+            {'type': 'http', 'method': method, 'path': path},
+            receive, send,
+        )
+    )
+    return messages[0]['status'], messages[1]['body']
+
+
+class TestCalculatorWebsiteASGI(unittest.TestCase):
+
+    def setUp(self):
+        self.x = tests.test_calculator.a_random_number()
+        self.y = tests.test_calculator.a_random_number()
+
+    def test_batch_calculations(self):
+        status, body = request(
+            'POST', '/calculate/batch',
+            json.dumps([
+                {
+                    'first_input': self.x,
+                    'second_input': self.y,
+                    'operation': 'multiply',
+                },
+                {
+                    'first_input': self.x,
+                    'second_input': 0,
+                    'operation': 'divide',
+                },
+            ]).encode()
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(
+            json.loads(body),
+            [
+                src.calculator.multiply(self.x, self.y),
+                'brmph?! I cannot divide by 0. Try again...',
+            ]
+        )
+
+    def test_bad_requests(self):
+        for bad_request in (
+            b'not json',
+            b'[{"operation": "add"}]',
+            b'{"key": "value"}',
+        ):
+            with self.subTest(bad_request=bad_request):
+                status, _ = request(
+                    'POST', '/calculate/batch', bad_request
+                )
+                self.assertEqual(status, 400)
+
+    def test_results_that_are_not_json_numbers(self):
+        for first_input, second_input, operation in (
+            ('nan', 1, 'add'),
+            ('inf', 1, 'add'),
+            (1e308, 10, 'multiply'),
+        ):
+            with self.subTest(first_input=first_input):
+                status, _ = request(
+                    'POST', '/calculate/batch',
+                    json.dumps([{
+                        'first_input': first_input,
+                        'second_input': second_input,
+                        'operation': operation,
+                    }]).encode()
+                )
+                self.assertEqual(status, 400)
+
+    def test_unknown_path(self):
+        self.assertEqual(request('GET', '/calculate/batch')[0], 404)
+        self.assertEqual(request('POST', '/')[0], 404)
+
+    def test_lifespan(self):
+        messages = iter([
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message['type'])
+
+        asyncio.run(
+            src.website_asgi.app({'type': 'lifespan'}, receive, send)
+        )
+        self.assertEqual(
+            sent,
+            [
+                'lifespan.startup.complete',
+                'lifespan.shutdown.complete',
+            ]
+        )
+
+    def test_websocket(self):
+        sent = []
+
+        async def receive():
+            return {'type': 'websocket.connect'}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(
+            src.website_asgi.app(
+                {'type': 'websocket', 'path': '/'}, receive, send
+            )
+        )
+        self.assertEqual(sent, [{'type': 'websocket.close'}])
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# KeyError
@@ -0,0 +1,111 @@
+import src.calculator
+import src.website_batch
+import tests.test_calculator
+import unittest
+
+
+class TestCalculatorWebsiteBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.client = src.website_batch.app.test_client()
+        self.x = tests.test_calculator.a_random_number()
+        self.y = tests.test_calculator.a_random_number()
+        self.operations = {
+            'add': '+',
+            'subtract': '-',
+            'divide': '/',
+            'multiply': '*',
+        }
+
+    def test_calculations(self):
+        for operation in self.operations:
+            with self.subTest(operation=operation):
+                response = self.client.post(
+                    '/calculate',
+                    data={
+                        'first_input': self.x,
+                        'second_input': self.y,
+                        'operation': operation,
+                    }
+                )
+                self.assertEqual(response.status_code, 200)
+
+                function = src.calculator.__getattribute__(
+                    operation
+                )
+                result = function(self.x, self.y)
+                self.assertEqual(
+                    response.data.decode(),
+                    (
+                        f'<h2>{self.x} {self.operations[operation]} '
+                        f'{self.y} = {result}</h2>'
+                    )
+                )
+
+    def test_batch_calculations(self):
+        calculations = [
+            {
+                'first_input': self.x,
+                'second_input': self.y,
+                'operation': operation,
+            }
+            for operation in self.operations
+        ]
+        calculations.append({
+            'first_input': self.x,
+            'second_input': 0,
+            'operation': 'divide',
+        })
+
+        response = self.client.post(
+            '/calculate/batch', json=calculations
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json(),
+            [
+                src.calculator.add(self.x, self.y),
+                src.calculator.subtract(self.x, self.y),
+                src.calculator.divide(self.x, self.y),
+                src.calculator.multiply(self.x, self.y),
+                'brmph?! I cannot divide by 0. Try again...',
+            ]
+        )
+
+    def test_batch_calculations_w_bad_requests(self):
+        for bad_request in (
+            [{'first_input': self.x, 'second_input': self.y}],
+            [{
+                'first_input': self.x,
+                'second_input': self.y,
+                'operation': 'power',
+            }],
+            [{
+                'first_input': 'text',
+                'second_input': self.y,
+                'operation': 'add',
+            }],
+            {'key': 'value'},
+            [{
+                'first_input': 'nan',
+                'second_input': self.y,
+                'operation': 'add',
+            }],
+            [{
+                'first_input': 1e308,
+                'second_input': 10,
+                'operation': 'multiply',
+            }],
+        ):
+            with self.subTest(bad_request=bad_request):
+                response = self.client.post(
+                    '/calculate/batch', json=bad_request
+                )
+                self.assertEqual(response.status_code, 400)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# KeyError
+# ValueError
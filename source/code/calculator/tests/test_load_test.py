@@ -0,0 +1,131 @@
+import http.server
+import json
+import socket
+import src.load_test
+import threading
+import unittest
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        if self.path == '/fail':
+            self.send_response(500)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *arguments):
+        return None
+
+
+class TestLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(
+            ('127.0.0.1', 0), Handler
+        )
+        threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        ).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_form_data(self):
+        self.assertEqual(
+            src.load_test.form_data(1.5, 2.5, 'add'),
+            b'first_input=1.5&second_input=2.5&operation=add'
+        )
+
+    def test_batch_data(self):
+        self.assertEqual(
+            json.loads(
+                src.load_test.batch_data([(1.5, 2.5, 'add')])
+            ),
+            [{
+                'first_input': 1.5,
+                'second_input': 2.5,
+                'operation': 'add',
+            }]
+        )
+
+    def test_summarize(self):
+        reality = src.load_test.summarize(
+            [float(number) for number in range(1, 101)], 10
+        )
+        self.assertEqual(reality['requests'], 100)
+        self.assertEqual(reality['requests_per_second'], 10)
+        self.assertEqual(reality['p50'], 50.5)
+        self.assertAlmostEqual(reality['p99'], 99.99)
+
+    def test_summarize_w_no_requests(self):
+        self.assertEqual(
+            src.load_test.summarize([], 0),
+            {
+                'requests': 0,
+                'requests_per_second': 0,
+                'errors': 0,
+                'errors_by_kind': {},
+                'p50': 0,
+                'p99': 0,
+            }
+        )
+
+    def test_summarize_w_errors(self):
+        reality = src.load_test.summarize(
+            [1.0, 3.0], 2, [500, 500, 'ConnectionRefusedError']
+        )
+        self.assertEqual(reality['requests'], 5)
+        self.assertEqual(reality['requests_per_second'], 2.5)
+        self.assertEqual(reality['errors'], 3)
+        self.assertEqual(
+            reality['errors_by_kind'],
+            {500: 2, 'ConnectionRefusedError': 1}
+        )
+        self.assertEqual(reality['p50'], 2.0)
+
+    def test_run(self):
+        reality = src.load_test.run(
+            f'{self.url}/calculate',
+            src.load_test.form_data(1.5, 2.5, 'add'),
+            requests=20, clients=4,
+        )
+        self.assertEqual(reality['requests'], 20)
+        self.assertGreater(reality['requests_per_second'], 0)
+        self.assertLessEqual(reality['p50'], reality['p99'])
+
+    def test_run_counts_failed_requests(self):
+        reality = src.load_test.run(
+            f'{self.url}/fail',
+            src.load_test.form_data(1.5, 2.5, 'add'),
+            requests=10, clients=2,
+        )
+        self.assertEqual(reality['requests'], 10)
+        self.assertEqual(reality['errors'], 10)
+        self.assertEqual(reality['errors_by_kind'], {500: 10})
+        self.assertEqual(reality['p99'], 0)
+
+    def test_run_counts_refused_connections(self):
+        with socket.socket() as closed:
+            closed.bind(('127.0.0.1', 0))
+            port = closed.getsockname()[1]
+        reality = src.load_test.run(
+            f'http://127.0.0.1:{port}',
+            src.load_test.form_data(1.5, 2.5, 'add'),
+            requests=4, clients=2,
+        )
+        self.assertEqual(reality['requests'], 4)
+        self.assertEqual(reality['errors'], 4)
+        self.assertEqual(reality['errors_by_kind'], {'URLError': 4})
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# ConnectionRefusedError
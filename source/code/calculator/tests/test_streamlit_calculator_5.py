@@ -0,0 +1,56 @@
+import streamlit.testing.v1
+import unittest
+
+
+class TestStreamlitCalculator(unittest.TestCase):
+
+    def setUp(self):
+        self.tester = streamlit.testing.v1.AppTest.from_file(
+            'src/streamlit_calculator.py'
+        )
+        self.tester.run()
+
+    def click(self, *labels):
+        for label in labels:
+            self.tester.button(label).click().run()
+        return self.tester.session_state['calculator'].number
+
+    def test_streamlit_calculator_title(self):
+        self.assertEqual(self.tester.title[0].value, 'Calculator')
+
+    def test_streamlit_calculator_columns(self):
+        self.assertEqual(len(self.tester.columns), 4)
+        for column, labels in (
+            (0, ('<-', '7', '4', '1', '+/-')),
+            (1, ('C', '8', '5', '2', '0')),
+            (2, ('AC', '9', '6', '3', '.')),
+            (3, ('/', 'X', r'\-', r'\+', '=')),
+        ):
+            for label in labels:
+                with self.subTest(column=column, label=label):
+                    self.assertEqual(
+                        self.tester.columns[column].button(label).label,
+                        label
+                    )
+
+    def test_streamlit_calculator_state(self):
+        self.assertEqual(self.click('7', '.', '5'), '7.5')
+        self.assertEqual(self.click('<-', '+/-'), '-7.')
+        self.assertEqual(self.click('AC'), '0')
+
+    def test_streamlit_calculator_operations(self):
+        self.assertEqual(self.click('7', r'\+', '8', '='), '15')
+        self.assertEqual(self.click('X', '2', '='), '30')
+        self.assertEqual(self.click(r'\-', '3', '1', '='), '-1')
+        self.assertEqual(self.click('/', '4', '='), '-0.25')
+        self.assertEqual(
+            self.click('/', '0', '='),
+            'brmph?! I cannot divide by 0. Try again...'
+        )
+        self.assertEqual(self.click('C'), '0')
+
+
+# Exceptions seen
+# AssertionError
+# KeyError
+# streamlit.errors.StreamlitDuplicateElementKey
@@ -0,0 +1,119 @@
+import random
+import src.car
+import time
+
+
+def pack(
+        start_is_pressed, key_is_close=False,
+        brake_is_pressed=False, in_park=False,
+    ):
+    return (
+        bool(start_is_pressed)
+      | bool(key_is_close) << 1
+      | bool(brake_is_pressed) << 2
+      | bool(in_park) << 3
+    )
+
+
+TABLE = bytes(
+    src.car.ignition(*(bool(bits >> index & 1) for index in range(4)))
+    for bits in range(16)
+)
+
+
+TRUTHY = bytes([0]) + bytes([1]) * 255
+
+
+def to_bytes(column):
+    try:
+        flags = bytes(column)
+    except (TypeError, ValueError):
+        flags = b''
+    if len(flags) != len(column):
+        return bytes(map(bool, column))
+    return flags.translate(TRUTHY)
+
+
+def to_int(column):
+    return int.from_bytes(to_bytes(column), 'little')
+
+
+def ignition_many(
+        start_is_pressed, key_is_close,
+        brake_is_pressed, in_park,
+    ):
+    vehicles = len(start_is_pressed)
+    if not (
+        len(key_is_close) == len(brake_is_pressed) == len(in_park)
+        == vehicles
+    ):
+        raise ValueError('every column needs one value per vehicle')
+    return (
+        to_int(start_is_pressed)
+      & to_int(key_is_close)
+      & to_int(brake_is_pressed)
+      & to_int(in_park)
+    ).to_bytes(vehicles, 'little')
+
+
+class Fleet:
+
+    def __init__(self, vehicles):
+        self.sensors = bytearray(vehicles)
+        self.ignition = bytearray(vehicles)
+
+    def tick(self, readings):
+        sensors = self.sensors
+        ignition = self.ignition
+        changed = []
+        for vehicle, bits in readings.items():
+            if sensors[vehicle] == bits:
+                continue
+            state = TABLE[bits]
+            sensors[vehicle] = bits
+            if ignition[vehicle] != state:
+                ignition[vehicle] = state
+                changed.append(vehicle)
+        return changed
+
+
+def benchmark(vehicles=500_000, changes=0.01, seed=0):
+    generator = random.Random(seed)
+    columns = [
+        [generator.random() < 0.9 for _ in range(vehicles)]
+        for _ in range(4)
+    ]
+
+    start = time.perf_counter()
+    scalar = bytes(map(src.car.ignition, *columns))
+    scalar_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = ignition_many(*columns)
+    batch_duration = time.perf_counter() - start
+    if scalar != batch:
+        raise RuntimeError('ignition_many does not match src.car.ignition')
+
+    fleet = Fleet(vehicles)
+    fleet.tick(dict(enumerate(map(pack, *columns))))
+    readings = {
+        vehicle: generator.randrange(16)
+        for vehicle in generator.sample(
+            range(vehicles), int(vehicles*changes)
+        )
+    }
+    start = time.perf_counter()
+    fleet.tick(readings)
+    incremental_duration = time.perf_counter() - start
+
+    return (
+        vehicles, scalar_duration, batch_duration, incremental_duration,
+    )
+
+
+if __name__ == '__main__':
+    vehicles, scalar, batch, incremental = benchmark()
+    print(f'{vehicles:,} vehicles')
+    print(f'scalar:      {vehicles/scalar:,.0f}/s')
+    print(f'batch:       {vehicles/batch:,.0f}/s')
+    print(f'incremental: {incremental*1000:.2f}ms for a 1% change')
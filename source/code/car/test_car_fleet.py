@@ -0,0 +1,89 @@
+import array
+import itertools
+import src.car
+import src.car_fleet
+import unittest
+
+
+class TestCarFleet(unittest.TestCase):
+
+    def test_table_matches_ignition(self):
+        for values in itertools.product((True, False), repeat=4):
+            with self.subTest(values=values):
+                self.assertEqual(
+                    src.car_fleet.TABLE[src.car_fleet.pack(*values)],
+                    src.car.ignition(*values)
+                )
+
+    def test_ignition_many(self):
+        rows = list(itertools.product((True, False), repeat=4))
+        self.assertEqual(
+            src.car_fleet.ignition_many(*zip(*rows)),
+            bytes(itertools.starmap(src.car.ignition, rows))
+        )
+        self.assertEqual(
+            src.car_fleet.ignition_many([], [], [], []), b''
+        )
+
+    def test_ignition_many_w_truthy_values(self):
+        self.assertEqual(
+            src.car_fleet.ignition_many(
+                [2, 1, 'yes', 1], [1, 0, 1, 256], [1, 1, None, 3],
+                array.array('i', [-1, 1, 1, 1]),
+            ),
+            bytes([1, 0, 0, 1])
+        )
+
+    def test_ignition_many_raises_value_error_w_different_lengths(self):
+        with self.assertRaises(ValueError):
+            src.car_fleet.ignition_many([1, 1], [1, 1], [1], [1, 1])
+
+    def test_ignition_many_w_large_fleet(self):
+        vehicles = 10_000
+        columns = [
+            [(vehicle >> index) % 3 > 0 for vehicle in range(vehicles)]
+            for index in range(4)
+        ]
+        result = src.car_fleet.ignition_many(*columns)
+        self.assertEqual(len(result), vehicles)
+        self.assertEqual(result, bytes(map(src.car.ignition, *columns)))
+
+    def test_fleet_tick(self):
+        fleet = src.car_fleet.Fleet(3)
+        ready = src.car_fleet.pack(True, True, True, True)
+        self.assertEqual(fleet.tick({0: ready, 2: ready}), [0, 2])
+        self.assertEqual(fleet.ignition, bytearray([1, 0, 1]))
+        self.assertEqual(fleet.tick({0: ready, 2: ready}), [])
+        self.assertEqual(
+            fleet.tick({
+                0: src.car_fleet.pack(True, True, True, False),
+                1: src.car_fleet.pack(True, True, False, True),
+            }),
+            [0]
+        )
+        self.assertEqual(fleet.ignition, bytearray([0, 0, 1]))
+
+    def test_fleet_tick_raises_index_error_for_unknown_vehicle(self):
+        with self.assertRaises(IndexError):
+            src.car_fleet.Fleet(3).tick({3: 15})
+
+    def test_fleet_tick_leaves_sensors_alone_for_bad_readings(self):
+        fleet = src.car_fleet.Fleet(3)
+        with self.assertRaises(IndexError):
+            fleet.tick({1: 16})
+        self.assertEqual(fleet.sensors, bytearray(3))
+        self.assertEqual(fleet.ignition, bytearray(3))
+
+    def test_benchmark(self):
+        self.assertEqual(
+            src.car_fleet.benchmark(vehicles=1000)[0], 1000
+        )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# IndexError
+# ValueError
@@ -0,0 +1,211 @@
+import functools
+import heapq
+import random
+import src.elevator
+import src.simulation
+import time
+
+
+class Car:
+
+    def __init__(self, number, floor=0, controller=src.elevator.controller):
+        self.number = number
+        self.controller = controller
+        self.floor = floor
+        self.direction = 0
+        self.up = []
+        self.down = []
+        self.stops = set()
+        self.top = floor
+        self.bottom = floor
+        self.doors_closed = True
+        self.above_weight = False
+        self.emergency = False
+
+    def add_stop(self, floor):
+        if floor in self.stops:
+            return
+        self.stops.add(floor)
+        if floor > self.floor or (floor == self.floor and self.direction >= 0):
+            heapq.heappush(self.up, floor)
+            self.top = floor if len(self.up) == 1 else max(self.top, floor)
+        else:
+            heapq.heappush(self.down, -floor)
+            self.bottom = (
+                floor if len(self.down) == 1 else min(self.bottom, floor)
+            )
+
+    def next_stop(self):
+        if self.up and (self.direction >= 0 or not self.down):
+            self.direction = 1
+            return self.up[0]
+        if self.down:
+            self.direction = -1
+            return -self.down[0]
+        self.direction = 0
+        return None
+
+    def arrive(self):
+        if self.up and self.up[0] == self.floor:
+            heapq.heappop(self.up)
+        elif self.down and -self.down[0] == self.floor:
+            heapq.heappop(self.down)
+        self.stops.discard(self.floor)
+        if not self.up:
+            self.top = self.floor
+        if not self.down:
+            self.bottom = self.floor
+
+    def can_move(self):
+        return self.controller(
+            number_pushed=bool(self.stops),
+            doors_closed=self.doors_closed,
+            above_weight=self.above_weight,
+            emergency=self.emergency,
+        )
+
+    def move(self, target):
+        if not self.can_move():
+            return False
+        self.floor += 1 if target > self.floor else -1
+        return True
+
+
+class Dispatcher:
+
+    def __init__(self, cars, travel=1, dwell=3):
+        self.cars = cars
+        self.travel = travel
+        self.dwell = dwell
+
+    def cost(self, car, floor):
+        distance = abs(car.floor - floor)
+        ahead = (floor - car.floor) * car.direction >= 0
+        if not ahead:
+            turn = car.top if car.direction > 0 else car.bottom
+            distance = abs(car.floor - turn) + abs(turn - floor)
+        return distance * self.travel + len(car.stops) * self.dwell
+
+    def assign(self, floor):
+        car = min(
+            (car for car in self.cars if not car.emergency),
+            key=lambda car: self.cost(car, floor),
+            default=None,
+        )
+        if car is not None:
+            car.add_stop(floor)
+        return car
+
+
+class ElevatorBank:
+
+    def __init__(
+            self, seed=0, cars=4, floors=20, number=None, rate=0.2,
+            travel=1, dwell=3, controller=src.elevator.controller,
+        ):
+        self.random = random.Random(seed)
+        self.floors = floors
+        self.number = number
+        self.rate = rate
+        self.travel = travel
+        self.dwell = dwell
+        self.bank = [
+            Car(number, controller=controller) for number in range(cars)
+        ]
+        self.dispatcher = Dispatcher(self.bank, travel, dwell)
+        self.waiting = [{} for _ in self.bank]
+        self.moving = [False for _ in self.bank]
+        self.waits = []
+        self.dropped = 0
+        self.assignments = 0
+        self.assigning = 0
+
+    def start(self, simulation):
+        simulation.schedule(self.random.expovariate(self.rate), 'call')
+
+    def wake(self, simulation, car):
+        if not self.moving[car.number]:
+            self.moving[car.number] = True
+            simulation.schedule(0, 'move', car)
+
+    def call(self, simulation, event):
+        floor, destination = self.random.sample(range(self.floors), 2)
+        start = time.perf_counter()
+        car = self.dispatcher.assign(floor)
+        self.assigning += time.perf_counter() - start
+        self.assignments += 1
+        if car is None:
+            self.dropped += 1
+        else:
+            self.waiting[car.number].setdefault(floor, []).append(
+                (simulation.now, destination)
+            )
+            self.wake(simulation, car)
+        if self.number is None or self.assignments < self.number:
+            self.start(simulation)
+
+    def close(self, simulation, event):
+        event.target.doors_closed = True
+        simulation.schedule(0, 'move', event.target)
+
+    def move(self, simulation, event):
+        car = event.target
+        target = car.next_stop()
+        if target is None:
+            self.moving[car.number] = False
+        elif target == car.floor:
+            car.arrive()
+            car.doors_closed = False
+            for called, destination in self.waiting[car.number].pop(
+                car.floor, []
+            ):
+                self.waits.append(simulation.now - called)
+                car.add_stop(destination)
+            simulation.schedule(self.dwell, 'close', car)
+        elif car.move(target):
+            simulation.schedule(self.travel, 'move', car)
+        else:
+            self.moving[car.number] = False
+
+    def statistics(self, simulation):
+        return {
+            'calls': self.assignments,
+            'served': len(self.waits),
+            'dropped': self.dropped,
+            'average_wait': sum(self.waits) / max(len(self.waits), 1),
+            'assignments_per_second': (
+                self.assignments / self.assigning if self.assigning else 0
+            ),
+            'events': simulation.processed,
+        }
+
+
+def simulate(
+        cars=4, floors=20, number=10_000, rate=0.2,
+        travel=1, dwell=3, seed=0,
+    ):
+    return src.simulation.Simulation(
+        ElevatorBank(seed, cars, floors, number, rate, travel, dwell)
+    ).run()
+
+
+def simulate_week(runs=8, cars=4, floors=20, rate=0.2, processes=None):
+    return src.simulation.run_many(
+        functools.partial(
+            ElevatorBank, cars=cars, floors=floors, rate=rate
+        ),
+        runs,
+        until=7 * 24 * 60 * 60,
+        processes=processes,
+    )
+
+
+if __name__ == '__main__':
+    for name, value in simulate().items():
+        print(f'{name}: {value:,.2f}')
+    runs = 8
+    start = time.perf_counter()
+    week = simulate_week(runs)
+    print(f'\n{runs} simulated weeks in {time.perf_counter()-start:.2f}s')
+    for name, value in week.items():
+        print(f'{name}: {value:,.2f}')
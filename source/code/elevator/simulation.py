@@ -0,0 +1,73 @@
+import concurrent.futures
+import heapq
+import itertools
+import statistics
+
+
+class Event:
+
+    __slots__ = ('kind', 'target', 'data')
+
+    def __init__(self, kind, target=None, data=None):
+        self.kind = kind
+        self.target = target
+        self.data = data
+
+    def __repr__(self):
+        return f'Event({self.kind!r}, {self.target!r}, {self.data!r})'
+
+
+class Simulation:
+
+    def __init__(self, model):
+        self.model = model
+        self.now = 0
+        self.queue = []
+        self.sequence = itertools.count()
+        self.processed = 0
+        self.handlers = {}
+
+    def schedule(self, delay, kind, target=None, data=None):
+        heapq.heappush(
+            self.queue,
+            (self.now+delay, next(self.sequence), Event(kind, target, data))
+        )
+
+    def handler(self, kind):
+        try:
+            return self.handlers[kind]
+        except KeyError:
+            self.handlers[kind] = self.model.__getattribute__(kind)
+            return self.handlers[kind]
+
+    def run(self, until=float('inf')):
+        self.model.start(self)
+        queue = self.queue
+        while queue and queue[0][0] <= until:
+            self.now, _, event = heapq.heappop(queue)
+            self.handler(event.kind)(self, event)
+            self.processed += 1
+        if until != float('inf'):
+            self.now = until
+        return self.model.statistics(self)
+
+
+def run_once(model, seed, until):
+    return Simulation(model(seed)).run(until)
+
+
+def aggregate(results):
+    return {
+        key: statistics.fmean(result[key] for result in results)
+        for key in results[0]
+    }
+
+
+def run_many(model, runs, until, processes=None):
+    arguments = (
+        itertools.repeat(model), range(runs), itertools.repeat(until),
+    )
+    if processes == 1:
+        return aggregate(list(map(run_once, *arguments)))
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        return aggregate(list(executor.map(run_once, *arguments)))
@@ -0,0 +1,149 @@
+import src.elevator_dispatch
+import src.simulation
+import unittest
+
+
+class TestElevatorDispatch(unittest.TestCase):
+
+    def test_car_look_order(self):
+        car = src.elevator_dispatch.Car(0, floor=5)
+        for floor in (8, 2, 6, 1, 9):
+            car.add_stop(floor)
+
+        visited = []
+        while (target := car.next_stop()) is not None:
+            while car.floor != target:
+                self.assertTrue(car.move(target))
+            car.arrive()
+            visited.append(car.floor)
+        self.assertEqual(visited, [6, 8, 9, 2, 1])
+        self.assertEqual(car.direction, 0)
+
+    def test_car_ignores_duplicate_stops(self):
+        car = src.elevator_dispatch.Car(0)
+        car.add_stop(3)
+        car.add_stop(3)
+        self.assertEqual(car.up, [3])
+
+    def test_car_is_gated_by_controller(self):
+        car = src.elevator_dispatch.Car(0)
+        self.assertFalse(car.move(3))
+        car.add_stop(3)
+        for attribute, value in (
+            ('doors_closed', False),
+            ('above_weight', True),
+            ('emergency', True),
+        ):
+            with self.subTest(attribute=attribute):
+                car.__setattr__(attribute, value)
+                self.assertFalse(car.move(3))
+                self.assertEqual(car.floor, 0)
+                car.__setattr__(attribute, not value)
+        self.assertTrue(car.move(3))
+        self.assertEqual(car.floor, 1)
+
+    def test_dispatcher_assigns_nearest_car(self):
+        bank = [
+            src.elevator_dispatch.Car(number, floor)
+            for number, floor in enumerate((0, 10, 20))
+        ]
+        dispatcher = src.elevator_dispatch.Dispatcher(bank)
+        self.assertIs(dispatcher.assign(12), bank[1])
+        self.assertIs(dispatcher.assign(18), bank[2])
+        self.assertIs(dispatcher.assign(1), bank[0])
+
+    def test_dispatcher_prefers_car_heading_toward_call(self):
+        going_up = src.elevator_dispatch.Car(0, floor=4)
+        going_up.add_stop(15)
+        going_up.next_stop()
+        going_down = src.elevator_dispatch.Car(1, floor=6)
+        going_down.add_stop(0)
+        going_down.next_stop()
+        dispatcher = src.elevator_dispatch.Dispatcher([going_up, going_down])
+        self.assertIs(dispatcher.assign(8), going_up)
+
+    def test_dispatcher_skips_cars_in_emergency(self):
+        bank = [src.elevator_dispatch.Car(0), src.elevator_dispatch.Car(1, 9)]
+        bank[0].emergency = True
+        self.assertIs(
+            src.elevator_dispatch.Dispatcher(bank).assign(0), bank[1]
+        )
+
+    def test_dispatcher_returns_none_when_every_car_is_in_emergency(self):
+        bank = [src.elevator_dispatch.Car(0), src.elevator_dispatch.Car(1, 9)]
+        for car in bank:
+            car.emergency = True
+        self.assertIsNone(src.elevator_dispatch.Dispatcher(bank).assign(0))
+        self.assertEqual([car.stops for car in bank], [set(), set()])
+
+    def test_car_resets_turning_floors_after_last_stop(self):
+        car = src.elevator_dispatch.Car(0, floor=5)
+        car.add_stop(9)
+        car.add_stop(2)
+        self.assertEqual((car.top, car.bottom), (9, 2))
+        for target in (9, 2):
+            while car.floor != target:
+                car.next_stop()
+                self.assertTrue(car.move(target))
+            car.arrive()
+        self.assertEqual((car.top, car.bottom), (2, 2))
+        car.add_stop(4)
+        self.assertEqual(car.top, 4)
+
+    def test_simulate_stops_when_cars_cannot_move(self):
+        for emergency in (False, True):
+            with self.subTest(emergency=emergency):
+                bank = src.elevator_dispatch.ElevatorBank(
+                    cars=2, floors=5, number=50,
+                    controller=lambda **flags: False,
+                )
+                for car in bank.bank:
+                    car.emergency = emergency
+                result = src.simulation.Simulation(bank).run()
+                self.assertEqual(result['calls'], 50)
+                self.assertLess(result['served'], 50)
+                if emergency:
+                    self.assertEqual(result['dropped'], 50)
+
+    def test_simulate(self):
+        result = src.elevator_dispatch.simulate(
+            cars=3, floors=10, number=500
+        )
+        self.assertEqual(result['calls'], 500)
+        self.assertEqual(result['served'], 500)
+        self.assertGreater(result['average_wait'], 0)
+        self.assertEqual(result['dropped'], 0)
+
+    def test_more_cars_wait_less(self):
+        self.assertLess(
+            src.elevator_dispatch.simulate(cars=4, number=1000)[
+                'average_wait'
+            ],
+            src.elevator_dispatch.simulate(cars=1, number=1000)[
+                'average_wait'
+            ],
+        )
+
+    def test_car_w_controller(self):
+        car = src.elevator_dispatch.Car(
+            0, controller=lambda **flags: flags['number_pushed']
+        )
+        car.add_stop(3)
+        car.doors_closed = False
+        self.assertTrue(car.move(3))
+
+    def test_simulate_week(self):
+        result = src.elevator_dispatch.simulate_week(
+            runs=2, cars=2, floors=5, rate=0.001, processes=1
+        )
+        self.assertGreater(result['calls'], 500)
+        self.assertLessEqual(result['served'], result['calls'])
+        self.assertGreater(result['events'], result['calls'])
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# ZeroDivisionError
@@ -0,0 +1,94 @@
+import functools
+import src.simulation
+import unittest
+
+
+class Clock:
+
+    def __init__(self, seed=0, interval=1):
+        self.interval = interval
+        self.times = []
+
+    def start(self, simulation):
+        simulation.schedule(self.interval, 'tick')
+
+    def tick(self, simulation, event):
+        self.times.append(simulation.now)
+        simulation.schedule(self.interval, 'tick')
+
+    def statistics(self, simulation):
+        return {
+            'ticks': len(self.times),
+            'last': self.times[-1],
+        }
+
+
+class Ordering:
+
+    def __init__(self):
+        self.seen = []
+
+    def start(self, simulation):
+        simulation.schedule(2, 'record', data='third')
+        simulation.schedule(1, 'record', data='first')
+        simulation.schedule(1, 'record', data='second')
+
+    def record(self, simulation, event):
+        self.seen.append((simulation.now, event.data))
+
+    def statistics(self, simulation):
+        return self.seen
+
+
+class TestSimulation(unittest.TestCase):
+
+    def test_event_has_slots(self):
+        event = src.simulation.Event('tick', 'target', 'data')
+        with self.assertRaises(AttributeError):
+            event.__dict__
+        self.assertEqual(repr(event), "Event('tick', 'target', 'data')")
+
+    def test_events_run_in_time_then_schedule_order(self):
+        self.assertEqual(
+            src.simulation.Simulation(Ordering()).run(),
+            [(1, 'first'), (1, 'second'), (2, 'third')]
+        )
+
+    def test_run_until(self):
+        simulation = src.simulation.Simulation(Clock(interval=3))
+        self.assertEqual(
+            simulation.run(until=10), {'ticks': 3, 'last': 9}
+        )
+        self.assertEqual(simulation.now, 10)
+        self.assertEqual(simulation.processed, 3)
+
+    def test_unknown_event_kind(self):
+        simulation = src.simulation.Simulation(Ordering())
+        simulation.schedule(0, 'unknown')
+        with self.assertRaises(AttributeError):
+            simulation.run()
+
+    def test_aggregate(self):
+        self.assertEqual(
+            src.simulation.aggregate([{'a': 1, 'b': 4}, {'a': 3, 'b': 6}]),
+            {'a': 2, 'b': 5}
+        )
+
+    def test_run_many(self):
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                self.assertEqual(
+                    src.simulation.run_many(
+                        functools.partial(Clock, interval=2),
+                        runs=3, until=100, processes=processes,
+                    ),
+                    {'ticks': 50, 'last': 100}
+                )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# PicklingError
@@ -0,0 +1,214 @@
+import asyncio
+import collections
+import functools
+import math
+import random
+import src.microwave
+import statistics
+import time
+
+
+class Timer:
+
+    __slots__ = ('deadline', 'callback', 'rounds', 'cancelled')
+
+    def __init__(self, deadline, callback, rounds):
+        self.deadline = deadline
+        self.callback = callback
+        self.rounds = rounds
+        self.cancelled = False
+
+
+class TimerWheel:
+
+    def __init__(
+            self, resolution=0.01, slots=512,
+            clock=time.monotonic, history=100_000,
+        ):
+        self.resolution = resolution
+        self.slots = [[] for _ in range(slots)]
+        self.clock = clock
+        self.start = clock()
+        self.ticks = 0
+        self.pending = 0
+        self.latencies = collections.deque(maxlen=history)
+
+    def now(self):
+        return self.clock()
+
+    def schedule(self, delay, callback):
+        deadline = self.now() + delay
+        target = max(
+            math.ceil((deadline - self.start) / self.resolution),
+            self.ticks + 1,
+        )
+        timer = Timer(
+            deadline, callback,
+            (target - self.ticks - 1) // len(self.slots),
+        )
+        self.slots[target % len(self.slots)].append(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer):
+        if not timer.cancelled:
+            timer.cancelled = True
+            self.pending -= 1
+
+    def next_tick(self):
+        return self.start + (self.ticks+1) * self.resolution
+
+    def advance(self, now=None):
+        if now is None:
+            now = self.now()
+        while self.next_tick() <= now:
+            self.ticks += 1
+            slot = self.ticks % len(self.slots)
+            timers, self.slots[slot] = self.slots[slot], []
+            for timer in timers:
+                if timer.cancelled:
+                    continue
+                if timer.rounds:
+                    timer.rounds -= 1
+                    self.slots[slot].append(timer)
+                    continue
+                timer.cancelled = True
+                self.pending -= 1
+                self.latencies.append(now - timer.deadline)
+                timer.callback()
+
+    async def run(self, until_idle=True):
+        while self.pending or not until_idle:
+            await asyncio.sleep(max(0, self.next_tick() - self.now()))
+            self.advance()
+
+    def statistics(self):
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {}
+        return {
+            'fired': len(latencies),
+            'mean_latency': statistics.fmean(latencies),
+            'p99_latency': latencies[int(0.99 * (len(latencies)-1))],
+            'max_latency': latencies[-1],
+            'jitter': statistics.pstdev(latencies),
+        }
+
+
+class Appliance:
+
+    __slots__ = (
+        'closed_door', 'pressed_start', 'set_timer', 'too_hot',
+        'running', 'remaining', 'started', 'timer',
+    )
+
+    def __init__(self):
+        self.closed_door = False
+        self.pressed_start = False
+        self.set_timer = False
+        self.too_hot = False
+        self.running = False
+        self.remaining = 0
+        self.started = 0
+        self.timer = None
+
+
+class Runtime:
+
+    def __init__(
+            self, appliances, wheel=None,
+            controller=src.microwave.microwave,
+        ):
+        self.wheel = wheel or TimerWheel()
+        self.controller = controller
+        self.appliances = [Appliance() for _ in range(appliances)]
+        self.completed = 0
+        self.checks = 0
+
+    def change(self, number, **flags):
+        appliance = self.appliances[number]
+        for name, value in flags.items():
+            appliance.__setattr__(name, value)
+        self.update(number)
+
+    def cook(self, number, seconds):
+        self.appliances[number].remaining = seconds
+        self.change(
+            number, set_timer=True, closed_door=True, pressed_start=True
+        )
+
+    def update(self, number):
+        appliance = self.appliances[number]
+        self.checks += 1
+        running = self.controller(
+            closed_door=appliance.closed_door,
+            pressed_start=appliance.pressed_start,
+            set_timer=appliance.set_timer,
+            too_hot=appliance.too_hot,
+        )
+        if running == appliance.running:
+            return
+        appliance.running = running
+        now = self.wheel.now()
+        if running:
+            appliance.started = now
+            appliance.timer = self.wheel.schedule(
+                appliance.remaining, functools.partial(self.finish, number)
+            )
+        else:
+            self.wheel.cancel(appliance.timer)
+            appliance.remaining -= now - appliance.started
+
+    def finish(self, number):
+        self.completed += 1
+        self.change(
+            number, set_timer=False, pressed_start=False, closed_door=False
+        )
+
+    def status(self, number):
+        appliance = self.appliances[number]
+        if appliance.running:
+            return max(
+                0, appliance.remaining - (self.wheel.now()-appliance.started)
+            )
+        return appliance.remaining
+
+
+async def benchmark(appliances=5_000, door_opens=0.1, seed=0):
+    generator = random.Random(seed)
+    runtime = Runtime(appliances)
+    for number in range(appliances):
+        seconds = generator.uniform(0.1, 1)
+        runtime.cook(number, seconds)
+        if generator.random() < door_opens:
+            runtime.wheel.schedule(
+                generator.uniform(0, seconds),
+                functools.partial(
+                    runtime.change, number,
+                    closed_door=False, pressed_start=False,
+                )
+            )
+            runtime.wheel.schedule(
+                seconds,
+                functools.partial(
+                    runtime.change, number,
+                    closed_door=True, pressed_start=True,
+                )
+            )
+
+    start = time.perf_counter()
+    await runtime.wheel.run()
+    return (
+        runtime.completed, time.perf_counter() - start,
+        runtime.wheel.statistics(),
+    )
+
+
+if __name__ == '__main__':
+    completed, duration, timers = asyncio.run(benchmark())
+    print(f'{completed:,} microwaves finished in {duration:.2f}s')
+    for name, value in timers.items():
+        if name == 'fired':
+            print(f'{name}: {value:,}')
+        else:
+            print(f'{name}: {value*1000:.3f}ms')
@@ -0,0 +1,150 @@
+import functools
+import random
+import src.microwave
+import src.simulation
+import time
+
+
+class Appliance:
+
+    __slots__ = (
+        'number', 'closed_door', 'pressed_start', 'set_timer', 'too_hot',
+        'running', 'remaining', 'started', 'version',
+    )
+
+    def __init__(self, number):
+        self.number = number
+        self.closed_door = False
+        self.pressed_start = False
+        self.set_timer = False
+        self.too_hot = False
+        self.running = False
+        self.remaining = 0
+        self.started = 0
+        self.version = 0
+
+
+class Kitchen:
+
+    def __init__(
+            self, seed=0, appliances=100, gap=30*60,
+            door_opens=0.1, overheats=0.02,
+            controller=src.microwave.microwave,
+        ):
+        self.random = random.Random(seed)
+        self.appliances = [Appliance(number) for number in range(appliances)]
+        self.gap = gap
+        self.door_opens = door_opens
+        self.overheats = overheats
+        self.controller = controller
+        self.completed = 0
+        self.interruptions = 0
+        self.cooking = 0
+        self.checks = 0
+
+    def start(self, simulation):
+        for appliance in self.appliances:
+            self.next_user(simulation, appliance)
+
+    def next_user(self, simulation, appliance):
+        simulation.schedule(
+            self.random.expovariate(1/self.gap), 'arrive', appliance
+        )
+
+    def update(self, simulation, appliance):
+        self.checks += 1
+        running = self.controller(
+            closed_door=appliance.closed_door,
+            pressed_start=appliance.pressed_start,
+            set_timer=appliance.set_timer,
+            too_hot=appliance.too_hot,
+        )
+        if running == appliance.running:
+            return
+        appliance.running = running
+        appliance.version += 1
+        if running:
+            appliance.started = simulation.now
+            simulation.schedule(
+                appliance.remaining, 'done', appliance, appliance.version
+            )
+        else:
+            elapsed = simulation.now - appliance.started
+            appliance.remaining -= elapsed
+            self.cooking += elapsed
+            self.interruptions += appliance.set_timer
+
+    def arrive(self, simulation, event):
+        appliance = event.target
+        duration = self.random.randrange(30, 300)
+        appliance.remaining = duration
+        appliance.set_timer = True
+        appliance.closed_door = True
+        appliance.pressed_start = True
+        self.update(simulation, appliance)
+        if self.random.random() < self.door_opens:
+            simulation.schedule(
+                self.random.uniform(0, duration), 'open', appliance
+            )
+        if self.random.random() < self.overheats:
+            simulation.schedule(
+                self.random.uniform(0, duration), 'overheat', appliance
+            )
+
+    def open(self, simulation, event):
+        event.target.closed_door = False
+        event.target.pressed_start = False
+        self.update(simulation, event.target)
+        simulation.schedule(5, 'close', event.target)
+
+    def close(self, simulation, event):
+        event.target.closed_door = True
+        event.target.pressed_start = True
+        self.update(simulation, event.target)
+
+    def overheat(self, simulation, event):
+        event.target.too_hot = True
+        self.update(simulation, event.target)
+        simulation.schedule(60, 'cool', event.target)
+
+    def cool(self, simulation, event):
+        event.target.too_hot = False
+        self.update(simulation, event.target)
+
+    def done(self, simulation, event):
+        appliance = event.target
+        if event.data != appliance.version:
+            return
+        appliance.set_timer = False
+        appliance.pressed_start = False
+        appliance.closed_door = False
+        self.update(simulation, appliance)
+        self.completed += 1
+        self.next_user(simulation, appliance)
+
+    def statistics(self, simulation):
+        return {
+            'completed': self.completed,
+            'interruptions': self.interruptions,
+            'cooking_hours': self.cooking / 3600,
+            'controller_checks': self.checks,
+            'events': simulation.processed,
+        }
+
+
+def simulate_week(runs=8, appliances=100, processes=None):
+    return src.simulation.run_many(
+        functools.partial(Kitchen, appliances=appliances),
+        runs,
+        until=7 * 24 * 60 * 60,
+        processes=processes,
+    )
+
+
+if __name__ == '__main__':
+    runs = 8
+    start = time.perf_counter()
+    week = simulate_week(runs)
+    print(f'{runs} simulated weeks in {time.perf_counter()-start:.2f}s')
+    for name, value in week.items():
+        print(f'{name}: {value:,.2f}')
@@ -0,0 +1,145 @@
+import asyncio
+import src.microwave_runtime
+import unittest
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.wheel = src.microwave_runtime.TimerWheel(
+            resolution=1, slots=4, clock=self.clock
+        )
+        self.fired = []
+
+    def schedule(self, delay, name):
+        return self.wheel.schedule(
+            delay, lambda: self.fired.append((self.clock.now, name))
+        )
+
+    def test_timers_fire_in_order(self):
+        self.schedule(3, 'third')
+        self.schedule(1, 'first')
+        self.schedule(1.5, 'second')
+        self.assertEqual(self.wheel.pending, 3)
+        for now in range(1, 4):
+            self.clock.now = now
+            self.wheel.advance()
+        self.assertEqual(
+            self.fired, [(1, 'first'), (2, 'second'), (3, 'third')]
+        )
+        self.assertEqual(self.wheel.pending, 0)
+
+    def test_timers_longer_than_one_turn(self):
+        self.schedule(9, 'late')
+        self.clock.now = 8
+        self.wheel.advance()
+        self.assertEqual(self.fired, [])
+        self.clock.now = 9
+        self.wheel.advance()
+        self.assertEqual(self.fired, [(9, 'late')])
+
+    def test_zero_delay_fires_on_next_tick(self):
+        self.schedule(0, 'now')
+        self.wheel.advance()
+        self.assertEqual(self.fired, [])
+        self.clock.now = 1
+        self.wheel.advance()
+        self.assertEqual(self.fired, [(1, 'now')])
+
+    def test_cancel(self):
+        timer = self.schedule(2, 'cancelled')
+        self.wheel.cancel(timer)
+        self.wheel.cancel(timer)
+        self.assertEqual(self.wheel.pending, 0)
+        self.clock.now = 5
+        self.wheel.advance()
+        self.assertEqual(self.fired, [])
+
+    def test_latency_statistics(self):
+        self.assertEqual(self.wheel.statistics(), {})
+        self.schedule(1, 'on time')
+        self.schedule(2, 'late')
+        self.clock.now = 1
+        self.wheel.advance()
+        self.clock.now = 4
+        self.wheel.advance()
+        statistics = self.wheel.statistics()
+        self.assertEqual(statistics['fired'], 2)
+        self.assertEqual(statistics['mean_latency'], 1)
+        self.assertEqual(statistics['max_latency'], 2)
+        self.assertEqual(statistics['jitter'], 1)
+
+
+class TestRuntime(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.runtime = src.microwave_runtime.Runtime(
+            2,
+            wheel=src.microwave_runtime.TimerWheel(
+                resolution=1, slots=8, clock=self.clock
+            ),
+        )
+
+    def advance(self, now):
+        self.clock.now = now
+        self.runtime.wheel.advance()
+
+    def test_cook(self):
+        self.runtime.cook(0, 3)
+        self.assertTrue(self.runtime.appliances[0].running)
+        self.assertFalse(self.runtime.appliances[1].running)
+        self.advance(2)
+        self.assertEqual(self.runtime.status(0), 1)
+        self.advance(3)
+        self.assertEqual(self.runtime.completed, 1)
+        self.assertFalse(self.runtime.appliances[0].running)
+        self.assertEqual(self.runtime.checks, 2)
+
+    def test_door_opened_mid_cook_pauses_countdown(self):
+        self.runtime.cook(0, 3)
+        self.advance(1)
+        self.runtime.change(0, closed_door=False)
+        self.assertFalse(self.runtime.appliances[0].running)
+        self.advance(10)
+        self.assertEqual(self.runtime.completed, 0)
+        self.assertEqual(self.runtime.status(0), 2)
+        self.runtime.change(0, closed_door=True)
+        self.advance(11)
+        self.assertEqual(self.runtime.completed, 0)
+        self.advance(12)
+        self.assertEqual(self.runtime.completed, 1)
+
+    def test_overheating_stops_cooking(self):
+        self.runtime.cook(1, 2)
+        self.runtime.change(1, too_hot=True)
+        self.advance(5)
+        self.assertEqual(self.runtime.completed, 0)
+        self.runtime.change(1, too_hot=False)
+        self.advance(7)
+        self.assertEqual(self.runtime.completed, 1)
+
+    def test_benchmark(self):
+        completed, _, timers = asyncio.run(
+            src.microwave_runtime.benchmark(appliances=200)
+        )
+        self.assertEqual(completed, 200)
+        self.assertGreaterEqual(timers['fired'], 200)
+        self.assertGreaterEqual(timers['mean_latency'], 0)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
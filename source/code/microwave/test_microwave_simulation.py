@@ -0,0 +1,69 @@
+import src.microwave_simulation
+import src.simulation
+import unittest
+
+
+class TestMicrowaveSimulation(unittest.TestCase):
+
+    def simulate(self, **options):
+        return src.simulation.Simulation(
+            src.microwave_simulation.Kitchen(**options)
+        ).run(until=24*60*60)
+
+    def test_kitchen_without_interruptions(self):
+        result = self.simulate(appliances=5, door_opens=0, overheats=0)
+        self.assertGreater(result['completed'], 100)
+        self.assertEqual(result['interruptions'], 0)
+        self.assertGreaterEqual(
+            result['controller_checks'], 2 * result['completed']
+        )
+        self.assertLessEqual(
+            result['controller_checks'], 2 * result['completed'] + 5
+        )
+
+    def test_interruptions_pause_the_timer(self):
+        result = self.simulate(appliances=1, door_opens=1, overheats=0)
+        self.assertGreater(result['completed'], 0)
+        self.assertGreaterEqual(
+            result['interruptions'], result['completed']
+        )
+
+    def test_controller_is_checked_on_every_state_change(self):
+        calls = []
+
+        def controller(**flags):
+            calls.append(flags)
+            return False
+
+        result = self.simulate(
+            appliances=2, door_opens=0, overheats=0, controller=controller
+        )
+        self.assertEqual(result['completed'], 0)
+        self.assertEqual(result['controller_checks'], len(calls))
+        self.assertEqual(
+            calls[0],
+            {
+                'closed_door': True,
+                'pressed_start': True,
+                'set_timer': True,
+                'too_hot': False,
+            }
+        )
+
+    def test_overheating_stops_cooking(self):
+        result = self.simulate(appliances=3, door_opens=0, overheats=1)
+        self.assertGreater(result['interruptions'], 0)
+
+    def test_simulate_week(self):
+        result = src.microwave_simulation.simulate_week(
+            runs=2, appliances=2, processes=1
+        )
+        self.assertGreater(result['completed'], 500)
+        self.assertGreater(result['events'], result['completed'])
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
@@ -0,0 +1,79 @@
+import array
+import datetime
+import src.person
+import src.person_table
+import time
+
+
+class AgeService:
+
+    def __init__(self, clock=datetime.date.today):
+        self.clock = clock
+        self.refresh()
+        self.Person = type(
+            'Person',
+            (src.person_table.Person,),
+            {
+                '__slots__': (),
+                'calculate_age': staticmethod(self.calculate_age),
+            },
+        )
+
+    def refresh(self):
+        self.today = self.clock()
+        self.ages = {}
+
+    def calculate_age(self, year_of_birth):
+        if not isinstance(year_of_birth, int):
+            raise TypeError
+        try:
+            return self.ages[year_of_birth]
+        except KeyError:
+            age = self.today.year - year_of_birth
+            if age > 120:
+                raise ValueError
+            self.ages[year_of_birth] = age
+            return age
+
+    def calculate_ages(self, years_of_birth):
+        years = array.array('i', years_of_birth)
+        if years and self.today.year - min(years) > 120:
+            raise ValueError
+        return array.array('i', map(self.today.year.__sub__, years))
+
+    def say_hello(self, first_name, last_name, year_of_birth):
+        return (
+            f'Hello, my name is {first_name}'
+            f' {last_name} and I am'
+            f' {self.calculate_age(year_of_birth)}.'
+        )
+
+    def table(self, strings=None):
+        return src.person_table.PersonTable(strings, self.calculate_age)
+
+
+def benchmark(number=10_000_000):
+    rows = [
+        ('first_name', 'last_name', 'F', 1920 + index % 100)
+        for index in range(number)
+    ]
+
+    start = time.perf_counter()
+    for row in rows:
+        src.person.Person(*row)
+    today_per_person = time.perf_counter() - start
+
+    service = AgeService()
+    start = time.perf_counter()
+    for row in rows:
+        service.Person(*row)
+    one_today = time.perf_counter() - start
+
+    return number, today_per_person, one_today
+
+
+if __name__ == '__main__':
+    number, today_per_person, one_today = benchmark()
+    print(f'{number:,} people')
+    print(f'date.today() per person:  {today_per_person:.2f}s')
+    print(f'one date.today() + cache: {one_today:.2f}s')
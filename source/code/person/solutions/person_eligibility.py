@@ -0,0 +1,109 @@
+import collections
+import concurrent.futures
+import itertools
+import random
+import src.person_table
+import time
+
+
+ADULT = next(
+    age for age in range(256)
+    if src.person_table.Person.check_age(age, True)
+)
+FLAGS = {
+    'can_vote': 'is_citizen',
+    'can_get_license': 'passed_test',
+}
+
+
+def to_int(mask):
+    return int.from_bytes(mask, 'little')
+
+
+def both(first, second):
+    return (to_int(first) & to_int(second)).to_bytes(len(first), 'little')
+
+
+def adults(ages):
+    return bytes(map(ADULT.__le__, ages))
+
+
+def eligible(ages, flags):
+    return both(adults(ages), bytes(flags))
+
+
+def mask(table, query):
+    return eligible(table.ages, table.__getattribute__(FLAGS[query]))
+
+
+def can_vote(table):
+    return mask(table, 'can_vote')
+
+
+def can_get_license(table):
+    return mask(table, 'can_get_license')
+
+
+def count(a_mask):
+    return a_mask.count(1)
+
+
+def group_by(a_mask, keys):
+    if len(keys) != len(a_mask):
+        raise ValueError('keys must have one value per person')
+    return collections.Counter(itertools.compress(keys, a_mask))
+
+
+def count_chunk(ages, flags, keys):
+    return group_by(eligible(ages, flags), keys)
+
+
+def eligible_by_group(
+        table, keys, query='can_vote',
+        processes=None, chunk_size=1_000_000,
+    ):
+    if len(keys) != len(table):
+        raise ValueError('keys must have one value per person')
+    flags = table.__getattribute__(FLAGS[query])
+    if processes == 1 or len(table) <= chunk_size:
+        return count_chunk(table.ages, flags, keys)
+
+    starts = range(0, len(table), chunk_size)
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        return sum(
+            executor.map(
+                count_chunk,
+                (table.ages[start:start+chunk_size] for start in starts),
+                (flags[start:start+chunk_size] for start in starts),
+                (keys[start:start+chunk_size] for start in starts),
+            ),
+            collections.Counter()
+        )
+
+
+def benchmark(number=1_000_000, regions=50):
+    generator = random.Random(0)
+    table = src.person_table.PersonTable()
+    table.extend(src.person_table.people(number))
+    keys = [generator.randrange(regions) for _ in range(number)]
+
+    start = time.perf_counter()
+    per_object = collections.Counter(
+        key for key, person in zip(keys, table) if person.can_vote()
+    )
+    per_object_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = eligible_by_group(table, keys)
+    vectorized_duration = time.perf_counter() - start
+
+    if per_object != vectorized:
+        raise RuntimeError('vectorized counts do not match Person.can_vote')
+    return number, per_object_duration, vectorized_duration
+
+
+if __name__ == '__main__':
+    number, per_object, vectorized = benchmark()
+    print(f'{number:,} people, eligible voters per region')
+    print(f'per object: {per_object:.2f}s')
+    print(f'vectorized: {vectorized:.3f}s')
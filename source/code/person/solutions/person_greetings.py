@@ -0,0 +1,144 @@
+import io
+import itertools
+import src.person
+import src.person_age
+import src.person_table
+import string
+import time
+
+
+GREETING = 'Hello, my name is {first_name} {last_name} and I am {age}.'
+
+
+class Numbers(dict):
+
+    def __missing__(self, number):
+        self[number] = str(number)
+        return self[number]
+
+
+NUMBERS = Numbers()
+
+
+def pooled(name):
+    def column(table, start, stop):
+        return map(
+            table.strings.values.__getitem__,
+            table.__getattribute__(name)[start:stop]
+        )
+    return column
+
+
+def numbers(name):
+    def column(table, start, stop):
+        return map(
+            NUMBERS.__getitem__,
+            table.__getattribute__(name)[start:stop]
+        )
+    return column
+
+
+def flags(name):
+    def column(table, start, stop):
+        return map(
+            ('False', 'True').__getitem__,
+            table.__getattribute__(name)[start:stop]
+        )
+    return column
+
+
+COLUMNS = {
+    'first_name': pooled('first_names'),
+    'last_name': pooled('last_names'),
+    'sex': pooled('sexes'),
+    'year_of_birth': numbers('years_of_birth'),
+    'age': numbers('ages'),
+    'is_citizen': flags('is_citizen'),
+    'passed_test': flags('passed_test'),
+}
+
+
+class Template:
+
+    def __init__(self, text=GREETING, separator='\n'):
+        self.parts = []
+        for literal, field, specification, conversion in (
+            string.Formatter().parse(text)
+        ):
+            if specification or conversion:
+                raise ValueError(text)
+            self.add(literal)
+            if field is not None:
+                self.parts.append(COLUMNS[field])
+        self.add(separator)
+
+    def add(self, literal):
+        if not literal:
+            return
+        if self.parts and isinstance(self.parts[-1], str):
+            self.parts[-1] += literal
+        else:
+            self.parts.append(literal)
+
+    def pieces(self, table, start=0, stop=None):
+        stop = len(table) if stop is None else stop
+        return itertools.chain.from_iterable(
+            zip(
+                *(
+                    itertools.repeat(part, stop-start)
+                    if isinstance(part, str)
+                    else part(table, start, stop)
+                    for part in self.parts
+                )
+            )
+        )
+
+    def render(self, table, start=0, stop=None):
+        return ''.join(self.pieces(table, start, stop))
+
+    def write(self, table, file, chunk_size=100_000):
+        for start in range(0, len(table), chunk_size):
+            file.write(
+                self.render(
+                    table, start, min(start+chunk_size, len(table))
+                )
+            )
+
+
+def benchmark(number=1_000_000):
+    rows = list(src.person_table.people(number))
+    service = src.person_age.AgeService()
+    table = service.table()
+    table.extend(rows)
+    people = [src.person.Person(*row) for row in rows]
+
+    start = time.perf_counter()
+    per_object = ''.join(
+        f'{person.say_hello()}\n' for person in people
+    )
+    per_object_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    per_call = ''.join(
+        f'{src.person.say_hello(*row[:2], row[3])}\n' for row in rows
+    )
+    per_call_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    buffer = io.StringIO()
+    Template().write(table, buffer)
+    compiled_duration = time.perf_counter() - start
+
+    if not buffer.getvalue() == per_object == per_call:
+        raise RuntimeError('compiled template does not match say_hello')
+    return (
+        number, per_object_duration, per_call_duration, compiled_duration,
+    )
+
+
+if __name__ == '__main__':
+    number, per_object, per_call, compiled = benchmark()
+    print(f'{number:,} greetings')
+    print(f'Person.say_hello:  {per_object:.2f}s')
+    print(f'say_hello:         {per_call:.2f}s')
+    print(f'compiled template: {compiled:.2f}s')
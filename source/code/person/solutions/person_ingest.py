@@ -0,0 +1,180 @@
+import array
+import collections
+import concurrent.futures
+import csv
+import itertools
+import json
+import os
+import pathlib
+import src.person_age
+import src.person_table
+import tempfile
+import time
+
+
+FIELDS = (
+    'first_name', 'last_name', 'sex', 'year_of_birth',
+    'is_citizen', 'passed_test',
+)
+DEFAULTS = {'is_citizen': True, 'passed_test': False}
+
+
+def to_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', 'yes', 'y', '1')
+    return bool(value)
+
+
+def to_year(value):
+    if isinstance(value, str) and value.strip().lstrip('-').isdigit():
+        return int(value)
+    return value
+
+
+def csv_record(line, header):
+    record = dict(zip(header, next(csv.reader([line]))))
+    if 'year_of_birth' in record:
+        record['year_of_birth'] = to_year(record['year_of_birth'])
+    return record
+
+
+def json_record(line, header):
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise TypeError(f'expected a JSON object, got {line.strip()}')
+    return record
+
+
+RECORDS = {
+    'csv': csv_record,
+    'jsonl': json_record,
+}
+
+
+def parse_chunk(kind, header, lines, first_line, today):
+    service = src.person_age.AgeService(lambda: today)
+    record = RECORDS[kind]
+    rows, errors = [], []
+    for number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            values = {
+                **DEFAULTS,
+                **{
+                    key: value
+                    for key, value in record(line, header).items()
+                    if value not in ('', None)
+                },
+            }
+            array.array(
+                'i',
+                (
+                    values.get('year_of_birth'),
+                    service.calculate_age(values.get('year_of_birth')),
+                )
+            )
+            rows.append((
+                values['first_name'],
+                values['last_name'],
+                values['sex'],
+                values['year_of_birth'],
+                to_bool(values['is_citizen']),
+                to_bool(values['passed_test']),
+            ))
+        except (TypeError, ValueError, KeyError, OverflowError) as error:
+            errors.append((number, error))
+    return rows, errors
+
+
+def chunks(file, chunk_size, first_line):
+    while lines := list(itertools.islice(file, chunk_size)):
+        yield first_line, lines
+        first_line += len(lines)
+
+
+def parse(kind, header, pieces, today, processes):
+    if processes == 1:
+        for first_line, lines in pieces:
+            yield parse_chunk(kind, header, lines, first_line, today)
+        return
+
+    window = 2 * (processes or os.cpu_count())
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        pending = collections.deque()
+        for first_line, lines in pieces:
+            pending.append(
+                executor.submit(
+                    parse_chunk, kind, header, lines, first_line, today
+                )
+            )
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def ingest(
+        path, sink, kind=None, chunk_size=10_000,
+        processes=1, errors='raise', service=None, max_errors=100,
+    ):
+    path = pathlib.Path(path)
+    kind = kind or ('csv' if path.suffix == '.csv' else 'jsonl')
+    today = (service or src.person_age.AgeService()).today
+    result = {'rows': 0, 'errors': [], 'failures': 0}
+    start = time.perf_counter()
+
+    with path.open(newline='') as file:
+        header, first_line = None, 1
+        if kind == 'csv':
+            header = next(csv.reader([file.readline()]))
+            first_line = 2
+        for rows, failures in parse(
+            kind, header, chunks(file, chunk_size, first_line),
+            today, processes,
+        ):
+            if failures and errors == 'raise':
+                raise failures[0][1]
+            result['failures'] += len(failures)
+            result['errors'].extend(
+                failures[:max_errors-len(result['errors'])]
+            )
+            for row in rows:
+                sink(*row)
+            result['rows'] += len(rows)
+
+    result['seconds'] = time.perf_counter() - start
+    result['rows_per_second'] = result['rows'] / result['seconds']
+    return result
+
+
+def write(path, people):
+    path = pathlib.Path(path)
+    with path.open('w', newline='') as file:
+        if path.suffix == '.csv':
+            writer = csv.writer(file)
+            writer.writerow(FIELDS)
+            writer.writerows(people)
+        else:
+            for person in people:
+                file.write(json.dumps(dict(zip(FIELDS, person))))
+                file.write('\n')
+
+
+def benchmark(number=1_000_000, processes=1):
+    service = src.person_age.AgeService()
+    result = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in ('.csv', '.jsonl'):
+            path = pathlib.Path(directory, f'people{suffix}')
+            write(path, src.person_table.people(number))
+            table = service.table()
+            result[suffix] = ingest(
+                path, table.append, processes=processes, service=service,
+            )['rows_per_second']
+    return result
+
+
+if __name__ == '__main__':
+    for suffix, rows_per_second in benchmark().items():
+        print(f'{suffix}: {rows_per_second:,.0f} rows/s')
@@ -0,0 +1,206 @@
+import array
+import random
+import src.person
+import tracemalloc
+
+
+FIELDS = (
+    'first_name', 'last_name', 'sex', 'year_of_birth',
+    'is_citizen', 'passed_test', 'age',
+)
+
+
+class Person:
+
+    __slots__ = FIELDS
+
+    def __init__(
+        self, first_name, last_name,
+        sex, year_of_birth=None,
+        is_citizen=True,
+        passed_test=False,
+    ):
+        self.first_name = first_name
+        self.last_name = last_name
+        self.year_of_birth = year_of_birth
+        self.sex = sex
+        self.is_citizen = is_citizen
+        self.passed_test = passed_test
+        self.age = self.calculate_age(year_of_birth)
+
+    calculate_age = staticmethod(src.person.calculate_age)
+    can_get_license = src.person.Person.can_get_license
+    can_vote = src.person.Person.can_vote
+    check_age = staticmethod(src.person.Person.check_age)
+    say_hello = src.person.Person.say_hello
+
+
+class Strings:
+
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def intern(self, value):
+        try:
+            return self.index[value]
+        except KeyError:
+            self.index[value] = len(self.values)
+            self.values.append(value)
+            return self.index[value]
+
+
+class PersonView:
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    @property
+    def first_name(self):
+        table = self.table
+        return table.strings.values[table.first_names[self.row]]
+
+    @property
+    def last_name(self):
+        table = self.table
+        return table.strings.values[table.last_names[self.row]]
+
+    @property
+    def sex(self):
+        table = self.table
+        return table.strings.values[table.sexes[self.row]]
+
+    @property
+    def year_of_birth(self):
+        return self.table.years_of_birth[self.row]
+
+    @property
+    def is_citizen(self):
+        return bool(self.table.is_citizen[self.row])
+
+    @property
+    def passed_test(self):
+        return bool(self.table.passed_test[self.row])
+
+    @property
+    def age(self):
+        return self.table.ages[self.row]
+
+    can_get_license = src.person.Person.can_get_license
+    can_vote = src.person.Person.can_vote
+    check_age = staticmethod(src.person.Person.check_age)
+    say_hello = src.person.Person.say_hello
+
+    def to_person(self):
+        return Person(
+            first_name=self.first_name,
+            last_name=self.last_name,
+            sex=self.sex,
+            year_of_birth=self.year_of_birth,
+            is_citizen=self.is_citizen,
+            passed_test=self.passed_test,
+        )
+
+
+class PersonTable:
+
+    def __init__(
+            self, strings=None, calculate_age=src.person.calculate_age,
+        ):
+        self.strings = strings or Strings()
+        self.calculate_age = calculate_age
+        self.first_names = array.array('I')
+        self.last_names = array.array('I')
+        self.sexes = array.array('I')
+        self.years_of_birth = array.array('i')
+        self.is_citizen = bytearray()
+        self.passed_test = bytearray()
+        self.ages = array.array('i')
+
+    def append(
+        self, first_name, last_name,
+        sex, year_of_birth=None,
+        is_citizen=True,
+        passed_test=False,
+    ):
+        numbers = array.array(
+            'i', (year_of_birth, self.calculate_age(year_of_birth))
+        )
+        first_name = self.strings.intern(first_name)
+        last_name = self.strings.intern(last_name)
+        sex = self.strings.intern(sex)
+
+        self.first_names.append(first_name)
+        self.last_names.append(last_name)
+        self.sexes.append(sex)
+        self.years_of_birth.append(numbers[0])
+        self.is_citizen.append(bool(is_citizen))
+        self.passed_test.append(bool(passed_test))
+        self.ages.append(numbers[1])
+
+    def extend(self, people):
+        for person in people:
+            self.append(*person)
+
+    def __len__(self):
+        return len(self.ages)
+
+    def __getitem__(self, row):
+        if not -len(self) <= row < len(self):
+            raise IndexError(row)
+        return PersonView(self, row % len(self))
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield PersonView(self, row)
+
+
+def people(number, seed=0):
+    generator = random.Random(seed)
+    first_names = [f'first_{index}' for index in range(1000)]
+    last_names = [f'last_{index}' for index in range(5000)]
+    for _ in range(number):
+        yield (
+            generator.choice(first_names),
+            generator.choice(last_names),
+            generator.choice('FM'),
+            generator.randrange(1920, 2020),
+            generator.random() < 0.9,
+            generator.random() < 0.6,
+        )
+
+
+def measure(function):
+    tracemalloc.start()
+    result = function()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def benchmark(number=1_000_000):
+    rows = list(people(number))
+    sizes = {}
+    for name, function in (
+        ('Person', lambda: [src.person.Person(*row) for row in rows]),
+        ('__slots__ Person', lambda: [Person(*row) for row in rows]),
+    ):
+        _, size = measure(function)
+        sizes[name] = size / number
+
+    def table():
+        result = PersonTable()
+        result.extend(rows)
+        return result
+
+    _, size = measure(table)
+    sizes['PersonTable'] = size / number
+    return sizes
+
+
+if __name__ == '__main__':
+    for name, size in benchmark().items():
+        print(f'{name}: {size:,.1f} bytes per record')
@@ -0,0 +1,131 @@
+import datetime
+import src.person
+import src.person_age
+import unittest
+
+
+class Clock:
+
+    def __init__(self, today):
+        self.today = today
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.today
+
+
+class TestPersonAge(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock(datetime.date(2030, 6, 1))
+        self.service = src.person_age.AgeService(self.clock)
+
+    def test_calculate_age_uses_one_today(self):
+        for year_of_birth, my_expectation in (
+            (2000, 30),
+            (1910, 120),
+            (2000, 30),
+            (2031, -1),
+        ):
+            with self.subTest(year_of_birth=year_of_birth):
+                self.assertEqual(
+                    self.service.calculate_age(year_of_birth),
+                    my_expectation
+                )
+        self.assertEqual(self.clock.calls, 1)
+        self.assertEqual(self.service.ages, {2000: 30, 1910: 120, 2031: -1})
+
+    def test_calculate_age_matches_person(self):
+        service = src.person_age.AgeService()
+        for year_of_birth in range(1910, 2030):
+            try:
+                my_expectation = src.person.calculate_age(year_of_birth)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    service.calculate_age(year_of_birth)
+            else:
+                self.assertEqual(
+                    service.calculate_age(year_of_birth), my_expectation
+                )
+
+    def test_calculate_age_raises_type_error(self):
+        self.service.calculate_age(2000)
+        for year_of_birth in (None, 2000.0, '2000', (2000,)):
+            with self.subTest(year_of_birth=year_of_birth):
+                with self.assertRaises(TypeError):
+                    self.service.calculate_age(year_of_birth)
+
+    def test_calculate_age_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.service.calculate_age(1909)
+        self.assertNotIn(1909, self.service.ages)
+
+    def test_refresh(self):
+        self.service.calculate_age(2000)
+        self.clock.today = datetime.date(2031, 1, 1)
+        self.assertEqual(self.service.calculate_age(2000), 30)
+        self.service.refresh()
+        self.assertEqual(self.service.calculate_age(2000), 31)
+        self.assertEqual(self.clock.calls, 2)
+
+    def test_refresh_keeps_person_class(self):
+        Person = self.service.Person
+        self.clock.today = datetime.date(2031, 1, 1)
+        self.service.refresh()
+        self.assertIs(self.service.Person, Person)
+        self.assertEqual(
+            self.service.Person('jane', 'doe', 'F', 2000).age, 31
+        )
+
+    def test_calculate_ages(self):
+        self.assertEqual(
+            list(self.service.calculate_ages([2000, 1990, 2030])),
+            [30, 40, 0]
+        )
+        self.assertEqual(list(self.service.calculate_ages([])), [])
+        self.assertEqual(
+            list(self.service.calculate_ages([40_000, 2031])),
+            [2030-40_000, -1]
+        )
+        with self.assertRaises(TypeError):
+            self.service.calculate_ages([2000, 2000.0])
+        with self.assertRaises(ValueError):
+            self.service.calculate_ages([2000, 1909])
+
+    def test_person(self):
+        person = self.service.Person('jane', 'doe', 'F', 2000, True, False)
+        self.assertEqual(person.age, 30)
+        self.assertTrue(person.can_vote())
+        self.assertFalse(person.can_get_license())
+        self.assertEqual(
+            person.say_hello(), 'Hello, my name is jane doe and I am 30.'
+        )
+        with self.assertRaises(AttributeError):
+            person.__dict__
+        with self.assertRaises(TypeError):
+            self.service.Person('jane', 'doe', 'F', None)
+
+    def test_say_hello(self):
+        self.assertEqual(
+            self.service.say_hello('joe', 'blow', 2010),
+            'Hello, my name is joe blow and I am 20.'
+        )
+
+    def test_table(self):
+        table = self.service.table()
+        table.append('jane', 'doe', 'F', 2000)
+        self.assertEqual(table[0].age, 30)
+        with self.assertRaises(ValueError):
+            table.append('joe', 'blow', 'M', 1900)
+
+    def test_benchmark(self):
+        self.assertEqual(src.person_age.benchmark(1000)[0], 1000)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# ValueError
@@ -0,0 +1,120 @@
+import array
+import collections
+import datetime
+import src.person
+import src.person_eligibility
+import src.person_table
+import unittest
+
+
+THIS_YEAR = datetime.date.today().year
+
+
+class TestPersonEligibility(unittest.TestCase):
+
+    people = (
+        ('jane', 'doe', 'F', 1991, True, True),
+        ('joe', 'blow', 'M', 1996, True, False),
+        ('mary', 'public', 'F', 2000, False, True),
+        ('john', 'smith', 'M', 1980, False, False),
+        ('minor', 'citizen', 'F', THIS_YEAR-17, True, True),
+        ('just', 'adult', 'M', THIS_YEAR-18, True, True),
+    )
+    regions = ['north', 'south', 'north', 'east', 'north', 'south']
+
+    def setUp(self):
+        self.table = src.person_table.PersonTable()
+        self.table.extend(self.people)
+
+    def test_masks_match_person_methods(self):
+        for query in ('can_vote', 'can_get_license'):
+            with self.subTest(query=query):
+                self.assertEqual(
+                    src.person_eligibility.__getattribute__(query)(
+                        self.table
+                    ),
+                    bytes(
+                        src.person.Person(*a_person).__getattribute__(
+                            query
+                        )()
+                        for a_person in self.people
+                    )
+                )
+
+    def test_adults(self):
+        self.assertEqual(
+            src.person_eligibility.adults(
+                array.array('i', [-1, 0, 17, 18, 120])
+            ),
+            bytes([0, 0, 0, 1, 1])
+        )
+
+    def test_count(self):
+        self.assertEqual(
+            src.person_eligibility.count(
+                src.person_eligibility.can_vote(self.table)
+            ),
+            3
+        )
+
+    def test_group_by(self):
+        self.assertEqual(
+            src.person_eligibility.group_by(
+                src.person_eligibility.can_get_license(self.table),
+                self.regions,
+            ),
+            collections.Counter(north=2, south=1)
+        )
+
+    def test_eligible_by_group(self):
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                self.assertEqual(
+                    src.person_eligibility.eligible_by_group(
+                        self.table, self.regions,
+                        processes=processes, chunk_size=4,
+                    ),
+                    collections.Counter(north=1, south=2)
+                )
+
+    def test_eligible_by_group_w_table_column(self):
+        self.assertEqual(
+            src.person_eligibility.eligible_by_group(
+                self.table, self.table.sexes, query='can_get_license',
+                processes=2, chunk_size=2,
+            ),
+            {
+                self.table.strings.intern('F'): 2,
+                self.table.strings.intern('M'): 1,
+            }
+        )
+
+    def test_group_by_raises_value_error_w_wrong_number_of_keys(self):
+        for keys in (self.regions[:2], self.regions + ['west']):
+            with self.subTest(keys=keys):
+                with self.assertRaises(ValueError):
+                    src.person_eligibility.group_by(
+                        src.person_eligibility.can_vote(self.table), keys
+                    )
+                for processes in (1, 2):
+                    with self.assertRaises(ValueError):
+                        src.person_eligibility.eligible_by_group(
+                            self.table, keys,
+                            processes=processes, chunk_size=2,
+                        )
+
+    def test_unknown_query(self):
+        with self.assertRaises(KeyError):
+            src.person_eligibility.mask(self.table, 'can_fly')
+
+    def test_benchmark(self):
+        self.assertEqual(src.person_eligibility.benchmark(1000)[0], 1000)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# KeyError
+# ValueError
@@ -0,0 +1,116 @@
+import datetime
+import io
+import pathlib
+import src.person
+import src.person_greetings
+import src.person_table
+import tempfile
+import unittest
+
+
+class TestPersonGreetings(unittest.TestCase):
+
+    people = (
+        ('jane', 'doe', 'F', 1991, True, True),
+        ('joe', 'blow', 'M', 1996, True, False),
+        ('mary', 'public', 'F', 2000, False, True),
+        ('john', 'smith', 'M', 1980, False, False),
+    )
+
+    def setUp(self):
+        self.table = src.person_table.PersonTable()
+        self.table.extend(self.people)
+
+    def test_render_matches_say_hello(self):
+        self.assertEqual(
+            src.person_greetings.Template().render(self.table),
+            ''.join(
+                f'{src.person.Person(*a_person).say_hello()}\n'
+                for a_person in self.people
+            )
+        )
+
+    def test_render_slice(self):
+        age = datetime.date.today().year - 1996
+        self.assertEqual(
+            src.person_greetings.Template().render(self.table, 1, 2),
+            f'Hello, my name is joe blow and I am {age}.\n'
+        )
+
+    def test_template_parts(self):
+        template = src.person_greetings.Template(
+            '{first_name}{last_name}: {sex}, {year_of_birth}', separator=';'
+        )
+        self.assertEqual(
+            [
+                part if isinstance(part, str) else None
+                for part in template.parts
+            ],
+            [None, None, ': ', None, ', ', None, ';']
+        )
+        self.assertEqual(
+            template.render(self.table, 0, 2),
+            'janedoe: F, 1991;joeblow: M, 1996;'
+        )
+
+    def test_flags(self):
+        self.assertEqual(
+            src.person_greetings.Template(
+                '{is_citizen} {passed_test}', separator='|'
+            ).render(self.table),
+            'True True|True False|False True|False False|'
+        )
+
+    def test_template_w_unknown_field(self):
+        with self.assertRaises(KeyError):
+            src.person_greetings.Template('Hello {nickname}')
+
+    def test_template_w_format_specification(self):
+        for text in ('{age:>3}', '{first_name!r}'):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    src.person_greetings.Template(text)
+
+    def test_write(self):
+        template = src.person_greetings.Template()
+        buffer = io.StringIO()
+        template.write(self.table, buffer, chunk_size=3)
+        self.assertEqual(buffer.getvalue(), template.render(self.table))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory, 'greetings.txt')
+            with path.open('w') as file:
+                template.write(self.table, file, chunk_size=1)
+            self.assertEqual(
+                path.read_text(), template.render(self.table)
+            )
+
+    def test_numbers(self):
+        table = src.person_table.PersonTable(calculate_age=lambda year: -1)
+        table.append('future', 'baby', 'F', 70_000)
+        self.assertEqual(
+            src.person_greetings.Template(
+                '{year_of_birth} {age}', separator=''
+            ).render(table),
+            '70000 -1'
+        )
+
+    def test_empty_table(self):
+        self.assertEqual(
+            src.person_greetings.Template().render(
+                src.person_table.PersonTable()
+            ),
+            ''
+        )
+
+    def test_benchmark(self):
+        self.assertEqual(src.person_greetings.benchmark(1000)[0], 1000)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# KeyError
+# ValueError
@@ -0,0 +1,266 @@
+import datetime
+import json
+import pathlib
+import src.person_age
+import src.person_ingest
+import src.person_table
+import tempfile
+import unittest
+
+
+THIS_YEAR = datetime.date.today().year
+
+
+class TestPersonIngest(unittest.TestCase):
+
+    people = (
+        ('jane', 'doe', 'F', 1991, True, True),
+        ('joe', 'blow', 'M', 1996, True, False),
+        ('mary', 'public', 'F', 2000, False, True),
+        ('john', 'smith', 'M', 1980, False, False),
+    )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name, text):
+        path = pathlib.Path(self.directory.name, name)
+        path.write_text(text)
+        return path
+
+    def written(self, name, people):
+        path = pathlib.Path(self.directory.name, name)
+        src.person_ingest.write(path, people)
+        return path
+
+    def test_ingest_csv_and_json_lines(self):
+        for name in ('people.csv', 'people.jsonl'):
+            with self.subTest(name=name):
+                rows = []
+                result = src.person_ingest.ingest(
+                    self.written(name, self.people),
+                    lambda *row: rows.append(row),
+                    chunk_size=3,
+                )
+                self.assertEqual(rows, list(self.people))
+                self.assertEqual(result['rows'], 4)
+                self.assertEqual(result['errors'], [])
+                self.assertGreater(result['rows_per_second'], 0)
+
+    def test_ingest_into_table(self):
+        table = src.person_table.PersonTable()
+        src.person_ingest.ingest(
+            self.written('people.csv', self.people), table.append
+        )
+        self.assertEqual(len(table), 4)
+        self.assertEqual(
+            table[0].say_hello(),
+            f'Hello, my name is jane doe and I am {THIS_YEAR-1991}.'
+        )
+
+    def test_ingest_w_person_callback(self):
+        service = src.person_age.AgeService()
+        people = []
+        src.person_ingest.ingest(
+            self.written('people.jsonl', self.people),
+            lambda *row: people.append(service.Person(*row)),
+            service=service,
+        )
+        self.assertEqual(
+            [person.can_vote() for person in people],
+            [True, True, False, False]
+        )
+
+    def test_csv_defaults_and_blank_lines(self):
+        rows = []
+        src.person_ingest.ingest(
+            self.path(
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth\n'
+                'jane,doe,F,1991\n'
+                '\n'
+                'joe,blow,M,1996\n'
+            ),
+            lambda *row: rows.append(row),
+        )
+        self.assertEqual(
+            rows,
+            [
+                ('jane', 'doe', 'F', 1991, True, False),
+                ('joe', 'blow', 'M', 1996, True, False),
+            ]
+        )
+
+    def test_ingest_raises_same_errors_as_calculate_age(self):
+        for name, text, error in (
+            (
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth\njane,doe,F,1991.0\n',
+                TypeError,
+            ),
+            (
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth\n'
+                f'jane,doe,F,{THIS_YEAR-121}\n',
+                ValueError,
+            ),
+            (
+                'people.jsonl',
+                json.dumps({
+                    'first_name': 'jane', 'last_name': 'doe',
+                    'sex': 'F', 'year_of_birth': '1991',
+                }),
+                TypeError,
+            ),
+            (
+                'people.jsonl',
+                json.dumps({
+                    'first_name': 'jane', 'last_name': 'doe', 'sex': 'F',
+                }),
+                TypeError,
+            ),
+            ('people.jsonl', '{"first_name": ', ValueError),
+        ):
+            with self.subTest(name=name, text=text):
+                with self.assertRaises(error):
+                    src.person_ingest.ingest(
+                        self.path(name, text), lambda *row: None
+                    )
+
+    def test_ingest_collects_errors(self):
+        rows = []
+        result = src.person_ingest.ingest(
+            self.path(
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth\n'
+                'jane,doe,F,1991\n'
+                'joe,blow,M,None\n'
+                f'mary,public,F,{THIS_YEAR-121}\n'
+                'john,smith,M,1980\n'
+            ),
+            lambda *row: rows.append(row),
+            errors='collect',
+            chunk_size=2,
+        )
+        self.assertEqual(result['rows'], 2)
+        self.assertEqual(result['failures'], 2)
+        self.assertEqual(
+            [
+                (number, type(error))
+                for number, error in result['errors']
+            ],
+            [(3, TypeError), (4, ValueError)]
+        )
+
+    def test_ingest_collects_json_values_that_are_not_objects(self):
+        rows = []
+        result = src.person_ingest.ingest(
+            self.path(
+                'people.jsonl',
+                '[1, 2]\n"jane"\n3\n'
+                + json.dumps({
+                    'first_name': 'joe', 'last_name': 'blow',
+                    'sex': 'M', 'year_of_birth': 1996,
+                })
+                + '\n'
+            ),
+            lambda *row: rows.append(row),
+            errors='collect',
+        )
+        self.assertEqual(rows, [('joe', 'blow', 'M', 1996, True, False)])
+        self.assertEqual(
+            [
+                (number, type(error))
+                for number, error in result['errors']
+            ],
+            [(1, TypeError), (2, TypeError), (3, TypeError)]
+        )
+
+    def test_ingest_keeps_at_most_max_errors(self):
+        result = src.person_ingest.ingest(
+            self.path(
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth\n'
+                + 'joe,blow,M,None\n' * 10
+            ),
+            lambda *row: None,
+            errors='collect',
+            chunk_size=3,
+            max_errors=4,
+        )
+        self.assertEqual(result['rows'], 0)
+        self.assertEqual(result['failures'], 10)
+        self.assertEqual(
+            [number for number, _ in result['errors']], [2, 3, 4, 5]
+        )
+
+    def test_ingest_rejects_years_out_of_range(self):
+        table = src.person_table.PersonTable()
+        result = src.person_ingest.ingest(
+            self.path(
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth\n'
+                f'jane,doe,F,{2**40}\n'
+                'joe,blow,M,1996\n'
+            ),
+            table.append,
+            errors='collect',
+        )
+        self.assertEqual(len(table), 1)
+        self.assertEqual(
+            [
+                (number, type(error))
+                for number, error in result['errors']
+            ],
+            [(2, OverflowError)]
+        )
+
+    def test_empty_cells_use_defaults(self):
+        rows = []
+        src.person_ingest.ingest(
+            self.path(
+                'people.csv',
+                'first_name,last_name,sex,year_of_birth,'
+                'is_citizen,passed_test\n'
+                'jane,doe,F,1991,,\n'
+                'joe,blow,M,1996,no,yes\n'
+            ),
+            lambda *row: rows.append(row),
+        )
+        self.assertEqual(
+            rows,
+            [
+                ('jane', 'doe', 'F', 1991, True, False),
+                ('joe', 'blow', 'M', 1996, False, True),
+            ]
+        )
+
+    def test_ingest_in_parallel(self):
+        people = list(src.person_table.people(1000))
+        for name in ('people.csv', 'people.jsonl'):
+            with self.subTest(name=name):
+                rows = []
+                result = src.person_ingest.ingest(
+                    self.written(name, people),
+                    lambda *row: rows.append(row),
+                    chunk_size=64,
+                    processes=2,
+                )
+                self.assertEqual(rows, people)
+                self.assertEqual(result['rows'], 1000)
+
+    def test_benchmark(self):
+        self.assertEqual(
+            set(src.person_ingest.benchmark(100)), {'.csv', '.jsonl'}
+        )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# ValueError
+# KeyError
+# OverflowError
@@ -0,0 +1,124 @@
+import datetime
+import src.person
+import src.person_table
+import unittest
+
+
+class TestPersonTable(unittest.TestCase):
+
+    people = (
+        ('jane', 'doe', 'F', 1991, True, True),
+        ('joe', 'blow', 'M', 1996, True, False),
+        ('mary', 'doe', 'F', 2000, False, True),
+        ('john', 'smith', 'M', datetime.date.today().year-17, True, True),
+    )
+
+    def setUp(self):
+        self.table = src.person_table.PersonTable()
+        self.table.extend(self.people)
+
+    def assert_same_person(self, reality, my_expectation):
+        for name in src.person_table.FIELDS:
+            self.assertEqual(
+                reality.__getattribute__(name),
+                my_expectation.__getattribute__(name)
+            )
+        self.assertEqual(reality.say_hello(), my_expectation.say_hello())
+        self.assertEqual(reality.can_vote(), my_expectation.can_vote())
+        self.assertEqual(
+            reality.can_get_license(), my_expectation.can_get_license()
+        )
+
+    def test_slotted_person(self):
+        for a_person in self.people:
+            with self.subTest(first_name=a_person[0]):
+                person = src.person_table.Person(*a_person)
+                with self.assertRaises(AttributeError):
+                    person.__dict__
+                self.assert_same_person(
+                    person, src.person.Person(*a_person)
+                )
+
+    def test_slotted_person_raises_like_person(self):
+        with self.assertRaises(TypeError):
+            src.person_table.Person('first_name', 'last_name', 'M', '2026')
+        with self.assertRaises(ValueError):
+            src.person_table.Person(
+                'first_name', 'last_name', 'M',
+                datetime.date.today().year-121,
+            )
+
+    def test_table_views(self):
+        self.assertEqual(len(self.table), 4)
+        for view, a_person in zip(self.table, self.people):
+            with self.subTest(first_name=a_person[0]):
+                self.assert_same_person(view, src.person.Person(*a_person))
+                self.assert_same_person(
+                    view.to_person(), src.person.Person(*a_person)
+                )
+
+    def test_table_indexing(self):
+        self.assertEqual(self.table[0].first_name, 'jane')
+        self.assertEqual(self.table[-1].first_name, 'john')
+        with self.assertRaises(IndexError):
+            self.table[4]
+        with self.assertRaises(IndexError):
+            self.table[-5]
+
+    def test_strings_are_interned(self):
+        self.assertEqual(
+            self.table.strings.values,
+            [
+                'jane', 'doe', 'F', 'joe', 'blow', 'M',
+                'mary', 'john', 'smith',
+            ]
+        )
+        self.assertEqual(self.table.last_names[0], self.table.last_names[2])
+
+    def test_append_validates_year_of_birth(self):
+        with self.assertRaises(TypeError):
+            self.table.append('first_name', 'last_name', 'M', None)
+        with self.assertRaises(ValueError):
+            self.table.append(
+                'first_name', 'last_name', 'M',
+                datetime.date.today().year-121,
+            )
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(len(self.table.first_names), 4)
+
+    def test_append_accepts_future_year_of_birth(self):
+        self.table.append(
+            'first_name', 'last_name', 'F',
+            datetime.date.today().year+1,
+        )
+        self.assertEqual(self.table[-1].age, -1)
+        self.assertEqual(
+            self.table[-1].year_of_birth, datetime.date.today().year+1
+        )
+
+    def test_append_is_atomic(self):
+        with self.assertRaises(OverflowError):
+            self.table.append('first_name', 'last_name', 'M', 2**40)
+        for column in (
+            self.table.first_names, self.table.last_names,
+            self.table.sexes, self.table.years_of_birth,
+            self.table.is_citizen, self.table.passed_test,
+            self.table.ages,
+        ):
+            self.assertEqual(len(column), 4)
+        self.assertEqual(len(self.table.strings.values), 9)
+
+    def test_benchmark(self):
+        sizes = src.person_table.benchmark(20_000)
+        self.assertLess(sizes['__slots__ Person'], sizes['Person'])
+        self.assertLess(sizes['PersonTable'], sizes['__slots__ Person'])
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# ValueError
+# IndexError
+# OverflowError
@@ -0,0 +1,126 @@
+import itertools
+import src.traffic_light
+import src.traffic_network
+import unittest
+
+
+GREEN, YELLOW, RED = 'GREEN', 'YELLOW', 'RED'
+
+
+class TestTrafficNetwork(unittest.TestCase):
+
+    def test_encode_decode(self):
+        for parallel, cross, red_phase in itertools.product(
+            src.traffic_network.LIGHTS,
+            src.traffic_network.LIGHTS,
+            src.traffic_network.PHASES,
+        ):
+            with self.subTest(parallel=parallel, cross=cross):
+                self.assertEqual(
+                    src.traffic_network.decode(
+                        src.traffic_network.encode(
+                            parallel, cross, red_phase
+                        )
+                    ),
+                    (parallel, cross, red_phase)
+                )
+
+    def test_transitions_match_control(self):
+        for state in range(2 * src.traffic_network.DONE):
+            parallel, cross, red_phase = src.traffic_network.decode(state)
+            timer_done = bool(state & src.traffic_network.DONE)
+            with self.subTest(state=state):
+                self.assertEqual(
+                    src.traffic_network.decode(
+                        src.traffic_network.TRANSITIONS[state]
+                    )[:2],
+                    src.traffic_light.control(
+                        timer_done=timer_done,
+                        red_phase=red_phase,
+                        current_parallel=parallel,
+                        current_cross=cross,
+                    )
+                )
+
+    def test_failsafe_table(self):
+        self.assertEqual(
+            src.traffic_network.FAILSAFE[
+                src.traffic_network.encode(GREEN, RED)
+            ],
+            False
+        )
+        self.assertEqual(
+            src.traffic_network.FAILSAFE[
+                src.traffic_network.encode(GREEN, YELLOW)
+            ],
+            True
+        )
+        self.assertEqual(
+            src.traffic_network.FAILSAFE[
+                src.traffic_network.encode('FLASHING', RED)
+            ],
+            True
+        )
+
+    def test_intersection_cycle(self):
+        network = src.traffic_network.Network(
+            1, green=3, yellow=2, clearance=1
+        )
+        seen = []
+        for _ in range(18):
+            network.step()
+            seen.append(network.lights(0))
+        self.assertEqual(
+            seen,
+            [(GREEN, RED)]*3 + [(YELLOW, RED)]*2 + [(RED, RED)]
+          + [(RED, GREEN)]*3 + [(RED, YELLOW)]*2 + [(RED, RED)]
+          + [(GREEN, RED)]*3 + [(YELLOW, RED)]*2 + [(RED, RED)]
+        )
+
+    def test_green_wave(self):
+        self.assertEqual(
+            src.traffic_network.green_wave(2, 3, travel=4),
+            [0, 4, 8, 0, 4, 8]
+        )
+        network = src.traffic_network.Network(
+            3, plan=[0, 2, 4], green=10
+        )
+        first_green = {}
+        for tick in range(1, 10):
+            network.step()
+            for intersection in range(3):
+                if network.lights(intersection) == (GREEN, RED):
+                    first_green.setdefault(intersection, tick)
+        self.assertEqual(first_green, {0: 1, 1: 3, 2: 5})
+
+    def test_inject_fault_triggers_failsafe(self):
+        network = src.traffic_network.Network(2, green=5)
+        network.step()
+        network.inject(1, GREEN, GREEN)
+        self.assertEqual(network.failsafes(), 1)
+        network.step()
+        self.assertEqual(network.lights(1), (RED, RED))
+        self.assertEqual(network.lights(0), (GREEN, RED))
+        self.assertEqual(network.failsafes(), 0)
+
+    def test_counts(self):
+        network = src.traffic_network.Network(4, plan=[0, 0, 40, 40])
+        network.run(2)
+        self.assertEqual(
+            network.counts(), {(GREEN, RED): 2, (RED, RED): 2}
+        )
+
+    def test_benchmark(self):
+        intersections, scalar, table = src.traffic_network.benchmark(
+            rows=10, columns=10, ticks=100, scalar_ticks=2
+        )
+        self.assertEqual(intersections, 100)
+        self.assertGreater(table, scalar)
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# ValueError
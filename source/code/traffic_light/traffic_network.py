@@ -0,0 +1,167 @@
+import collections
+import src.traffic_light
+import time
+
+
+LIGHTS = (
+    src.traffic_light.RED,
+    src.traffic_light.YELLOW,
+    src.traffic_light.GREEN,
+    'FLASHING',
+)
+PHASES = ('cross', 'parallel')
+DONE = 1 << 5
+
+
+def encode(parallel, cross, red_phase='parallel'):
+    return (
+        LIGHTS.index(parallel)
+      | LIGHTS.index(cross) << 2
+      | PHASES.index(red_phase) << 4
+    )
+
+
+def decode(state):
+    return (
+        LIGHTS[state & 3],
+        LIGHTS[state >> 2 & 3],
+        PHASES[state >> 4 & 1],
+    )
+
+
+def next_phase(red_phase, parallel, cross):
+    if cross == src.traffic_light.GREEN:
+        return 'parallel'
+    if parallel == src.traffic_light.GREEN:
+        return 'cross'
+    return red_phase
+
+
+def transition(state):
+    current_parallel, current_cross, red_phase = decode(state)
+    parallel, cross = src.traffic_light.control(
+        timer_done=bool(state & DONE),
+        red_phase=red_phase,
+        current_parallel=current_parallel,
+        current_cross=current_cross,
+    )
+    return encode(
+        parallel, cross, next_phase(red_phase, parallel, cross)
+    )
+
+
+TRANSITIONS = bytes(
+    transition(state) if state < 2*DONE else encode('RED', 'RED')
+    for state in range(256)
+)
+FAILSAFE = bytes(
+    src.traffic_light.triggers_failsafe(*decode(state & (DONE-1))[:2])
+    if state < 2*DONE else True
+    for state in range(256)
+)
+
+
+def durations(green=30, yellow=4, clearance=2):
+    result = []
+    for state in range(DONE):
+        parallel, cross, _ = decode(state)
+        if src.traffic_light.GREEN in (parallel, cross):
+            result.append(green)
+        elif src.traffic_light.YELLOW in (parallel, cross):
+            result.append(yellow)
+        else:
+            result.append(clearance)
+    return result
+
+
+def green_wave(rows, columns, travel=3):
+    return [
+        column * travel
+        for _ in range(rows)
+        for column in range(columns)
+    ]
+
+
+class Network:
+
+    def __init__(self, intersections, plan=None, **timing):
+        self.states = bytearray([encode('RED', 'RED')]) * intersections
+        self.durations = durations(**timing)
+        self.tick = 0
+        self.due = collections.defaultdict(list)
+        for intersection, offset in enumerate(plan or [0]*intersections):
+            self.due[offset+1].append(intersection)
+
+    def step(self):
+        self.tick += 1
+        due = self.due.pop(self.tick, ())
+        states = self.states
+        for intersection in due:
+            states[intersection] |= DONE
+        self.states = states = states.translate(TRANSITIONS)
+        for intersection in due:
+            self.due[
+                self.tick + self.durations[states[intersection]]
+            ].append(intersection)
+
+    def run(self, ticks):
+        for _ in range(ticks):
+            self.step()
+
+    def inject(self, intersection, parallel, cross):
+        self.states[intersection] = (
+            self.states[intersection] & ~15
+          | LIGHTS.index(parallel)
+          | LIGHTS.index(cross) << 2
+        )
+
+    def lights(self, intersection):
+        return decode(self.states[intersection])[:2]
+
+    def failsafes(self):
+        return self.states.translate(FAILSAFE).count(True)
+
+    def counts(self):
+        return collections.Counter(
+            self.lights(intersection)
+            for intersection in range(len(self.states))
+        )
+
+
+def scalar_tick(lights, timers):
+    for intersection, (parallel, cross, red_phase) in enumerate(lights):
+        timers[intersection] -= 1
+        parallel, cross = src.traffic_light.control(
+            timer_done=timers[intersection] == 0,
+            red_phase=red_phase,
+            current_parallel=parallel,
+            current_cross=cross,
+        )
+        if timers[intersection] == 0:
+            timers[intersection] = 30
+        lights[intersection] = (
+            parallel, cross, next_phase(red_phase, parallel, cross)
+        )
+
+
+def benchmark(rows=100, columns=100, ticks=3600, scalar_ticks=10):
+    intersections = rows * columns
+    lights = [('RED', 'RED', 'parallel')] * intersections
+    timers = [offset+1 for offset in green_wave(rows, columns)]
+    start = time.perf_counter()
+    for _ in range(scalar_ticks):
+        scalar_tick(lights, timers)
+    scalar = scalar_ticks / (time.perf_counter() - start)
+
+    network = Network(intersections, green_wave(rows, columns))
+    start = time.perf_counter()
+    network.run(ticks)
+    table = ticks / (time.perf_counter() - start)
+    return intersections, scalar, table
+
+
+if __name__ == '__main__':
+    intersections, scalar, table = benchmark()
+    print(f'{intersections:,} intersections')
+    print(f'control per intersection: {scalar:,.1f} ticks/s')
+    print(f'network tables:           {table:,.1f} ticks/s')
@@ -0,0 +1,115 @@
+import array
+import time
+
+
+WORD = 64
+MASK = (1 << WORD) - 1
+PATTERNS = (
+    0xAAAAAAAAAAAAAAAA,
+    0xCCCCCCCCCCCCCCCC,
+    0xF0F0F0F0F0F0F0F0,
+    0xFF00FF00FF00FF00,
+    0xFFFF0000FFFF0000,
+    0xFFFFFFFF00000000,
+)
+
+UNARY = {
+    'logical_identity': lambda first: first,
+    'logical_negation': lambda first: ~first & MASK,
+}
+BINARY = {
+    'contradiction': lambda first, second: 0,
+    'logical_nor': lambda first, second: ~(first | second) & MASK,
+    'converse_non_implication': lambda first, second: ~first & second,
+    'negate_first': lambda first, second: ~first & MASK,
+    'material_non_implication': lambda first, second: first & ~second,
+    'negate_second': lambda first, second: ~second & MASK,
+    'exclusive_disjunction': lambda first, second: first ^ second,
+    'logical_nand': lambda first, second: ~(first & second) & MASK,
+    'logical_conjunction': lambda first, second: first & second,
+    'logical_equality': lambda first, second: ~(first ^ second) & MASK,
+    'project_second': lambda first, second: second,
+    'material_implication': lambda first, second: (~first | second) & MASK,
+    'project_first': lambda first, second: first,
+    'converse_implication': lambda first, second: (first | ~second) & MASK,
+    'logical_disjunction': lambda first, second: first | second,
+    'tautology': lambda first, second: MASK,
+}
+
+
+def number_of_words(size):
+    return max(1, (1 << size) // WORD)
+
+
+def column(index, size):
+    words = number_of_words(size)
+    if index < len(PATTERNS):
+        return array.array('Q', [PATTERNS[index]]) * words
+
+    block = 1 << (index - len(PATTERNS))
+    return array.array(
+        'Q', [0]*block + [MASK]*block
+    ) * (words // (2*block))
+
+
+def columns(size):
+    return [column(index, size) for index in range(size)]
+
+
+def evaluate(name, first_words, second_words=None):
+    if second_words is None:
+        return array.array('Q', map(UNARY[name], first_words))
+    if len(first_words) != len(second_words):
+        raise ValueError('inputs must be the same length')
+    return array.array(
+        'Q', map(BINARY[name], first_words, second_words)
+    )
+
+
+def evaluate_expression(expression, names, inputs=None):
+    if inputs is None:
+        inputs = dict(zip(names, columns(len(names))))
+    if isinstance(expression, str):
+        return inputs[expression]
+    if isinstance(expression, bool):
+        return array.array(
+            'Q', [MASK if expression else 0]
+        ) * number_of_words(len(names))
+
+    name, *arguments = expression
+    return evaluate(
+        name,
+        *(
+            evaluate_expression(argument, names, inputs)
+            for argument in arguments
+        )
+    )
+
+
+def count(words, size):
+    if size < 6:
+        return (words[0] & ((1 << (1 << size)) - 1)).bit_count()
+    return sum(map(int.bit_count, words))
+
+
+def row(words, index):
+    return bool(words[index // WORD] >> (index % WORD) & 1)
+
+
+def benchmark(size=24):
+    names = [f'x{index}' for index in range(size)]
+    expression = names[0]
+    for index, name in enumerate(names[1:]):
+        operation = ('logical_disjunction', 'exclusive_disjunction')[
+            index % 2
+        ]
+        expression = (operation, expression, name)
+
+    start = time.perf_counter()
+    satisfying = count(evaluate_expression(expression, names), size)
+    return 1 << size, satisfying, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rows, satisfying, duration = benchmark()
+    print(f'{rows:,} rows, {satisfying:,} satisfying in {duration:.2f}s')
@@ -0,0 +1,164 @@
+import keyword
+import src.truth_table_engine
+
+
+RESERVED = {'mask', 'bool'}
+UNARY = {
+    'logical_identity': lambda value, mask: value,
+    'logical_negation': lambda value, mask: mask ^ value,
+}
+
+
+def variables(expression, names=None):
+    if names is None:
+        names = []
+    if isinstance(expression, str):
+        if expression not in names:
+            names.append(expression)
+    elif isinstance(expression, tuple):
+        for argument in expression[1:]:
+            variables(argument, names)
+    return names
+
+
+def check_names(names):
+    for name in names:
+        if (
+            not isinstance(name, str)
+            or not name.isidentifier()
+            or keyword.iskeyword(name)
+            or name in RESERVED
+        ):
+            raise ValueError(f'{name!r} cannot be a variable name')
+    if len(set(names)) != len(names):
+        raise ValueError(f'repeated variable names in {names}')
+    return names
+
+
+def repeat(pattern, period, count):
+    return pattern * (
+        ((1 << period*count) - 1) // ((1 << period) - 1)
+    )
+
+
+def columns(names):
+    rows = 1 << len(names)
+    return {
+        name: repeat(
+            ((1 << (1 << index)) - 1) << (1 << index),
+            2 << index,
+            rows >> (index+1),
+        )
+        for index, name in enumerate(names)
+    }
+
+
+def evaluate(expression, inputs, mask):
+    if isinstance(expression, bool):
+        return mask if expression else 0
+    if isinstance(expression, str):
+        return inputs[expression]
+
+    name, *arguments = expression
+    values = [evaluate(argument, inputs, mask) for argument in arguments]
+    if name in UNARY:
+        return UNARY[name](*values, mask)
+    return src.truth_table_engine.evaluate_packed(
+        name, *values, mask.bit_length()
+    )
+
+
+def truth_table(expression, names):
+    return evaluate(
+        expression, columns(names), (1 << (1 << len(names))) - 1
+    )
+
+
+def full(size):
+    return (1 << (1 << size)) - 1
+
+
+def irredundant_cover(lower, upper, size):
+    if lower == 0:
+        return [], 0
+    if upper == full(size):
+        return [(0, (1 << size) - 1)], full(size)
+
+    size = size - 1
+    bit = 1 << size
+    half = 1 << size
+    lower_0, lower_1 = lower & full(size), lower >> half
+    upper_0, upper_1 = upper & full(size), upper >> half
+
+    cubes_0, covered_0 = irredundant_cover(
+        lower_0 & ~upper_1, upper_0, size
+    )
+    cubes_1, covered_1 = irredundant_cover(
+        lower_1 & ~upper_0, upper_1, size
+    )
+    cubes, covered = irredundant_cover(
+        (lower_0 & ~covered_0) | (lower_1 & ~covered_1),
+        upper_0 & upper_1,
+        size,
+    )
+    return (
+        cubes_0
+      + [(value | bit, dont_care) for value, dont_care in cubes_1]
+      + [(value, dont_care | bit) for value, dont_care in cubes],
+        (covered_0 | covered) | ((covered_1 | covered) << half),
+    )
+
+
+def minimize(expression, names=None):
+    names = check_names(names or variables(expression))
+    table = truth_table(expression, names)
+    cubes, _ = irredundant_cover(table, table, len(names))
+    return names, cubes
+
+
+def literals(implicant, names):
+    value, dont_care = implicant
+    for index, name in enumerate(names):
+        bit = 1 << index
+        if not dont_care & bit:
+            yield name, bool(value & bit)
+
+
+def python_source(names, implicants):
+    terms = []
+    for implicant in implicants:
+        term = [
+            name if value else f'not {name}'
+            for name, value in literals(implicant, names)
+        ]
+        terms.append(' and '.join(term) or 'True')
+    body = ' or '.join(f'({term})' for term in terms) or 'False'
+    return f'def rule({", ".join(names)}):\n    return bool({body})\n'
+
+
+def bitwise_source(names, implicants):
+    terms = []
+    for implicant in implicants:
+        term = [
+            name if value else f'(mask ^ {name})'
+            for name, value in literals(implicant, names)
+        ]
+        terms.append(' & '.join(term) or 'mask')
+    body = ' | '.join(f'({term})' for term in terms) or '0'
+    return f'def rule({", ".join(names)}, mask=1):\n    return {body}\n'
+
+
+def build(source):
+    namespace = {}
+    exec(source, namespace)
+    rule = namespace['rule']
+    rule.source = source
+    return rule
+
+
+def to_python(expression, names=None):
+    return build(python_source(*minimize(expression, names)))
+
+
+def to_bitwise(expression, names=None):
+    return build(bitwise_source(*minimize(expression, names)))
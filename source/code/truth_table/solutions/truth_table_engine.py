@@ -0,0 +1,92 @@
+import src.truth_table
+
+
+NAMES = (
+    'contradiction',
+    'logical_nor',
+    'converse_non_implication',
+    'negate_first',
+    'material_non_implication',
+    'negate_second',
+    'exclusive_disjunction',
+    'logical_nand',
+    'logical_conjunction',
+    'logical_equality',
+    'project_second',
+    'material_implication',
+    'project_first',
+    'converse_implication',
+    'logical_disjunction',
+    'tautology',
+)
+
+
+def compile_table(function):
+    table = 0
+    for first_input in (False, True):
+        for second_input in (False, True):
+            if function(first_input, second_input):
+                table |= 1 << (first_input << 1 | second_input)
+    return table
+
+
+TABLES = {
+    name: compile_table(src.truth_table.__getattribute__(name))
+    for name in NAMES
+}
+RESULTS = {
+    name: tuple(bool(table >> index & 1) for index in range(4))
+    for name, table in TABLES.items()
+}
+
+
+def lookup(name, first_input, second_input):
+    return RESULTS[name][
+        bool(first_input) << 1 | bool(second_input)
+    ]
+
+
+def evaluate_packed(name, first_inputs, second_inputs, width):
+    mask = (1 << width) - 1
+    not_first = ~first_inputs & mask
+    not_second = ~second_inputs & mask
+    minterms = (
+        not_first & not_second,
+        not_first & second_inputs,
+        first_inputs & not_second,
+        first_inputs & second_inputs,
+    )
+
+    table = TABLES[name]
+    result = 0
+    for index, minterm in enumerate(minterms):
+        if table >> index & 1:
+            result |= minterm
+    return result
+
+
+def evaluate(name, first_inputs, second_inputs, width=None):
+    if isinstance(first_inputs, int) and isinstance(second_inputs, int):
+        if width is None:
+            raise ValueError('packed inputs need a width')
+        return evaluate_packed(name, first_inputs, second_inputs, width)
+
+    if len(first_inputs) != len(second_inputs):
+        raise ValueError('inputs must be the same length')
+    results = RESULTS[name]
+    return [
+        results[bool(first_input) << 1 | bool(second_input)]
+        for first_input, second_input in zip(first_inputs, second_inputs)
+    ]
+
+
+def pack(values):
+    packed = 0
+    for index, value in enumerate(values):
+        if value:
+            packed |= 1 << index
+    return packed
+
+
+def unpack(packed, width):
+    return [bool(packed >> index & 1) for index in range(width)]
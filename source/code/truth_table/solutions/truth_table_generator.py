@@ -0,0 +1,63 @@
+import concurrent.futures
+import inspect
+import itertools
+import os
+
+
+def arguments(function):
+    return [
+        name
+        for name, parameter in inspect.signature(function).parameters.items()
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD
+        )
+    ]
+
+
+def inputs(row, size):
+    return tuple(
+        bool(row >> (size-1-index) & 1) for index in range(size)
+    )
+
+
+def truth_table(function, size=None, start=0, stop=None):
+    if size is None:
+        size = len(arguments(function))
+    if stop is None:
+        stop = 1 << size
+    for row in range(start, stop):
+        values = inputs(row, size)
+        yield values, function(*values)
+
+
+def count_rows(function, accept, size, start, stop):
+    return sum(
+        1 for _, result in truth_table(function, size, start, stop)
+        if accept(result)
+    )
+
+
+def count_satisfying(
+        function, accept=bool, size=None,
+        processes=None, chunk_size=1 << 16,
+    ):
+    if size is None:
+        size = len(arguments(function))
+    rows = 1 << size
+    if processes == 1 or rows <= chunk_size:
+        return count_rows(function, accept, size, 0, rows)
+
+    workers = processes or os.cpu_count()
+    chunk_size = max(chunk_size, rows // (workers * 64))
+    starts = range(0, rows, chunk_size)
+    with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+        return sum(
+            executor.map(
+                count_rows,
+                itertools.repeat(function),
+                itertools.repeat(accept),
+                itertools.repeat(size),
+                starts,
+                (min(start+chunk_size, rows) for start in starts),
+            )
+        )
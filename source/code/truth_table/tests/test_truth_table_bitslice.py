@@ -0,0 +1,103 @@
+import itertools
+import src.truth_table
+import src.truth_table_bitslice
+import unittest
+
+
+def evaluate(expression, inputs):
+    if isinstance(expression, bool):
+        return expression
+    if isinstance(expression, str):
+        return inputs[expression]
+    name, *arguments = expression
+    return src.truth_table.__getattribute__(name)(
+        *(evaluate(argument, inputs) for argument in arguments)
+    )
+
+
+class TestTruthTableBitslice(unittest.TestCase):
+
+    def test_columns(self):
+        size = 8
+        columns = src.truth_table_bitslice.columns(size)
+        for index, column in enumerate(columns):
+            self.assertEqual(len(column), 4)
+            for row in range(1 << size):
+                with self.subTest(index=index, row=row):
+                    self.assertEqual(
+                        src.truth_table_bitslice.row(column, row),
+                        bool(row >> index & 1)
+                    )
+
+    def test_binary_operations(self):
+        first, second = src.truth_table_bitslice.columns(7)[:2]
+        for name in src.truth_table_bitslice.BINARY:
+            function = src.truth_table.__getattribute__(name)
+            result = src.truth_table_bitslice.evaluate(name, first, second)
+            for row in range(128):
+                with self.subTest(name=name, row=row):
+                    self.assertEqual(
+                        src.truth_table_bitslice.row(result, row),
+                        bool(function(bool(row & 1), bool(row & 2)))
+                    )
+
+    def test_unary_operations(self):
+        first = src.truth_table_bitslice.column(0, 6)
+        for name in src.truth_table_bitslice.UNARY:
+            function = src.truth_table.__getattribute__(name)
+            result = src.truth_table_bitslice.evaluate(name, first)
+            for row in range(64):
+                with self.subTest(name=name, row=row):
+                    self.assertEqual(
+                        src.truth_table_bitslice.row(result, row),
+                        bool(function(bool(row & 1)))
+                    )
+
+    def test_evaluate_expression(self):
+        expression = (
+            'material_implication',
+            ('exclusive_disjunction', 'a', 'b'),
+            ('logical_nand', ('logical_negation', 'c'), 'd'),
+        )
+        names = ['a', 'b', 'c', 'd']
+        result = src.truth_table_bitslice.evaluate_expression(
+            expression, names
+        )
+
+        satisfying = 0
+        for row, values in enumerate(
+            itertools.product((False, True), repeat=4)
+        ):
+            inputs = dict(zip(names, reversed(values)))
+            with self.subTest(inputs=inputs):
+                self.assertEqual(
+                    src.truth_table_bitslice.row(result, row),
+                    bool(evaluate(expression, inputs))
+                )
+            satisfying += bool(evaluate(expression, inputs))
+
+        self.assertEqual(
+            src.truth_table_bitslice.count(result, 4), satisfying
+        )
+
+    def test_evaluate_raises_value_error_w_different_lengths(self):
+        with self.assertRaises(ValueError):
+            src.truth_table_bitslice.evaluate(
+                'logical_conjunction',
+                src.truth_table_bitslice.column(0, 7),
+                src.truth_table_bitslice.column(1, 8),
+            )
+
+    def test_benchmark(self):
+        self.assertEqual(
+            src.truth_table_bitslice.benchmark(size=10)[:2],
+            (1024, 768)
+        )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# KeyError
+# ValueError
@@ -0,0 +1,150 @@
+import itertools
+import src.truth_table
+import src.truth_table_compiler
+import unittest
+
+
+def evaluate(expression, inputs):
+    if isinstance(expression, bool):
+        return expression
+    if isinstance(expression, str):
+        return inputs[expression]
+    name, *arguments = expression
+    return src.truth_table.__getattribute__(name)(
+        *(evaluate(argument, inputs) for argument in arguments)
+    )
+
+
+RULES = (
+    ('logical_nand', 'a', 'b'),
+    (
+        'logical_disjunction',
+        ('logical_conjunction', 'a', 'b'),
+        ('logical_conjunction', 'a', ('logical_negation', 'b')),
+    ),
+    (
+        'material_implication',
+        ('exclusive_disjunction', 'a', 'b'),
+        ('logical_equality', 'c', ('logical_nor', 'd', 'a')),
+    ),
+    (
+        'logical_conjunction',
+        ('converse_implication', 'a', 'b'),
+        ('logical_nand', ('project_first', 'c', 'd'), 'e'),
+    ),
+    ('contradiction', 'a', 'b'),
+    ('tautology', 'a', 'b'),
+    ('logical_disjunction', 'a', True),
+)
+
+
+class TestTruthTableCompiler(unittest.TestCase):
+
+    def test_variables(self):
+        self.assertEqual(
+            src.truth_table_compiler.variables(RULES[2]),
+            ['a', 'b', 'c', 'd']
+        )
+
+    def test_python_rules(self):
+        for expression in RULES:
+            names = src.truth_table_compiler.variables(expression)
+            rule = src.truth_table_compiler.to_python(expression)
+            for values in itertools.product(
+                (True, False), repeat=len(names)
+            ):
+                with self.subTest(expression=expression, values=values):
+                    self.assertEqual(
+                        rule(*values),
+                        bool(evaluate(expression, dict(zip(names, values))))
+                    )
+
+    def test_bitwise_rules(self):
+        for expression in RULES:
+            names = src.truth_table_compiler.variables(expression)
+            rule = src.truth_table_compiler.to_bitwise(expression)
+            for values in itertools.product((1, 0), repeat=len(names)):
+                with self.subTest(expression=expression, values=values):
+                    self.assertEqual(
+                        rule(*values),
+                        evaluate(expression, dict(zip(names, values))) & 1
+                    )
+
+    def test_bitwise_rules_over_packed_columns(self):
+        expression = RULES[3]
+        names = src.truth_table_compiler.variables(expression)
+        columns = src.truth_table_compiler.columns(names)
+        rule = src.truth_table_compiler.to_bitwise(expression)
+        self.assertEqual(
+            rule(*(columns[name] for name in names), mask=2**32-1),
+            src.truth_table_compiler.truth_table(expression, names)
+        )
+
+    def test_minimized_source(self):
+        self.assertEqual(
+            src.truth_table_compiler.to_python(RULES[1]).source,
+            'def rule(a, b):\n    return bool((a))\n'
+        )
+        self.assertEqual(
+            src.truth_table_compiler.to_python(RULES[0]).source,
+            'def rule(a, b):\n    return bool((not b) or (not a))\n'
+        )
+        self.assertEqual(
+            src.truth_table_compiler.to_bitwise(RULES[0]).source,
+            (
+                'def rule(a, b, mask=1):\n'
+                '    return ((mask ^ b)) | ((mask ^ a))\n'
+            )
+        )
+        self.assertEqual(
+            src.truth_table_compiler.to_python(RULES[4]).source,
+            'def rule(a, b):\n    return bool(False)\n'
+        )
+        self.assertEqual(
+            src.truth_table_compiler.to_bitwise(RULES[5]).source,
+            'def rule(a, b, mask=1):\n    return (mask)\n'
+        )
+
+    def test_twenty_variable_rule(self):
+        names = [f'x{index}' for index in range(20)]
+        expression = names[0]
+        for name in names[1:]:
+            expression = ('logical_disjunction', expression, name)
+
+        rule = src.truth_table_compiler.to_bitwise(expression)
+        self.assertEqual(rule.source.count('|'), 19)
+        self.assertEqual(rule(*[0]*20), 0)
+        self.assertEqual(rule(*[0]*19, 1), 1)
+
+    def test_bad_variable_names(self):
+        for expression, names in (
+            (('logical_conjunction', 'a', 'mask'), None),
+            (('logical_conjunction', 'a', 'bool'), None),
+            (('logical_disjunction', 'a', 'import'), None),
+            (('logical_disjunction', 'a', 'b); import os; (c'), None),
+            (('logical_negation', '1a'), None),
+            (('logical_conjunction', 'a', 'b'), ['a', 'b', 'a']),
+        ):
+            for function in (
+                src.truth_table_compiler.to_python,
+                src.truth_table_compiler.to_bitwise,
+            ):
+                with self.subTest(
+                    function=function.__name__,
+                    expression=expression,
+                    names=names,
+                ):
+                    with self.assertRaises(ValueError):
+                        function(expression, names)
+
+    def test_unknown_operation(self):
+        with self.assertRaises(KeyError):
+            src.truth_table_compiler.to_python(('logical_maybe', 'a', 'b'))
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# KeyError
+# ValueError
@@ -0,0 +1,127 @@
+import random
+import src.truth_table
+import src.truth_table_engine
+import unittest
+
+
+CASE_1 = True, True
+CASE_2 = True, False
+CASE_3 = False, True
+CASE_4 = False, False
+
+
+def random_booleans(size=100):
+    return [random.choice((True, False)) for _ in range(size)]
+
+
+class TestTruthTableEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.first_inputs = random_booleans()
+        self.second_inputs = random_booleans()
+
+    def test_tables(self):
+        self.assertEqual(
+            list(src.truth_table_engine.TABLES.values()),
+            list(range(16))
+        )
+        self.assertEqual(
+            src.truth_table_engine.TABLES['logical_conjunction'],
+            0b1000
+        )
+        self.assertEqual(
+            src.truth_table_engine.TABLES['exclusive_disjunction'],
+            0b0110
+        )
+
+    def test_lookup(self):
+        for name in src.truth_table_engine.NAMES:
+            function = src.truth_table.__getattribute__(name)
+            for case in (CASE_1, CASE_2, CASE_3, CASE_4):
+                with self.subTest(name=name, case=case):
+                    self.assertEqual(
+                        src.truth_table_engine.lookup(name, *case),
+                        bool(function(*case))
+                    )
+
+    def test_evaluate_lists(self):
+        for name in src.truth_table_engine.NAMES:
+            function = src.truth_table.__getattribute__(name)
+            with self.subTest(name=name):
+                self.assertEqual(
+                    src.truth_table_engine.evaluate(
+                        name, self.first_inputs, self.second_inputs
+                    ),
+                    [
+                        bool(function(first_input, second_input))
+                        for first_input, second_input in zip(
+                            self.first_inputs, self.second_inputs
+                        )
+                    ]
+                )
+
+    def test_evaluate_packed(self):
+        width = len(self.first_inputs)
+        first_inputs = src.truth_table_engine.pack(self.first_inputs)
+        second_inputs = src.truth_table_engine.pack(self.second_inputs)
+
+        for name in src.truth_table_engine.NAMES:
+            with self.subTest(name=name):
+                reality = src.truth_table_engine.evaluate(
+                    name, first_inputs, second_inputs, width
+                )
+                self.assertEqual(
+                    src.truth_table_engine.unpack(reality, width),
+                    src.truth_table_engine.evaluate(
+                        name, self.first_inputs, self.second_inputs
+                    )
+                )
+
+    def test_evaluate_packed_raises_value_error_without_width(self):
+        with self.assertRaises(ValueError):
+            src.truth_table_engine.evaluate(
+                'logical_nand', 0b1100, 0b1010
+            )
+
+    def test_evaluate_packed_keeps_rows_above_the_highest_set_bit(self):
+        packed = src.truth_table_engine.pack([True, False, False, False])
+        for name, my_expectation in (
+            ('logical_nor', [False, True, True, True]),
+            ('logical_nand', [False, True, True, True]),
+            ('logical_equality', [True, True, True, True]),
+            ('tautology', [True, True, True, True]),
+        ):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    src.truth_table_engine.unpack(
+                        src.truth_table_engine.evaluate(
+                            name, packed, packed, 4
+                        ),
+                        4
+                    ),
+                    my_expectation
+                )
+
+    def test_pack_and_unpack(self):
+        self.assertEqual(
+            src.truth_table_engine.pack([True, False, True, True]),
+            0b1101
+        )
+        self.assertEqual(
+            src.truth_table_engine.unpack(0b1101, 4),
+            [True, False, True, True]
+        )
+
+    def test_evaluate_raises_value_error_w_different_lengths(self):
+        with self.assertRaises(ValueError):
+            src.truth_table_engine.evaluate(
+                'logical_conjunction',
+                self.first_inputs, self.second_inputs[1:]
+            )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# ValueError
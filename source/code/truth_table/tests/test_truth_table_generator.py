@@ -0,0 +1,101 @@
+import functools
+import itertools
+import operator
+import src.truth_table
+import src.truth_table_generator
+import unittest
+
+
+def majority(first, second, third):
+    return (first + second + third) >= 2
+
+
+def vote(*ballots):
+    return sum(ballots) > len(ballots) // 2
+
+
+def allowed(first, second, third=False):
+    if first and second:
+        return 'ALLOWED'
+    return 'DENIED'
+
+
+class TestTruthTableGenerator(unittest.TestCase):
+
+    def test_arguments(self):
+        self.assertEqual(
+            src.truth_table_generator.arguments(allowed),
+            ['first', 'second', 'third']
+        )
+
+    def test_truth_table(self):
+        self.assertEqual(
+            list(
+                src.truth_table_generator.truth_table(
+                    src.truth_table.logical_conjunction
+                )
+            ),
+            [
+                ((False, False), False),
+                ((False, True), False),
+                ((True, False), False),
+                ((True, True), True),
+            ]
+        )
+
+    def test_truth_table_is_lazy(self):
+        table = src.truth_table_generator.truth_table(vote, size=64)
+        self.assertEqual(
+            list(itertools.islice(table, 2)),
+            [
+                ((False,) * 64, False),
+                ((False,) * 63 + (True,), False),
+            ]
+        )
+
+    def test_count_satisfying(self):
+        for name, my_expectation in (
+            ('contradiction', 0),
+            ('logical_conjunction', 1),
+            ('exclusive_disjunction', 2),
+            ('logical_nand', 3),
+            ('tautology', 4),
+        ):
+            with self.subTest(name=name):
+                self.assertEqual(
+                    src.truth_table_generator.count_satisfying(
+                        src.truth_table.__getattribute__(name)
+                    ),
+                    my_expectation
+                )
+        self.assertEqual(
+            src.truth_table_generator.count_satisfying(majority), 4
+        )
+
+    def test_count_satisfying_w_accept(self):
+        self.assertEqual(
+            src.truth_table_generator.count_satisfying(
+                allowed,
+                accept=functools.partial(operator.eq, 'ALLOWED'),
+            ),
+            2
+        )
+
+    def test_count_satisfying_in_parallel(self):
+        for processes in (1, 2):
+            with self.subTest(processes=processes):
+                self.assertEqual(
+                    src.truth_table_generator.count_satisfying(
+                        vote, size=15,
+                        processes=processes, chunk_size=1000,
+                    ),
+                    2**14
+                )
+
+
+# Exceptions seen
+# AssertionError
+# ModuleNotFoundError
+# AttributeError
+# TypeError
+# PicklingError